@@ -0,0 +1,37 @@
+import asyncio
+from typing import Optional
+from playwright.async_api import Locator
+from models.async_api.utilities.helper_methods import extract_price_info, extract_rating_info
+from models.page_components.card_container import CardContainer as SyncCardContainer, best_card_in_list
+
+class CardContainer(SyncCardContainer):
+    """
+    The async counterpart of models.page_components.card_container.CardContainer.
+    Reading a card requires awaiting, so instances are built through 'await CardContainer.create(...)'.
+    The comparators and best_card_in_list are shared with the sync version.
+    """
+
+    def __init__(self, locator: Locator, info: dict):
+        super().__init__(locator, info)
+
+    @classmethod
+    async def create(cls, locator: Locator, info: Optional[dict] = None) -> "CardContainer":
+        """
+        Builds a card container, reading its data from the locator unless a pre-extracted record is given.
+        :param locator: The locator pointing to the card container.
+        :param info: An optional pre-extracted record (see extract_cards_info).
+        :return: The card container.
+        """
+        if info is None:
+            # The price, rating and url reads are independent of each other, so they run concurrently.
+            anchor = locator.locator('a').first
+            price, (rating, review_amount), _ = await asyncio.gather(
+                extract_price_info(locator),
+                extract_rating_info(locator),
+                anchor.wait_for(state='visible')
+            )
+            info = {"price": price, "rating": rating, "review_amount": review_amount, "url": await anchor.get_attribute("href")}
+        return cls(locator, info)
+
+    async def click(self):
+        await self.container.click()
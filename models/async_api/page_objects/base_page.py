@@ -0,0 +1,9 @@
+from playwright.async_api import Page
+
+class BasePage:
+    def __init__(self, page: Page, url : str):
+        self.page = page
+        self.url = url
+
+    async def goto_self(self):
+        await self.page.goto(self.url)
@@ -0,0 +1,53 @@
+from datetime import date
+from playwright.async_api import Page
+from models.async_api.page_objects.base_page import BasePage
+from models.async_api.page_components.search_bar import SearchBar
+from models.utilities.helper_methods import build_search_url
+
+# How search_preferences reaches the results: through the search bar, or by loading the results' url directly.
+SEARCH_THROUGH_UI  = "ui"
+SEARCH_THROUGH_URL = "url"
+
+class MainPage(BasePage):
+    def __init__(self, page: Page, url: str):
+        super().__init__(page, url)
+        self.search_bar = SearchBar(page)
+
+    async def search_preferences(
+            self,
+            destination : str,
+            start_date : date,
+            end_date : date,
+            num_of_adults : int = 0,
+            num_of_children : int = 0,
+            num_of_infants : int = 0,
+            num_of_pets : int = 0,
+            mode : str = SEARCH_THROUGH_UI
+    ):
+        """
+        A method that takes in expected data and inputs it within the search bar.
+        With mode=SEARCH_THROUGH_URL, the results page is loaded directly instead, in a single navigation -
+        for tests that need a result set rather than the search bar itself.
+        :param destination: The expected destination.
+        :param start_date: The expected check-in date.
+        :param end_date: The expected check-out date.
+        :param num_of_adults: The expected number of adults.
+        :param num_of_children: The expected number of children.
+        :param num_of_infants: The expected number of infants.
+        :param num_of_pets: The expected number of pets.
+        :param mode: SEARCH_THROUGH_UI or SEARCH_THROUGH_URL.
+        :return: None
+        """
+        if mode == SEARCH_THROUGH_URL:
+            await self.page.goto(build_search_url(
+                self.page.url, destination, start_date, end_date, num_of_adults, num_of_children, num_of_infants, num_of_pets
+            ))
+            return
+        if mode != SEARCH_THROUGH_UI:
+            raise ValueError(f"Invalid search mode: {mode}")
+
+        await self.search_bar.input_destination(destination)
+        await self.search_bar.choose_dates(start_date, end_date)
+        await self.search_bar.guests_num_entry_button.click()
+        await self.search_bar.choose_guests_num(num_of_adults, num_of_children, num_of_infants, num_of_pets)
+        await self.search_bar.search()
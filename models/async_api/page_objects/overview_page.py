@@ -0,0 +1,107 @@
+import asyncio
+from playwright.async_api import Page
+from models.async_api.page_objects.base_page import BasePage
+from models.async_api.utilities.helper_methods import read_stepper_values
+from models.utilities.helper_methods import remove_non_alphanumeric
+
+
+class OverviewPage(BasePage):
+    """
+    The async counterpart of models.page_objects.overview_page.OverviewPage.
+    Registering the translation-popup handler requires awaiting, so instances are built through 'await OverviewPage.create(...)'.
+    """
+
+    def __init__(self, page: Page, url: str):
+        super().__init__(page, url)
+
+        self.check_in_locator = self.page.get_by_test_id("change-dates-checkIn")
+        self.check_out_locator = self.page.get_by_test_id("change-dates-checkOut")
+
+        self.guests_open_button = self.page.locator('[aria-labelledby="guests-label GuestPicker-book_it-trigger"]')
+        self.guests_close_button = self.page.locator('[aria-labelledby="GuestPicker-book_it-form"]').get_by_role("button", name="Close")
+        self.guests_info_locators = {
+            "adults": self.page.get_by_test_id("GuestPicker-book_it-form-adults-stepper-value"),
+            "children": self.page.get_by_test_id("GuestPicker-book_it-form-children-stepper-value"),
+            "infants": self.page.get_by_test_id("GuestPicker-book_it-form-infants-stepper-value"),
+            "pets": self.page.get_by_test_id("GuestPicker-book_it-form-pets-stepper-value")
+        }
+
+        self.price_locator = self.page.locator('[class="_j1kt73"]').last
+
+        self.reserve_button = self.page.get_by_test_id("homes-pdp-cta-btn").last
+
+    @classmethod
+    async def create(cls, page: Page, url: str) -> "OverviewPage":
+        overview_page = cls(page, url)
+
+        # Handles popup in case it happens. Playwright waits for the popup to be hidden once the handler returns.
+        await page.add_locator_handler(page.locator('[aria-label="Translation on"]'),
+                                       lambda : page.keyboard.press("Escape"))
+        return overview_page
+
+    async def get_all_details(self) -> tuple[str, str, dict[str, int], int]:
+        """
+        Extracts all desired details from the overview page.
+        The dates and price are read while the guest picker is being opened and read.
+        :return: A tuple containing (check_in_date, check_out_date, guests, price)
+        """
+        check_in, check_out, guests, price = await asyncio.gather(
+            self.get_check_in_date(),
+            self.get_check_out_date(),
+            self.get_guests_info(),
+            self.get_price()
+        )
+        return check_in, check_out, guests, price
+
+    async def get_check_in_date(self) -> str:
+        """
+        Extracts the offer's check-in date.
+        :return: The check-in date
+        """
+        await self.check_in_locator.wait_for(state="visible", timeout=3000)
+        return await self.check_in_locator.inner_text()
+
+    async def get_check_out_date(self) -> str:
+        """
+        Extracts the offer's check-out date.
+        :return: The check-out date
+        """
+        await self.check_in_locator.wait_for(state="visible", timeout=3000)
+        return await self.check_out_locator.inner_text()
+
+    async def get_guests_info(self) -> dict[str, int]:
+        """
+        Extracts the guests stepper counters.
+        :return: A dictionary [containing guest_type (str) : stepper_counter_value (int)]
+        """
+        await self.guests_open_button.click()
+        guests = await read_stepper_values(self.guests_info_locators)
+        await self.guests_close_button.click()
+        return guests
+
+    async def get_price(self) -> int:
+        """
+        Extracts the price of the offer from the page.
+        :return: The price, rounded.
+        """
+        return int(remove_non_alphanumeric(await self.price_locator.inner_text()))
+
+    async def print_details(self):
+        """
+        Prints the offer's details.
+        :return: None
+        """
+        check_in, check_out, guests, price = await self.get_all_details()
+        print("Deal details:")
+        print("Check in: " + check_in)
+        print("Check out: " + check_out)
+        for key, val in guests.items():
+            print(f"{key}: {str(val)}")
+        print("Price: " + str(price))
+
+    async def click_reserve(self) -> None:
+        """
+        Clicks the reserve button.
+        :return: None
+        """
+        await self.reserve_button.click()
@@ -0,0 +1,74 @@
+import asyncio
+from playwright.async_api import Page
+from models.async_api.page_objects.base_page import BasePage
+from models.utilities.dial_prefix_cache import DIAL_OPTIONS_SCRIPT, DIAL_OPTION_TEXT_SCRIPT, dial_prefix_cache
+
+class ReservationPage(BasePage):
+    def __init__(self, page: Page, url: str):
+        super().__init__(page, url)
+        self.general_edit_panel_close = self.page.locator('[aria-label="Close"]').last
+        self.selected_check_in_locator = self.page.locator(f'[{"aria-label"}*="{"Selected"}"]').first
+        self.selected_check_out_locator = self.page.locator(f'[{"aria-label"}*="{"Selected"}"]').last
+        self.continue_button = self.page.locator('button:has(span[data-button-content="true"]:has-text("Continue"))').first
+        self.number_prefix_selector = self.page.get_by_test_id("login-signup-countrycode")
+        self.phone_input = self.page.get_by_test_id("login-signup-phonenumber")
+
+    async def get_all_details(self) -> tuple[str, str, dict[str, int], int]:
+        """
+        Extracts all desired details from the reservation page.
+        The edit panels are opened one after another, while the price is read alongside them.
+        :return: A tuple containing (check_in_date, check_out_date, guests, price)
+        """
+        async def read_panels() -> tuple[tuple[str, str], dict[str, int]]:
+            return await self.get_reservation_dates(), await self.get_guests_info()
+
+        ((check_in_date, check_out_date), guests), price = await asyncio.gather(read_panels(), self.get_price())
+        return check_in_date, check_out_date, guests, price
+
+    async def select_dial_prefix(self, prefix: int) -> None:
+        """
+        Selects the desired country-dial according to the entered prefix.
+        :param prefix: the country code, without '+' sign.
+        :return: None
+        """
+        # The prefix's option value is looked up in the process-wide cache, after checking it still matches the selector.
+        value = dial_prefix_cache.get(prefix)
+        if value is None or not dial_prefix_cache.is_valid_option(
+                await self.number_prefix_selector.evaluate(DIAL_OPTION_TEXT_SCRIPT, value), prefix):
+            # Otherwise, the cache is rebuilt from all the selector's options, read in a single call.
+            dial_prefix_cache.rebuild(await self.number_prefix_selector.evaluate(DIAL_OPTIONS_SCRIPT))
+            value = dial_prefix_cache.get(prefix)
+
+        if value is not None:
+            await self.number_prefix_selector.select_option(value=value)
+            return
+
+        raise ValueError(f"No option found containing '{prefix}'")
+
+    async def input_phone_number(self, prefix: int, number: int) -> None:
+        """
+        Inputs the phone number of the reservation.
+        :return: None
+        """
+        await self.select_dial_prefix(prefix)
+        await self.phone_input.fill(str(number))
+
+    async def print_details(self) -> None:
+        """
+        Prints the reservation's details.
+        :return: None
+        """
+        check_in_date, check_out_date, guests, price = await self.get_all_details()
+        print("Deal details:")
+        print(f"Check in: {check_in_date}")
+        print(f"Check out: {check_out_date}")
+        for key, val in guests.items():
+            print(f"{key}: {val}")
+        print(f"Price: {price}")
+
+    # Abstract Methods to be implemented by child classes:
+    async def get_reservation_dates(self) -> tuple[str, str]: ...
+
+    async def get_guests_info(self) -> dict[str, int]: ...
+
+    async def get_price(self) -> int: ...
@@ -0,0 +1,69 @@
+from functools import reduce
+from typing import Callable, Type
+from playwright.async_api import Locator, Page
+from models.async_api.page_objects.reservation_page.reservation_page_a import ReservationPageTypeA
+from models.async_api.page_objects.reservation_page.reservation_page_b import ReservationPageTypeB
+from models.async_api.page_objects.reservation_page.reservation_page import ReservationPage  # optional, for typing
+from models.async_api.utilities.readiness import wait_for_visible
+from models.page_objects.reservation_page.reservation_page_factory import (
+    RESERVATION_PAGE_VARIANTS as SYNC_RESERVATION_PAGE_VARIANTS,
+    detected_variants,
+    get_listing_id,
+)
+
+# The async classes of the known checkout variants: [variant_name (str) : (page_class, marker)].
+# Variants are detected with the same markers as the sync ones, and the per-listing memo (detected_variants)
+# is shared with the sync factory - so every async variant must be registered in the sync factory too.
+RESERVATION_PAGE_VARIANTS: dict[str, tuple[Type[ReservationPage], Callable[[Page], Locator]]] = {}
+
+def register_reservation_page_variant(name: str, page_class: Type[ReservationPage]) -> None:
+    """
+    Registers the async class of a checkout variant already registered in the sync factory, reusing its marker.
+    :param name: The variant's name.
+    :param page_class: The async ReservationPage subclass handling the variant.
+    :return: None
+    """
+    if name not in SYNC_RESERVATION_PAGE_VARIANTS:
+        raise KeyError(f"Checkout variant '{name}' isn't registered in the sync reservation page factory")
+    RESERVATION_PAGE_VARIANTS[name] = (page_class, SYNC_RESERVATION_PAGE_VARIANTS[name][1])
+
+register_reservation_page_variant("A", ReservationPageTypeA)
+register_reservation_page_variant("B", ReservationPageTypeB)
+
+def get_variant(name: str) -> tuple[Type[ReservationPage], Callable[[Page], Locator]]:
+    """
+    :param name: The variant's name.
+    :return: The variant's async class and marker.
+    """
+    if name not in RESERVATION_PAGE_VARIANTS:
+        raise KeyError(f"Checkout variant '{name}' has no async page class (see register_reservation_page_variant)")
+    return RESERVATION_PAGE_VARIANTS[name]
+
+async def detect_reservation_page_variant(page: Page, timeout: int = 10000) -> str:
+    """
+    Waits for the marker of any registered variant to be visible - all at once - and returns the first visible one.
+    :param page: The checkout page.
+    :param timeout: The maximal time to wait, in milliseconds.
+    :return: The variant's name.
+    """
+    markers = {name: marker(page) for name, (_, marker) in RESERVATION_PAGE_VARIANTS.items()}
+    await wait_for_visible(reduce(Locator.or_, markers.values()).first, "reservation page variant", timeout)
+
+    for name, marker_locator in markers.items():
+        if await marker_locator.first.is_visible():
+            return name
+    raise RuntimeError("The visible reservation page marker disappeared before its variant was detected")
+
+async def create_reservation_page(page: Page, url: str, timeout: int = 10000) -> ReservationPage:
+    listing_id = get_listing_id(url)
+    variant = detected_variants.get(listing_id)
+    if variant is None:
+        variant = await detect_reservation_page_variant(page, timeout)
+        if listing_id is not None:
+            detected_variants[listing_id] = variant
+    else:
+        # The listing's variant was already detected, so only its own marker is waited for.
+        await wait_for_visible(get_variant(variant)[1](page).first, "reservation page variant", timeout)
+
+    page_class, _ = get_variant(variant)
+    return page_class(page, url)
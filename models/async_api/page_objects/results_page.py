@@ -0,0 +1,212 @@
+import asyncio
+from datetime import date
+from typing import Callable, Dict, List, Tuple
+
+from playwright.async_api import Page
+from models.async_api.page_objects.base_page import BasePage
+from models.async_api.page_components.card_container import CardContainer
+from models.async_api.page_components.search_bar import SearchBar
+from models.async_api.utilities.helper_methods import extract_cards_info
+from models.async_api.utilities.readiness import run_and_wait_for_replacement, wait_for_hidden, wait_for_visible
+from models.page_objects.results_page import (
+    ResultsPage as SyncResultsPage,
+    RANKING_OBJECTIVES,
+    HIGHEST_RATED,
+    LOWEST_PRICED,
+    BEST_VALUE,
+)
+
+class ResultsPage(BasePage):
+    def __init__(self, page: Page, url: str):
+        super().__init__(page, url)
+        self.locator    = page.get_by_test_id("card-container")
+        self.search_bar = SearchBar(page)
+        self.first_url  = page.url
+        self.next_page_button = page.get_by_role("link", name="Next")
+        self.pagination_links = page.locator('nav[aria-label*="pagination" i] a[href]')
+
+    async def assert_preferences(
+            self,
+            destination: str,
+            start_date: date,
+            end_date: date,
+            num_of_adults: int = 0,
+            num_of_children: int = 0,
+            num_of_infants: int = 0,
+            num_of_pets: int = 0
+    ):
+        """
+        A method that takes in expected data and asserts their match within the search bar.
+        :param destination: The expected destination.
+        :param start_date: The expected check-in date.
+        :param end_date: The expected check-out date.
+        :param num_of_adults: The expected number of adults.
+        :param num_of_children: The expected number of children.
+        :param num_of_infants: The expected number of infants.
+        :param num_of_pets: The expected number of pets.
+        :return: None
+        """
+        await self.search_bar.little_search_bar_open_button.first.click()
+        await self.search_bar.assert_destination(destination)
+        await self.search_bar.check_in_button.first.click()
+        await self.search_bar.assert_dates(start_date, end_date)
+        await self.search_bar.guests_num_assert_button.first.click()
+        await self.search_bar.assert_guests_num(num_of_adults, num_of_children, num_of_infants, num_of_pets)
+        await self.page.keyboard.press("Escape")
+        await wait_for_hidden(self.search_bar.guests_steppers.first, "search bar closed")
+
+    async def goto_first_page(self):
+        await self.page.goto(self.first_url)
+
+    async def get_card_containers(self, bulk : bool = True) -> List[CardContainer]:
+        """
+        Builds a CardContainer for every card on the current results page.
+        :param bulk: If True, all cards' data is read in a single evaluation (see extract_cards_info).
+                     Otherwise, all cards are probed concurrently through their own locators.
+        :return: The list of card containers, in page order.
+        """
+        if not bulk:
+            return list(await asyncio.gather(*(CardContainer.create(locator) for locator in await self.locator.all())))
+
+        # The cards' locators are derived from the same evaluation their data comes from, so the two can't disagree.
+        cards_info = await extract_cards_info(self.locator)
+        return [CardContainer(self.locator.nth(index), info) for index, info in enumerate(cards_info)]
+
+    async def extract_highest_rated_card(self, print_result : bool, bulk : bool = True) -> str:
+        return await self.extract_best_card(RANKING_OBJECTIVES[HIGHEST_RATED], print_result, bulk)
+
+    async def extract_lowest_priced_card(self, print_result : bool, bulk : bool = True) -> str:
+        return await self.extract_best_card(RANKING_OBJECTIVES[LOWEST_PRICED], print_result, bulk)
+
+    async def extract_best_card(
+            self,
+            is_better: Callable[[CardContainer, CardContainer], bool],
+            print_result : bool,
+            bulk : bool = True
+    ) -> str:
+        """
+        Traverses paginated results and returns the URL of the best card according to the provided comparator.
+        :param is_better: The comparator method.
+        :param print_result: A parameter to toggle printing the result of the method.
+        :param bulk: A parameter to toggle reading each page's cards in a single evaluation.
+        :return: The best card's page url.
+        """
+        return (await self.extract_best_cards({"best": is_better}, print_result, bulk))["best"]
+
+    async def extract_best_cards(
+            self,
+            objectives: Dict[str, Callable[[CardContainer, CardContainer], bool]],
+            print_result : bool,
+            bulk : bool = True
+    ) -> Dict[str, str]:
+        """
+        Traverses paginated results once and returns the URL of the best card for every given objective.
+        :param objectives: A dictionary of [objective_name (str) : comparator method].
+        :param print_result: A parameter to toggle printing the result of the method.
+        :param bulk: A parameter to toggle reading each page's cards in a single evaluation.
+        :return: A dictionary of [objective_name (str) : best card's url (str)].
+        """
+        best = await self.find_best_cards(objectives, bulk)
+
+        # Lastly, go back to the first page and return the results
+        await self.goto_first_page()
+        return SyncResultsPage.report_best_cards(best, print_result)
+
+    async def find_best_cards(
+            self,
+            objectives: Dict[str, Callable[[CardContainer, CardContainer], bool]],
+            bulk : bool = True
+    ) -> Dict[str, Tuple[CardContainer, int, int]]:
+        """
+        Traverses paginated results once, from the current page onwards, and finds the best card for every given objective.
+        The traversal ends on the last page.
+        :param objectives: A dictionary of [objective_name (str) : comparator method].
+        :param bulk: A parameter to toggle reading each page's cards in a single evaluation.
+        :return: A dictionary of [objective_name (str) : (best_card, best_page_index, best_card_index)].
+        """
+        # For every objective we keep: (best_card, best_page_index, best_card_index)
+        best = {name: (None, -1, -1) for name in objectives}
+        page_count = 0
+
+        while True:
+            await self.wait_for_cards()
+
+            # Get all visible cards and update the overall best cards with the current page's best cards.
+            card_containers = await self.get_card_containers(bulk)
+            SyncResultsPage.update_best_cards(best, objectives, card_containers, page_count)
+
+            # If we can move to the next page, we do so.
+            # Otherwise, we break the loop.
+            is_visible, is_disabled = await asyncio.gather(self.next_page_button.is_visible(), self.next_page_button.is_disabled())
+            if not is_visible or is_disabled:
+                break
+            await run_and_wait_for_replacement(self.locator, self.next_page_button.click)
+            page_count += 1
+
+        return best
+
+    async def extract_best_cards_concurrently(
+            self,
+            objectives: Dict[str, Callable[[CardContainer, CardContainer], bool]],
+            print_result : bool,
+            max_tabs : int = 4
+    ) -> Dict[str, str]:
+        """
+        Same as extract_best_cards, but loads the result pages found in the pagination bar concurrently,
+        with at most max_tabs tabs of this page's context open at the same time.
+        :param objectives: A dictionary of [objective_name (str) : comparator method].
+        :param print_result: A parameter to toggle printing the result of the method.
+        :param max_tabs: The maximal number of result pages loading at the same time.
+        :return: A dictionary of [objective_name (str) : best card's url (str)].
+        """
+        if max_tabs < 1:
+            raise ValueError(f"Invalid tabs amount: {max_tabs}")
+
+        # The first page is already loaded in our own page, so we read it directly.
+        await self.wait_for_cards()
+        page_winners = {name: [] for name in objectives}
+        SyncResultsPage.collect_page_winners(page_winners, objectives, await self.get_card_containers(), page_index=0)
+        # Pages are told apart by their number rather than their url (see the sync extract_best_cards_concurrently).
+        seen_pages = {1}
+        tabs_limit = asyncio.Semaphore(max_tabs)
+
+        async def read_page(page_number: int, url: str) -> List[Tuple[int, str]]:
+            async with tabs_limit:
+                tab = await self.page.context.new_page()
+                try:
+                    await tab.goto(url)
+                    tab_results = ResultsPage(tab, url)
+                    await tab_results.wait_for_cards()
+                    cards = await tab_results.get_card_containers()
+                    SyncResultsPage.collect_page_winners(page_winners, objectives, cards, page_number - 1)
+                    return await tab_results.get_pagination_links()
+                finally:
+                    await tab.close()
+
+        # Every read page may reveal further pages, which are read in the next round.
+        pending = await self.get_pagination_links()
+        while pending := list({page_number: (page_number, url) for page_number, url in pending
+                               if page_number not in seen_pages}.values()):
+            seen_pages.update(page_number for page_number, _ in pending)
+            revealed = await asyncio.gather(*(read_page(page_number, url) for page_number, url in pending))
+            pending = [link for links in revealed for link in links]
+
+        return SyncResultsPage.report_best_cards(SyncResultsPage.merge_page_winners(page_winners, objectives), print_result)
+
+    async def wait_for_cards(self) -> None:
+        """
+        Waits for the first and last card containers of the current page to be visible.
+        :return: None
+        """
+        await asyncio.gather(
+            wait_for_visible(self.locator.first, "results grid"),
+            wait_for_visible(self.locator.last, "results grid")
+        )
+
+    async def get_pagination_links(self) -> List[Tuple[int, str]]:
+        """
+        Reads the numbered page links currently shown in the pagination bar.
+        :return: A list of (page_number, absolute_url) tuples.
+        """
+        links = await self.pagination_links.evaluate_all("links => links.map(link => [link.textContent.trim(), link.href])")
+        return [(int(text), url) for text, url in links if text.isdigit()]
@@ -0,0 +1,199 @@
+import asyncio
+import time
+from datetime import date
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from playwright.async_api import Browser, Page, async_playwright
+from models.async_api.page_objects.main_page import MainPage, SEARCH_THROUGH_URL
+from models.async_api.page_objects.results_page import ResultsPage
+from models.page_components.card_container import CardRecord, ListingCard, best_card_in_list
+from models.page_objects.results_page import WEBSITE_PREFIX
+from models.utilities.helper_methods import build_search_url
+
+# Runs many searches at once, each in its own browser context, and compares their winners.
+
+# The page every search starts from (its origin and locale are kept by direct-url searches).
+START_URL = "https://www.airbnb.com/homes?locale=en"
+
+
+class SearchSpec(NamedTuple):
+    destination: str
+    start_date: date
+    end_date: date
+    adults: int = 0
+    children: int = 0
+    infants: int = 0
+    pets: int = 0
+
+    @property
+    def search_id(self) -> str:
+        return f"{self.destination} {self.start_date}..{self.end_date} " \
+               f"({self.adults}/{self.children}/{self.infants}/{self.pets})"
+
+
+class SearchOutcome(NamedTuple):
+    spec: SearchSpec
+    winners: Optional[Dict[str, ListingCard]]   # [objective_name (str) : best card], None if the search failed.
+    error: Optional[str]
+    duration: float
+
+
+class SearchReport:
+    """
+    The outcomes of a batch of searches, in the order the searches were given.
+    """
+
+    def __init__(self, outcomes: List[SearchOutcome], objectives: Dict[str, Callable[[CardRecord, CardRecord], bool]]):
+        self.outcomes = outcomes
+        self.objectives = objectives
+
+    @property
+    def failures(self) -> List[SearchOutcome]:
+        return [outcome for outcome in self.outcomes if outcome.winners is None]
+
+    def overall_winners(self) -> Dict[str, Tuple[SearchSpec, ListingCard]]:
+        """
+        Compares the winners of every successful search.
+        :return: A dictionary of [objective_name (str) : (winning search, its best card)].
+        """
+        succeeded = [outcome for outcome in self.outcomes if outcome.winners is not None]
+        if not succeeded:
+            return {}
+        overall = {}
+        for name, is_better in self.objectives.items():
+            cards = [outcome.winners[name] for outcome in succeeded]
+            best_index = best_card_in_list(cards, is_better)
+            overall[name] = (succeeded[best_index].spec, cards[best_index])
+        return overall
+
+    def print_report(self) -> None:
+        for outcome in self.outcomes:
+            print(f"\n{outcome.spec.search_id} - {outcome.duration:.1f}s")
+            if outcome.winners is None:
+                print(f"* Failed: {outcome.error}")
+                continue
+            for name, card in outcome.winners.items():
+                print(f"* {name}: {card.price} / {card.rating} ({card.review_amount}) - {WEBSITE_PREFIX + card.url}")
+
+        for name, (spec, card) in self.overall_winners().items():
+            print(f"\nOverall Best Choice ({name}): {spec.search_id}")
+            card.print_card_details()
+            print("Result URL: " + WEBSITE_PREFIX + card.url)
+
+
+class SearchRunner:
+    """
+    Runs a batch of searches concurrently, each in its own browser context, with at most max_concurrency at a time.
+    Specs are pulled from the given iterable only as workers free up (through a bounded queue),
+    and every search is cancelled once it runs longer than its timeout.
+    """
+
+    def __init__(
+            self,
+            browser: Browser,
+            objectives: Dict[str, Callable[[CardRecord, CardRecord], bool]],
+            max_concurrency: int = 4,
+            timeout: float = 300,
+            context_args: Optional[dict] = None,
+            search_mode: str = SEARCH_THROUGH_URL
+    ):
+        """
+        :param browser: The browser the searches' contexts are created in.
+        :param objectives: A dictionary of [objective_name (str) : comparator method] (see RANKING_OBJECTIVES).
+        :param max_concurrency: The maximal amount of searches running at the same time.
+        :param timeout: The amount of seconds a single search may take.
+        :param context_args: The arguments every search's context is created with.
+        :param search_mode: How each search is run (see MainPage.search_preferences).
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"Invalid concurrency limit: {max_concurrency}")
+        self.browser = browser
+        self.objectives = objectives
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.context_args = context_args or {}
+        self.search_mode = search_mode
+
+    async def run(self, specs: Iterable[SearchSpec]) -> SearchReport:
+        """
+        :param specs: The searches to run (may be a lazy iterable).
+        :return: The report of all searches.
+        """
+        queue = asyncio.Queue(maxsize=self.max_concurrency)
+        outcomes = {}
+
+        async def produce():
+            for order, spec in enumerate(specs):
+                # Blocks while the queue is full, so specs are only taken as fast as they're run.
+                await queue.put((order, spec))
+            for _ in range(self.max_concurrency):
+                await queue.put(None)
+
+        async def work():
+            while (item := await queue.get()) is not None:
+                order, spec = item
+                outcomes[order] = await self.run_search(spec)
+
+        await asyncio.gather(produce(), *(work() for _ in range(self.max_concurrency)))
+        return SearchReport([outcomes[order] for order in sorted(outcomes)], self.objectives)
+
+    async def run_search(self, spec: SearchSpec) -> SearchOutcome:
+        """
+        Runs a single search in a fresh context, within the timeout. Failures are reported rather than raised.
+        :param spec: The search.
+        :return: The search's outcome.
+        """
+        start = time.perf_counter()
+        context = None
+        try:
+            context = await self.browser.new_context(**self.context_args)
+            winners = await asyncio.wait_for(self.find_winners(await context.new_page(), spec), self.timeout)
+            return SearchOutcome(spec, winners, None, time.perf_counter() - start)
+        except asyncio.TimeoutError:
+            return SearchOutcome(spec, None, f"Timed out after {self.timeout}s", time.perf_counter() - start)
+        except Exception as error:
+            return SearchOutcome(spec, None, f"{type(error).__name__}: {error}", time.perf_counter() - start)
+        finally:
+            if context is not None:
+                await context.close()
+
+    async def find_winners(self, page: Page, spec: SearchSpec) -> Dict[str, ListingCard]:
+        """
+        Searches and traverses the results once, keeping only the winners' data.
+        :param page: A page of the search's context.
+        :param spec: The search.
+        :return: A dictionary of [objective_name (str) : best card].
+        """
+        if self.search_mode == SEARCH_THROUGH_URL:
+            await page.goto(build_search_url(START_URL, *spec))
+        else:
+            await page.goto(START_URL)
+            await MainPage(page, page.url).search_preferences(*spec, mode=self.search_mode)
+
+        best = await ResultsPage(page, page.url).find_best_cards(self.objectives)
+        return {name: ListingCard.from_card(card, page_index, card_index)
+                for name, (card, page_index, card_index) in best.items()}
+
+
+async def run_searches(
+        specs: Iterable[SearchSpec],
+        objectives: Dict[str, Callable[[CardRecord, CardRecord], bool]],
+        max_concurrency: int = 4,
+        timeout: float = 300,
+        headless: bool = True
+) -> SearchReport:
+    """
+    Launches chromium and runs a batch of searches with a SearchRunner.
+    :param specs: The searches to run.
+    :param objectives: A dictionary of [objective_name (str) : comparator method] (see RANKING_OBJECTIVES).
+    :param max_concurrency: The maximal amount of searches running at the same time.
+    :param timeout: The amount of seconds a single search may take.
+    :param headless: A parameter to toggle running the browser without a window.
+    :return: The report of all searches.
+    """
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=headless)
+        try:
+            return await SearchRunner(browser, objectives, max_concurrency, timeout).run(specs)
+        finally:
+            await browser.close()
@@ -0,0 +1,75 @@
+import asyncio
+from playwright.async_api import Locator, Page
+from models.utilities.helper_methods import (
+    CARDS_INFO_SCRIPT,
+    PRICE_CONTAINED_TEXT,
+    RATING_CONTAINED_TEXT,
+    parse_cards_info,
+    parse_price_text,
+    parse_rating_text,
+)
+
+# Async counterparts of the locator-based helpers in models.utilities.helper_methods.
+# The pure string/date helpers have no I/O, so they are imported from there directly.
+
+# _________________ General Locator Helper Methods _________________ #
+
+def get_locator_containing(page: Page, attribute : str, text : str) -> Locator:
+    return page.locator(f'[{attribute}*="{text}"]')
+
+# __________________ Card Container Helper Methods __________________ #
+
+async def extract_rating_info(locator : Locator) -> tuple[float, int]:
+    """
+    A method to extract rating information from a locator pointing to a card container.
+    :param locator: The locator to extract information from.
+    :return: The rating and amount of reviewers.
+    """
+    try:
+        # The card itself is already rendered, so a rating that isn't there now is missing - no need to wait for it.
+        rating_locator = locator.get_by_text(RATING_CONTAINED_TEXT, exact=False)
+        if await rating_locator.count() == 0:
+            return 0.0, 0
+        return parse_rating_text(await rating_locator.first.text_content())
+    except Exception:
+        return 0.0, 0
+
+async def extract_price_info(locator : Locator) -> int:
+    """
+    A method to extract price information from a locator pointing to a card container.
+    :param locator: The locator to extract information from.
+    :return: The price.
+    """
+    try:
+        price_locator = locator.get_by_test_id("price-availability-row").get_by_text(PRICE_CONTAINED_TEXT, exact=False)
+        if await price_locator.count() == 0:
+            return 10**18
+        return parse_price_text(await price_locator.first.text_content())
+    except Exception:
+        return 10**18 # Returning big value in case of an exception being thrown.
+
+async def extract_cards_info(locator : Locator) -> list[dict]:
+    """
+    A method to extract price, rating and url information of all cards a locator points to, in one round trip.
+    :param locator: The locator matching all card containers.
+    :return: A list of records {"price", "rating", "review_amount", "url"}, one per card, in page order.
+             A field that is missing or unparsable in a card is set to None.
+    """
+    raw_cards = await locator.evaluate_all(CARDS_INFO_SCRIPT, {"price": PRICE_CONTAINED_TEXT, "rating": RATING_CONTAINED_TEXT})
+    return parse_cards_info(raw_cards)
+
+# ___________________ Results Page Helper Methods ___________________ #
+
+async def increment_n_times(button: Locator, n : int) -> None:
+    # Each click changes the stepper's state, so the clicks must stay sequential.
+    for i in range(n):
+        await button.click()
+
+async def read_stepper_values(locators: dict[str, Locator]) -> dict[str, int]:
+    """
+    Reads several stepper counters concurrently.
+    :param locators: A dictionary [containing guest_type (str) : stepper_value_locator (Locator)]
+    :return: A dictionary [containing guest_type (str) : stepper_counter_value (int)]
+    """
+    values = await asyncio.gather(*(locator.inner_text() for locator in locators.values()))
+    return {key: int(value) for key, value in zip(locators, values)}
@@ -0,0 +1,57 @@
+from typing import Awaitable, Callable
+from playwright.async_api import Locator, Page
+from models.utilities.readiness import wait_recorder
+
+# Async counterparts of the readiness helpers in models.utilities.readiness, reporting to the same wait_recorder.
+
+# ________________________ Readiness Helper Methods ________________________ #
+
+async def wait_for_hidden(locator: Locator, label: str, timeout: int = 10000) -> None:
+    """
+    Waits for an element (e.g. a closing popup or panel) to be hidden or removed.
+    :param locator: The element's locator.
+    :param label: The label the wait is recorded under.
+    :param timeout: The maximal time to wait, in milliseconds.
+    :return: None
+    """
+    with wait_recorder.measure(label):
+        await locator.wait_for(state="hidden", timeout=timeout)
+
+async def wait_for_visible(locator: Locator, label: str, timeout: int = 10000) -> None:
+    """
+    Waits for an element to be visible.
+    :param locator: The element's locator.
+    :param label: The label the wait is recorded under.
+    :param timeout: The maximal time to wait, in milliseconds.
+    :return: None
+    """
+    with wait_recorder.measure(label):
+        await locator.wait_for(state="visible", timeout=timeout)
+
+async def run_and_wait_for_url_change(page: Page, action: Callable[[], Awaitable[None]], timeout: int = 30000) -> None:
+    """
+    Runs an action and waits until the page's url changes, including client-side (history API) navigations.
+    :param page: The page.
+    :param action: The action causing the navigation.
+    :param timeout: The maximal time to wait, in milliseconds.
+    :return: None
+    """
+    previous_url = page.url
+    await action()
+    with wait_recorder.measure("url change"):
+        await page.wait_for_url(lambda url: url != previous_url, wait_until="commit", timeout=timeout)
+
+async def run_and_wait_for_replacement(locator: Locator, action: Callable[[], Awaitable[None]], timeout: int = 30000) -> None:
+    """
+    Runs an action and waits until the first element matched by a locator is detached from the DOM,
+    e.g. until a results grid is replaced after moving to another page.
+    :param locator: The locator of the elements to be replaced.
+    :param action: The action replacing them.
+    :param timeout: The maximal time to wait, in milliseconds.
+    :return: None
+    """
+    handle = await locator.first.element_handle(timeout=timeout)
+    await action()
+    with wait_recorder.measure("content replaced"):
+        await locator.page.wait_for_function("element => !element.isConnected", arg=handle, timeout=timeout)
+    await handle.dispose()
@@ -1,44 +1,137 @@
-from typing import List, Callable
+from typing import List, Callable, Optional
 from playwright.sync_api import Locator
 from models.utilities.helper_methods import extract_price_info, extract_rating_info
 
-class CardContainer:
+class CardRecord:
+    """
+    The data of a single result card, without any locator - e.g. a card parsed from a search payload.
+    """
 
-    def __init__(self, locator: Locator):
-        self.container = locator
-        self.price = extract_price_info(locator)
-        self.rating, self.review_amount = extract_rating_info(locator)
-        temp_container = self.container.locator('a').first
-        temp_container.wait_for(state='visible')
-        self.url = temp_container.get_attribute("href")
+    def __init__(self, price: int, rating: float, review_amount: int, url: str):
+        self.price = price
+        self.rating = rating
+        self.review_amount = review_amount
+        self.url = url
 
-    def click(self):
-        self.container.click()
+    @staticmethod
+    def from_card(card: "CardRecord") -> "CardRecord":
+        """
+        :param card: Any card (e.g. a CardContainer or a ListingCard).
+        :return: The card itself if it's a plain record, otherwise a copy of its data without its locator or position.
+        """
+        if type(card) is CardRecord:
+            return card
+        return CardRecord(card.price, card.rating, card.review_amount, card.url)
 
-    def is_rated_better(self, other: "CardContainer") -> bool:
+    @staticmethod
+    def from_info(info: dict) -> "CardRecord":
+        """
+        Builds a card from a record with possibly missing (None) fields (see extract_cards_info).
+        Missing fields get the same fallback values the per-card extraction uses.
+        :param info: The record.
+        :return: The card.
+        """
+        return CardRecord(
+            info["price"] if info["price"] is not None else 10**18,
+            info["rating"] if info["rating"] is not None else 0.0,
+            info["review_amount"] if info["review_amount"] is not None else 0,
+            info["url"]
+        )
+
+    def is_rated_better(self, other: "CardRecord") -> bool:
         """
         A comparator method that checks if this card is rated better than another card.
-        :param other: The other CardContainer being compared.
+        :param other: The other card being compared.
         :return: True or False
         """
         return self.rating > other.rating or (self.rating == other.rating and self.review_amount > other.review_amount)
 
-    def is_lower_priced(self: "CardContainer", other: "CardContainer") -> bool:
+    def is_lower_priced(self: "CardRecord", other: "CardRecord") -> bool:
         """
         A comparator method that checks if this card is priced lower than another card.
-        :param other: The other CardContainer being compared.
+        :param other: The other card being compared.
         :return: True or False
         """
         return self.price < other.price
 
+    def is_better_value(self: "CardRecord", other: "CardRecord") -> bool:
+        """
+        A comparator method that checks if this card offers more rating per price unit than another card.
+        Ties are broken by the amount of reviews.
+        :param other: The other card being compared.
+        :return: True or False
+        """
+        # Cross-multiplying avoids dividing by the fallback price of unpriced cards.
+        self_value, other_value = self.rating * other.price, other.rating * self.price
+        return self_value > other_value or (self_value == other_value and self.review_amount > other.review_amount)
+
     def print_card_details(self):
         print(f"* Price: {self.price}")
         print(f"* Rating: {self.rating}")
         print(f"* Review Amount: {self.review_amount}")
 
+class ListingCard:
+    """
+    A compact, immutable card record, locating the card by its results page and position - see ResultsPage.iter_cards.
+    It holds no locator, and compares like CardRecord.
+    """
+    __slots__ = ("price", "rating", "review_amount", "url", "page", "index")
+
+    def __init__(self, price: int, rating: float, review_amount: int, url: str, page: int, index: int):
+        for name, value in zip(self.__slots__, (price, rating, review_amount, url, page, index)):
+            object.__setattr__(self, name, value)
+
+    @staticmethod
+    def from_card(card: CardRecord, page: int, index: int) -> "ListingCard":
+        """
+        :param card: The card (e.g. a CardContainer), whose locator isn't kept.
+        :param page: The index of the card's results page.
+        :param index: The card's index within its page.
+        :return: The card's record.
+        """
+        return ListingCard(card.price, card.rating, card.review_amount, card.url, page, index)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"ListingCard(price={self.price}, rating={self.rating}, review_amount={self.review_amount}, " \
+               f"url={self.url!r}, page={self.page}, index={self.index})"
+
+    is_rated_better = CardRecord.is_rated_better
+    is_lower_priced = CardRecord.is_lower_priced
+    is_better_value = CardRecord.is_better_value
+    print_card_details = CardRecord.print_card_details
+
+class CardContainer(CardRecord):
+
+    def __init__(self, locator: Locator, info: Optional[dict] = None):
+        """
+        :param locator: The locator pointing to the card container.
+        :param info: An optional pre-extracted record (see extract_cards_info).
+                     If given, the card's data is taken from it instead of being read from the locator.
+        """
+        self.container = locator
+        if info is not None:
+            record = CardRecord.from_info(info)
+            super().__init__(record.price, record.rating, record.review_amount, record.url)
+            return
+
+        price = extract_price_info(locator)
+        rating, review_amount = extract_rating_info(locator)
+        temp_container = self.container.locator('a').first
+        temp_container.wait_for(state='visible')
+        super().__init__(price, rating, review_amount, temp_container.get_attribute("href"))
+
+    def click(self):
+        self.container.click()
+
 def best_card_in_list(
-        card_containers: List[CardContainer],
-        is_better: Callable[["CardContainer", "CardContainer"], bool] ) -> int:
+        card_containers: List[CardRecord],
+        is_better: Callable[["CardRecord", "CardRecord"], bool] ) -> int:
     """
     Extracts the best card from a list of cards, based on a given comparator.
     :param card_containers: The list of cards.
@@ -1,5 +1,6 @@
 from playwright.sync_api import Page
 from models.utilities.helper_methods import increment_n_times
+from models.utilities.readiness import run_and_wait_for_url_change
 from datetime import date
 
 class SearchBar:
@@ -12,6 +13,7 @@ class SearchBar:
         self.check_out_button = self.page.get_by_role("button").filter(has_text="Check out")
         self.guests_num_entry_button = self.page.get_by_role("button").filter(has_text="Add guests")
         self.guests_num_assert_button = self.page.get_by_role("button").filter(has_text="Who")
+        self.guests_steppers = self.page.locator('[data-testid^="stepper-"][data-testid$="-value"]')
         self.search_button = self.page.get_by_test_id("structured-search-input-search-button")
 
     def input_destination(self, destination : str) -> None:
@@ -102,4 +104,8 @@ class SearchBar:
             assert value == amount
 
     def search(self) -> None:
-        self.search_button.click()
\ No newline at end of file
+        """
+        Clicks the search button, and waits for the navigation to the results.
+        :return: None
+        """
+        run_and_wait_for_url_change(self.page, self.search_button.click)
\ No newline at end of file
@@ -2,6 +2,11 @@ from datetime import date
 from playwright.sync_api import Page
 from models.page_objects.base_page import BasePage
 from models.page_components.search_bar import SearchBar
+from models.utilities.helper_methods import build_search_url
+
+# How search_preferences reaches the results: through the search bar, or by loading the results' url directly.
+SEARCH_THROUGH_UI  = "ui"
+SEARCH_THROUGH_URL = "url"
 
 class MainPage(BasePage):
     def __init__(self, page: Page, url: str):
@@ -16,10 +21,13 @@ class MainPage(BasePage):
             num_of_adults : int = 0,
             num_of_children : int = 0,
             num_of_infants : int = 0,
-            num_of_pets : int = 0
+            num_of_pets : int = 0,
+            mode : str = SEARCH_THROUGH_UI
     ):
         """
         A method that takes in expected data and inputs it within the search bar.
+        With mode=SEARCH_THROUGH_URL, the results page is loaded directly instead, in a single navigation -
+        for tests that need a result set rather than the search bar itself.
         :param destination: The expected destination.
         :param start_date: The expected check-in date.
         :param end_date: The expected check-out date.
@@ -27,8 +35,17 @@ class MainPage(BasePage):
         :param num_of_children: The expected number of children.
         :param num_of_infants: The expected number of infants.
         :param num_of_pets: The expected number of pets.
+        :param mode: SEARCH_THROUGH_UI or SEARCH_THROUGH_URL.
         :return: None
         """
+        if mode == SEARCH_THROUGH_URL:
+            self.page.goto(build_search_url(
+                self.page.url, destination, start_date, end_date, num_of_adults, num_of_children, num_of_infants, num_of_pets
+            ))
+            return
+        if mode != SEARCH_THROUGH_UI:
+            raise ValueError(f"Invalid search mode: {mode}")
+
         self.search_bar.input_destination(destination)
         self.search_bar.choose_dates(start_date, end_date)
         self.search_bar.guests_num_entry_button.click()
@@ -1,6 +1,7 @@
 from playwright.sync_api import Page
 from models.page_objects.base_page import BasePage
-from models.utilities.helper_methods import remove_non_alphanumeric
+from models.utilities.helper_methods import format_iso_date, remove_non_alphanumeric
+from models.utilities.page_state import DETAILS_FROM_UI, read_booking_state, read_details
 
 
 class OverviewPage(BasePage):
@@ -8,9 +9,9 @@ class OverviewPage(BasePage):
     def __init__(self, page: Page, url: str):
         super().__init__(page, url)
 
-        # Handles popup in case it happens.
+        # Handles popup in case it happens. Playwright waits for the popup to be hidden once the handler returns.
         self.page.add_locator_handler(self.page.locator('[aria-label="Translation on"]'),
-                                     lambda  : self.page.keyboard.press("Escape", delay=500))
+                                     lambda  : self.page.keyboard.press("Escape"))
 
         self.check_in_locator = self.page.get_by_test_id("change-dates-checkIn")
         self.check_out_locator = self.page.get_by_test_id("change-dates-checkOut")
@@ -28,9 +29,17 @@ class OverviewPage(BasePage):
 
         self.reserve_button = self.page.get_by_test_id("homes-pdp-cta-btn").last
 
-    def get_all_details(self) -> tuple[str, str, dict[str, int], int]:
+    def get_all_details(self, source: str = DETAILS_FROM_UI) -> tuple[str, str, dict[str, int], int]:
         """
         Extracts all desired details from the overview page.
+        :param source: Where to read the details from - the UI, the page's state, or both (see models/utilities/page_state.py).
+        :return: A tuple containing (check_in_date, check_out_date, guests, price)
+        """
+        return read_details(source, self.get_ui_details, self.get_state_details)
+
+    def get_ui_details(self) -> tuple[str, str, dict[str, int], int]:
+        """
+        Extracts all desired details through the page's UI, opening the guest picker.
         :return: A tuple containing (check_in_date, check_out_date, guests, price)
         """
         check_in = self.get_check_in_date()
@@ -39,6 +48,18 @@ class OverviewPage(BasePage):
         price = self.get_price()
         return check_in, check_out, guests, price
 
+    def get_state_details(self) -> tuple[str, str, dict[str, int], int]:
+        """
+        Extracts the dates and guests from the page's url and embedded state, and the price from the page.
+        Details missing from the state are read through the UI.
+        :return: A tuple containing (check_in_date, check_out_date, guests, price)
+        """
+        state = read_booking_state(self.page)
+        check_in = format_iso_date(state["check_in"]) if state["check_in"] else self.get_check_in_date()
+        check_out = format_iso_date(state["check_out"]) if state["check_out"] else self.get_check_out_date()
+        guests = state["guests"] if state["guests"] is not None else self.get_guests_info()
+        return check_in, check_out, guests, self.get_price()
+
     def get_check_in_date(self) -> str:
         """
         Extracts the offer's check-in date.
@@ -72,17 +93,19 @@ class OverviewPage(BasePage):
         """
         return int(remove_non_alphanumeric(self.price_locator.inner_text()))
 
-    def print_details(self):
+    def print_details(self, source: str = DETAILS_FROM_UI):
         """
         Prints the offer's details.
+        :param source: Where to read the details from (see get_all_details).
         :return: None
         """
+        check_in, check_out, guests, price = self.get_all_details(source)
         print("Deal details:")
-        print("Check in: " + self.get_check_in_date())
-        print("Check out: " + self.get_check_out_date())
-        for key, val in self.get_guests_info().items():
+        print("Check in: " + check_in)
+        print("Check out: " + check_out)
+        for key, val in guests.items():
             print(f"{key}: {str(val)}")
-        print("Price: " + str(self.get_price()))
+        print("Price: " + str(price))
 
     def click_reserve(self) -> None:
         """
@@ -1,5 +1,8 @@
 from playwright.sync_api import Page
 from models.page_objects.base_page import BasePage
+from models.utilities.dial_prefix_cache import DIAL_OPTIONS_SCRIPT, DIAL_OPTION_TEXT_SCRIPT, dial_prefix_cache
+from models.utilities.helper_methods import format_iso_date
+from models.utilities.page_state import DETAILS_FROM_UI, read_booking_state, read_details
 
 class ReservationPage(BasePage):
     def __init__(self, page: Page, url: str):
@@ -11,9 +14,17 @@ class ReservationPage(BasePage):
         self.number_prefix_selector = self.page.get_by_test_id("login-signup-countrycode")
         self.phone_input = self.page.get_by_test_id("login-signup-phonenumber")
 
-    def get_all_details(self) -> tuple[str, str, dict[str, int], int]:
+    def get_all_details(self, source: str = DETAILS_FROM_UI) -> tuple[str, str, dict[str, int], int]:
         """
         Extracts all desired details from the reservation page.
+        :param source: Where to read the details from - the UI, the page's state, or both (see models/utilities/page_state.py).
+        :return: A tuple containing (check_in_date, check_out_date, guests, price)
+        """
+        return read_details(source, self.get_ui_details, self.get_state_details)
+
+    def get_ui_details(self) -> tuple[str, str, dict[str, int], int]:
+        """
+        Extracts all desired details through the page's edit panels.
         :return: A tuple containing (check_in_date, check_out_date, guests, price)
         """
         check_in_date, check_out_date = self.get_reservation_dates()
@@ -21,27 +32,37 @@ class ReservationPage(BasePage):
         price = self.get_price()
         return check_in_date, check_out_date, guests, price
 
+    def get_state_details(self) -> tuple[str, str, dict[str, int], int]:
+        """
+        Extracts the dates and guests from the page's url and embedded state, and the price from the page.
+        Details missing from the state are read through the edit panels.
+        :return: A tuple containing (check_in_date, check_out_date, guests, price)
+        """
+        state = read_booking_state(self.page)
+        if state["check_in"] and state["check_out"]:
+            check_in_date, check_out_date = format_iso_date(state["check_in"]), format_iso_date(state["check_out"])
+        else:
+            check_in_date, check_out_date = self.get_reservation_dates()
+        guests = state["guests"] if state["guests"] is not None else self.get_guests_info()
+        return check_in_date, check_out_date, guests, self.get_price()
+
     def select_dial_prefix(self, prefix: int) -> None:
         """
         Selects the desired country-dial according to the entered prefix.
         :param prefix: the country code, without '+' sign.
         :return: None
         """
-        formatted_prefix = f"(+{prefix})"
+        # The prefix's option value is looked up in the process-wide cache, after checking it still matches the selector.
+        value = dial_prefix_cache.get(prefix)
+        if value is None or not dial_prefix_cache.is_valid_option(
+                self.number_prefix_selector.evaluate(DIAL_OPTION_TEXT_SCRIPT, value), prefix):
+            # Otherwise, the cache is rebuilt from all the selector's options, read in a single call.
+            dial_prefix_cache.rebuild(self.number_prefix_selector.evaluate(DIAL_OPTIONS_SCRIPT))
+            value = dial_prefix_cache.get(prefix)
 
-        # Gets all options available from the selector
-        self.number_prefix_selector.click()
-        options = self.number_prefix_selector.locator("option")
-        count = options.count()
-
-        # Goes over all of them, potentially finds a match and selects it.
-        # Otherwise, will raise an error.
-        for i in range(count):
-            text = options.nth(i).text_content()
-            if formatted_prefix in text:
-                value = options.nth(i).get_attribute("value")
-                self.number_prefix_selector.select_option(value=value)
-                return
+        if value is not None:
+            self.number_prefix_selector.select_option(value=value)
+            return
 
         raise ValueError(f"No option found containing '{prefix}'")
 
@@ -53,18 +74,19 @@ class ReservationPage(BasePage):
         self.select_dial_prefix(prefix)
         self.phone_input.fill(str(number))
 
-    def print_details(self) -> None:
+    def print_details(self, source: str = DETAILS_FROM_UI) -> None:
         """
         Prints the reservation's details.
+        :param source: Where to read the details from (see get_all_details).
         :return: None
         """
+        check_in_date, check_out_date, guests, price = self.get_all_details(source)
         print("Deal details:")
-        check_in_date, check_out_date = self.get_reservation_dates()
         print(f"Check in: {check_in_date}")
         print(f"Check out: {check_out_date}")
-        for key, val in self.get_guests_info().items():
+        for key, val in guests.items():
             print(f"{key}: {val}")
-        print(f"Price: {self.get_price()}")
+        print(f"Price: {price}")
 
     # Abstract Methods to be implemented by child classes:
     def get_reservation_dates(self) -> tuple[str, str]: ...
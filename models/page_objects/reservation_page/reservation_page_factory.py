@@ -1,12 +1,75 @@
-from playwright.sync_api import Page
+import re
+from functools import reduce
+from typing import Callable, Optional, Type
+from playwright.sync_api import Locator, Page
 from models.page_objects.reservation_page.reservation_page_a import ReservationPageTypeA
 from models.page_objects.reservation_page.reservation_page_b import ReservationPageTypeB
 from models.page_objects.reservation_page.reservation_page import ReservationPage  # optional, for typing
+from models.utilities.readiness import wait_for_visible
 
-def create_reservation_page(page: Page, url: str) -> ReservationPage:
-    phone_input = page.get_by_test_id("login-signup-phonenumber")
-    try:
-        phone_input.wait_for(state="visible", timeout=5000)
-        return ReservationPageTypeA(page, url)
-    except:
-        return ReservationPageTypeB(page, url)
\ No newline at end of file
+# The known checkout variants: [variant_name (str) : (page_class, marker)].
+# A marker returns the locator of an element that only its variant shows once the checkout page is rendered.
+RESERVATION_PAGE_VARIANTS: dict[str, tuple[Type[ReservationPage], Callable[[Page], Locator]]] = {}
+
+# The variant detected for each listing during the session: [listing_id (str) : variant_name (str)].
+detected_variants: dict[str, str] = {}
+
+LISTING_ID_PATTERN = re.compile(r"/(?:rooms|book/stays)/(\d+)")
+
+def register_reservation_page_variant(
+        name: str,
+        page_class: Type[ReservationPage],
+        marker: Callable[[Page], Locator]
+) -> None:
+    """
+    Registers a checkout variant, to be detected alongside all other registered variants.
+    Variants are checked in registration order when several markers are visible.
+    :param name: The variant's name.
+    :param page_class: The ReservationPage subclass handling the variant.
+    :param marker: A function returning the locator of an element only the variant shows.
+    :return: None
+    """
+    RESERVATION_PAGE_VARIANTS[name] = (page_class, marker)
+
+register_reservation_page_variant("A", ReservationPageTypeA, lambda page: page.get_by_test_id("login-signup-phonenumber"))
+register_reservation_page_variant("B", ReservationPageTypeB, lambda page: page.get_by_test_id("pd-value-TOTAL"))
+
+def get_listing_id(url: str) -> Optional[str]:
+    """
+    Extracts the listing id from a room or checkout url.
+    :param url: The url.
+    :return: The listing id, or None if the url has none.
+    """
+    match = LISTING_ID_PATTERN.search(url)
+    return match.group(1) if match else None
+
+def detect_reservation_page_variant(page: Page, timeout: int = 10000) -> str:
+    """
+    Waits for the marker of any registered variant to be visible - all at once - and returns the first visible one.
+    :param page: The checkout page.
+    :param timeout: The maximal time to wait, in milliseconds.
+    :return: The variant's name.
+    """
+    markers = {name: marker(page) for name, (_, marker) in RESERVATION_PAGE_VARIANTS.items()}
+    any_marker = reduce(Locator.or_, markers.values())
+    wait_for_visible(any_marker.first, "reservation page variant", timeout)
+
+    for name, marker_locator in markers.items():
+        if marker_locator.first.is_visible():
+            return name
+    raise RuntimeError("The visible reservation page marker disappeared before its variant was detected")
+
+def create_reservation_page(page: Page, url: str, timeout: int = 10000) -> ReservationPage:
+    listing_id = get_listing_id(url)
+    variant = detected_variants.get(listing_id)
+    if variant is None:
+        variant = detect_reservation_page_variant(page, timeout)
+        if listing_id is not None:
+            detected_variants[listing_id] = variant
+    else:
+        # The listing's variant was already detected in this session, so only its own marker is waited for -
+        # the checkout page must still be rendered before it's read.
+        wait_for_visible(RESERVATION_PAGE_VARIANTS[variant][1](page).first, "reservation page variant", timeout)
+
+    page_class, _ = RESERVATION_PAGE_VARIANTS[variant]
+    return page_class(page, url)
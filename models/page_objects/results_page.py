@@ -1,13 +1,41 @@
 from datetime import date
-from typing import Callable
+from itertools import chain
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page
 from models.page_objects.base_page import BasePage
-from models.page_components.card_container import CardContainer, best_card_in_list
+from models.page_components.card_container import CardContainer, CardRecord, ListingCard, best_card_in_list
 from models.page_components.search_bar import SearchBar
+from models.utilities.helper_methods import extract_cards_info
+from models.utilities.page_state import EMBEDDED_STATE_SCRIPT
+from models.utilities.listings_table import ListingsTable
+from models.utilities.results_cache import results_cache, search_key_from_url
+from models.utilities.readiness import run_and_wait_for_replacement, run_and_wait_for_response, wait_for_hidden, wait_for_visible
+from models.utilities.search_payload import SEARCH_API_PATH, iter_payload_cards
+from models.utilities.top_k import RankedCard, TopKSelector
+from models.utilities.traversal_checkpoint import DEFAULT_PAGE_RETRY_POLICY, TraversalCheckpoint
 
 WEBSITE_PREFIX = "https://airbnb.com"
 
+# Named ranking objectives, usable together in a single traversal (see ResultsPage.extract_best_cards).
+HIGHEST_RATED = "highest_rated"
+LOWEST_PRICED = "lowest_priced"
+BEST_VALUE    = "best_value"
+
+RANKING_OBJECTIVES = {
+    HIGHEST_RATED: lambda a, b: a.is_rated_better(b),
+    LOWEST_PRICED: lambda a, b: a.is_lower_priced(b),
+    BEST_VALUE:    lambda a, b: a.is_better_value(b),
+}
+
+# Sort keys of the named objectives, larger being better (see ResultsPage.extract_top_cards).
+# They order cards like the comparators above, e.g. by rating and then by the amount of reviews.
+RANKING_KEYS = {
+    HIGHEST_RATED: lambda card: (card.rating, card.review_amount),
+    LOWEST_PRICED: lambda card: -card.price,
+    BEST_VALUE:    lambda card: (card.rating / max(card.price, 1), card.review_amount),
+}
+
 class ResultsPage(BasePage):
     def __init__(self, page: Page, url: str):
         super().__init__(page, url)
@@ -15,6 +43,12 @@ class ResultsPage(BasePage):
         self.search_bar = SearchBar(page)
         self.first_url  = page.url
         self.next_page_button = page.get_by_role("link", name="Next")
+        self.pagination_links = page.locator('nav[aria-label*="pagination" i] a[href]')
+        # Every card seen by the latest traversal of the results (see iter_result_pages).
+        self.listings = ListingsTable()
+        # The progress of the latest traversal, and how its pages are retried (see iter_pages).
+        self.checkpoint = None
+        self.page_retry_policy = DEFAULT_PAGE_RETRY_POLICY
 
     def assert_preferences(
             self,
@@ -43,65 +77,441 @@ class ResultsPage(BasePage):
         self.search_bar.assert_dates(start_date, end_date)
         self.search_bar.guests_num_assert_button.first.click()
         self.search_bar.assert_guests_num(num_of_adults, num_of_children, num_of_infants, num_of_pets)
-        self.page.keyboard.press("Escape", delay=500)
+        self.page.keyboard.press("Escape")
+        wait_for_hidden(self.search_bar.guests_steppers.first, "search bar closed")
 
     def goto_first_page(self):
         self.page.goto(self.first_url)
 
-    def extract_highest_rated_card(self, print_result : bool) -> str:
-        return self.extract_best_card(lambda a, b: a.is_rated_better(b), print_result)
+    def get_card_containers(self, bulk : bool = True) -> List[CardContainer]:
+        """
+        Builds a CardContainer for every card on the current results page.
+        :param bulk: If True, all cards' data is read in a single evaluation (see extract_cards_info).
+                     Otherwise, each card is probed separately through its own locators.
+        :return: The list of card containers, in page order.
+        """
+        if not bulk:
+            return [CardContainer(locator) for locator in self.locator.all()]
+
+        # The cards' locators are derived from the same evaluation their data comes from, so the two can't disagree
+        # on the amount of cards (e.g. while more cards are lazily rendered).
+        cards_info = extract_cards_info(self.locator)
+        return [CardContainer(self.locator.nth(index), info) for index, info in enumerate(cards_info)]
+
+    def get_card_records(self) -> List[CardRecord]:
+        """
+        Reads every card on the current results page in a single evaluation, without creating any locator.
+        :return: The list of cards, in page order.
+        """
+        return [CardRecord.from_info(info) for info in extract_cards_info(self.locator)]
+
+    def iter_cards(self, from_payload : bool = False) -> Iterator[ListingCard]:
+        """
+        Lazily yields every card of the results, page after page, as a compact immutable record.
+        Pages are only loaded as the cards are consumed, so a consumer may stop early.
+        No page is kept once consumed, so memory stays flat however many listings are swept - the trade-off being that
+        the results cache is bypassed, self.listings is left empty and the traversal can't be resumed.
+        A card's locator can be created when needed with locate_card.
+        :param from_payload: A parameter to toggle reading each page's cards from its search payload instead of the DOM.
+        :return: An iterator of the cards, in traversal order.
+        """
+        for page_index, cards in enumerate(self.iter_result_pages(from_payload=from_payload, records_only=True, retain=False)):
+            for card_index, card in enumerate(cards):
+                yield ListingCard.from_card(card, page_index, card_index)
+
+    def locate_card(self, card : CardRecord) -> Locator:
+        """
+        Creates the locator of a card, by its url. The card's results page must be the one currently shown.
+        :param card: The card (e.g. a ListingCard yielded by iter_cards).
+        :return: The locator of the card's container.
+        """
+        escaped_url = card.url.replace('"', '\\"')
+        return self.locator.filter(has=self.page.locator(f'a[href="{escaped_url}"]'))
+
+    def extract_highest_rated_card(self, print_result : bool, bulk : bool = True) -> str:
+        return self.extract_best_card(RANKING_OBJECTIVES[HIGHEST_RATED], print_result, bulk)
 
-    def extract_lowest_priced_card(self, print_result : bool) -> str:
-        return self.extract_best_card(lambda a, b: a.is_lower_priced(b), print_result)
+    def extract_lowest_priced_card(self, print_result : bool, bulk : bool = True) -> str:
+        return self.extract_best_card(RANKING_OBJECTIVES[LOWEST_PRICED], print_result, bulk)
 
-    def extract_best_card(self, is_better: Callable[[CardContainer, CardContainer], bool], print_result : bool) -> str:
+    def extract_best_card(
+            self,
+            is_better: Callable[[CardContainer, CardContainer], bool],
+            print_result : bool,
+            bulk : bool = True
+    ) -> str:
         """
         Traverses paginated results and returns the URL and index of the best card
         according to the provided comparator.
         :param is_better: The comparator method.
         :param print_result: A parameter to toggle printing the result of the method.
+        :param bulk: A parameter to toggle reading each page's cards in a single evaluation.
         :return: The best card's page url and locator index.
         """
-        best_page_index = -1
-        best_card_index = -1
-        best_result_url = ""
-        best_card = None
-        page_count = 0
+        return self.extract_best_cards({"best": is_better}, print_result, bulk)["best"]
+
+    def extract_best_cards(
+            self,
+            objectives: Dict[str, Callable[[CardRecord, CardRecord], bool]],
+            print_result : bool,
+            bulk : bool = True,
+            from_payload : bool = False,
+            resume : bool = False
+    ) -> Dict[str, str]:
+        """
+        Traverses paginated results once and returns the URL of the best card for every given objective.
+        :param objectives: A dictionary of [objective_name (str) : comparator method].
+        :param print_result: A parameter to toggle printing the result of the method.
+        :param bulk: A parameter to toggle reading each page's cards in a single evaluation.
+        :param from_payload: A parameter to toggle reading each page's cards from its search payload instead of the DOM.
+        :param resume: A parameter to toggle resuming the latest unfinished traversal from its checkpoint (see iter_pages).
+        :return: A dictionary of [objective_name (str) : best card's url (str)].
+        """
+        # Rankings are only cached for the named objectives, as arbitrary comparators can't be told apart by name.
+        search_key = search_key_from_url(self.first_url)
+        ranking_cacheable = all(RANKING_OBJECTIVES.get(name) is is_better for name, is_better in objectives.items())
+        if ranking_cacheable:
+            cached_best = results_cache.get_ranking(search_key, objectives)
+            if cached_best is not None:
+                return self.report_best_cards(cached_best, print_result)
+
+        # For every objective we keep: (best_card, best_page_index, best_card_index)
+        best = {name: (None, -1, -1) for name in objectives}
+
+        # Update the overall best cards with every page's best cards.
+        # When resuming, the checkpointed pages come first, so the running best is rebuilt without loading them again.
+        for page_index, cards in enumerate(self.iter_result_pages(bulk, from_payload, resume)):
+            self.update_best_cards(best, objectives, cards, page_index)
+
+        if ranking_cacheable:
+            results_cache.put_ranking(search_key, best)
+        return self.report_best_cards(best, print_result)
+
+    def extract_top_cards(
+            self,
+            keys: Dict[str, Callable[[CardRecord], Any]],
+            k : int,
+            print_result : bool,
+            bulk : bool = True,
+            from_payload : bool = False
+    ) -> Dict[str, List[RankedCard]]:
+        """
+        Traverses paginated results once and returns the K best cards for every given sort key,
+        selecting them as the pages are read instead of keeping all cards.
+        :param keys: A dictionary of [objective_name (str) : sort key method], larger keys being better
+                     (see RANKING_KEYS), e.g. lambda card: (card.rating, card.review_amount, -card.price).
+        :param k: The amount of cards to return for every key.
+        :param print_result: A parameter to toggle printing the result of the method.
+        :param bulk: A parameter to toggle reading each page's cards in a single evaluation.
+        :param from_payload: A parameter to toggle reading each page's cards from its search payload instead of the DOM.
+        :return: A dictionary of [objective_name (str) : list of (card, page_index, card_index), best first].
+        """
+        selectors = {name: TopKSelector(k, key) for name, key in keys.items()}
+        for page_index, cards in enumerate(self.iter_result_pages(bulk, from_payload)):
+            for selector in selectors.values():
+                selector.push_page(cards, page_index)
+
+        top_cards = {name: selector.results() for name, selector in selectors.items()}
+        if print_result:
+            for name, ranked_cards in top_cards.items():
+                print(f"\nTop {len(ranked_cards)} Choices ({name}):")
+                for rank, (card, page_index, card_index) in enumerate(ranked_cards, start=1):
+                    print(f"#{rank} - Found in page no. {page_index + 1} at index: {card_index + 1}")
+                    card.print_card_details()
+                    print("Result URL: " + WEBSITE_PREFIX + card.url + "\n")
+        return top_cards
+
+    def iter_result_pages(
+            self,
+            bulk : bool = True,
+            from_payload : bool = False,
+            resume : bool = False,
+            records_only : bool = False,
+            retain : bool = True
+    ) -> Iterator[List[CardRecord]]:
+        """
+        Yields the cards of every results page - from the results cache if all of them are in it,
+        otherwise by traversing the pages from the first one (and caching them), going back to the first page at the end,
+        even if the consumer stops early or the traversal fails. Only a traversal that reached the last page is cached.
+        Every card is also accumulated into self.listings.
+        Cards are always yielded as plain CardRecords, whether they were cached, checkpointed or read live,
+        so callers behave the same with a warm cache - a card's locator can be created when needed with locate_card.
+        :param bulk: A parameter to toggle reading each page's cards in a single evaluation.
+        :param from_payload: A parameter to toggle reading each page's cards from its search payload instead of the DOM.
+        :param resume: A parameter to toggle continuing the latest unfinished traversal from its checkpoint
+                       (its completed pages are yielded first, without being loaded again).
+        :param records_only: A parameter to toggle reading the cards without creating their locators (see get_card_records).
+        :param retain: A parameter to toggle keeping the pages read - in self.listings, the results cache and the checkpoint.
+                       Without it, memory stays flat however many pages are traversed, but the traversal can't be resumed.
+        :return: An iterator of every page's cards, as CardRecords.
+        """
+        self.listings = ListingsTable()
+        search_key = search_key_from_url(self.first_url)
+        # A cached search is loaded as a whole, so without retaining pages, the cache isn't read either.
+        pages = results_cache.get_pages(search_key) if retain else None
+        traversed = pages is None
+        if traversed and from_payload:
+            pages = self.iter_payload_pages()
+        elif traversed and not retain:
+            pages = self.iter_pages(bulk, TraversalCheckpoint(self.first_url, retain_cards=False), records_only)
+        elif traversed:
+            # A fresh traversal always starts from the first page - never from wherever the browser was left,
+            # e.g. on the page a previous traversal failed on.
+            if not (resume and self.checkpoint is not None and not self.checkpoint.finished):
+                self.checkpoint = TraversalCheckpoint(self.first_url)
+            completed_pages = list(self.checkpoint.pages)
+            pages = chain(completed_pages, self.iter_pages(bulk, self.checkpoint, records_only))
+        if traversed and retain:
+            pages = results_cache.record_pages(search_key, pages)
+
+        try:
+            for page_index, cards in enumerate(pages):
+                records = [CardRecord.from_card(card) for card in cards]
+                if retain:
+                    self.listings.append_page(records, page_index)
+                yield records
+        finally:
+            # Also runs when the generator is closed early, so the next traversal doesn't find the browser mid-results.
+            if traversed and self.page.url != self.first_url:
+                self.goto_first_page()
+
+    def iter_pages(
+            self,
+            bulk : bool = True,
+            checkpoint : Optional[TraversalCheckpoint] = None,
+            records_only : bool = False
+    ) -> Iterator[List[CardContainer]]:
+        """
+        Traverses paginated results, from the checkpoint's cursor onwards, by clicking "Next".
+        Progress is checkpointed after every page, so a page failing transiently is retried (see self.page_retry_policy)
+        by reloading the last completed page and moving past it again, instead of starting over.
+        :param bulk: A parameter to toggle reading each page's cards in a single evaluation.
+        :param checkpoint: The checkpoint to continue from and update. By default, a new one starting at the first page
+                           (which is loaded first, if the browser is on another page).
+        :param records_only: A parameter to toggle reading the cards without creating their locators (see get_card_records).
+        :return: An iterator of every page's cards, starting after the checkpoint's completed pages.
+        """
+        checkpoint = checkpoint or TraversalCheckpoint(self.first_url)
+        while True:
+            cards = self.page_retry_policy.run(
+                lambda attempt: self.read_next_page(checkpoint, bulk, attempt > 0 or self.page.url != checkpoint.cursor_url, records_only),
+                on_retry=checkpoint.record_retry
+            )
+            # If there is no next page, the traversal is over.
+            if cards is None:
+                checkpoint.finished = True
+                break
+            checkpoint.complete_page(self.page.url, cards)
+            yield cards
+
+    def read_next_page(
+            self,
+            checkpoint : TraversalCheckpoint,
+            bulk : bool,
+            reload : bool,
+            records_only : bool = False
+    ) -> Optional[List[CardContainer]]:
+        """
+        Reads the cards of the page following the checkpoint's last completed page (or its first page, if none was completed).
+        :param checkpoint: The traversal's checkpoint.
+        :param bulk: A parameter to toggle reading each page's cards in a single evaluation.
+        :param reload: A parameter to toggle loading the checkpoint's cursor url first, e.g. after a failed attempt.
+        :param records_only: A parameter to toggle reading the cards without creating their locators (see get_card_records).
+        :return: The page's cards, or None if the last completed page is the last page.
+        """
+        if reload:
+            self.page.goto(checkpoint.cursor_url)
+            self.wait_for_cards()
+
+        if checkpoint.page_count:
+            # If we can move to the next page, we do so. Otherwise, the last completed page was the last one.
+            if not self.next_page_button.is_visible() or self.next_page_button.is_disabled():
+                return None
+            run_and_wait_for_replacement(self.locator, self.next_page_button.click)
+
+        # Wait for the first and last card container locators, and get all visible cards.
+        self.wait_for_cards()
+        return self.get_card_records() if records_only else self.get_card_containers(bulk)
 
+    def iter_payload_pages(self) -> Iterator[List[CardRecord]]:
+        """
+        Traverses paginated results like iter_pages, but reads every page's listings from its search payload
+        instead of scraping its card containers. The current page's payload is embedded in it, and every next page's
+        payload is the search API response its "Next" click triggers.
+        The traversal starts from the first page, which is loaded first if the browser is on another page.
+        :return: An iterator of every page's cards.
+        """
+        if self.page.url != self.first_url:
+            self.goto_first_page()
+        self.page.wait_for_load_state("domcontentloaded")
+        payloads = self.page.evaluate(EMBEDDED_STATE_SCRIPT)["scripts"]
         while True:
-            # Wait for the first and list card container locators.
-            self.locator.first.wait_for(state="visible", timeout=10000)
-            self.locator.last.wait_for(state="visible", timeout=10000)
+            cards = list(iter_payload_cards(payloads))
+            if not cards:
+                raise ValueError(f"No listings found in the search payload of {self.page.url}")
+            yield cards
+
+            if not self.next_page_button.is_visible() or self.next_page_button.is_disabled():
+                break
+            response = run_and_wait_for_response(self.page, self.next_page_button.click,
+                                                 lambda response: SEARCH_API_PATH in response.url)
+            payloads = [response.text()]
+
+    def extract_best_cards_concurrently(
+            self,
+            objectives: Dict[str, Callable[[CardContainer, CardContainer], bool]],
+            print_result : bool,
+            max_tabs : int = 4
+    ) -> Dict[str, str]:
+        """
+        Same as extract_best_cards, but instead of clicking "Next" page after page, loads the result pages
+        found in the pagination bar concurrently, in a bounded pool of tabs sharing this page's context.
+        Every loaded page reveals further pagination links, until no unseen page is left.
+        :param objectives: A dictionary of [objective_name (str) : comparator method].
+        :param print_result: A parameter to toggle printing the result of the method.
+        :param max_tabs: The maximal number of result pages loading at the same time.
+        :return: A dictionary of [objective_name (str) : best card's url (str)].
+        """
+        if max_tabs < 1:
+            raise ValueError(f"Invalid tabs amount: {max_tabs}")
+
+        # The first page is already loaded in our own page, so we read it directly.
+        self.wait_for_cards()
+        self.listings = ListingsTable()
+        page_winners = {name: [] for name in objectives}
+        first_page_cards = self.get_card_containers()
+        self.listings.append_page(first_page_cards, 0)
+        self.collect_page_winners(page_winners, objectives, first_page_cards, page_index=0)
+
+        # Pages are told apart by their number rather than their url, since page 1's own link (e.g. "?page=1")
+        # differs from the url it was loaded from.
+        seen_pages = {1}
+        pending = []
+        for page_number, url in self.get_pagination_links():
+            if page_number not in seen_pages:
+                seen_pages.add(page_number)
+                pending.append((page_number, url))
+
+        tabs = [self.page.context.new_page() for _ in range(min(max_tabs, len(pending)))]
+        try:
+            while pending:
+                batch, pending = pending[:len(tabs)], pending[len(tabs):]
+
+                # Start all navigations of the batch, only waiting for each one to be committed...
+                for tab, (_, url) in zip(tabs, batch):
+                    tab.goto(url, wait_until="commit")
+
+                # ...and only then wait for each one to load, so the batch loads in parallel.
+                for tab, (page_number, url) in zip(tabs, batch):
+                    tab.wait_for_url(url, wait_until="domcontentloaded")
+                    tab_results = ResultsPage(tab, url)
+                    tab_results.wait_for_cards()
+                    tab_cards = tab_results.get_card_containers()
+                    self.listings.append_page(tab_cards, page_number - 1)
+                    self.collect_page_winners(page_winners, objectives, tab_cards, page_number - 1)
+
+                    # Queue every page revealed by this page's pagination bar that we haven't seen yet.
+                    for link_number, link_url in tab_results.get_pagination_links():
+                        if link_number not in seen_pages:
+                            seen_pages.add(link_number)
+                            pending.append((link_number, link_url))
+        finally:
+            for tab in tabs:
+                tab.close()
 
-            # Get all visible card locators
-            card_locators = self.locator.all()
-            card_containers = [CardContainer(locator) for locator in card_locators]
+        return self.report_best_cards(self.merge_page_winners(page_winners, objectives), print_result)
 
+    def wait_for_cards(self) -> None:
+        """
+        Waits for the first and last card containers of the current page to be visible.
+        :return: None
+        """
+        wait_for_visible(self.locator.first, "results grid")
+        wait_for_visible(self.locator.last, "results grid")
+
+    def get_pagination_links(self) -> List[Tuple[int, str]]:
+        """
+        Reads the numbered page links currently shown in the pagination bar.
+        :return: A list of (page_number, absolute_url) tuples.
+        """
+        links = self.pagination_links.evaluate_all("links => links.map(link => [link.textContent.trim(), link.href])")
+        return [(int(text), url) for text, url in links if text.isdigit()]
+
+    @staticmethod
+    def update_best_cards(
+            best: Dict[str, Tuple[CardContainer, int, int]],
+            objectives: Dict[str, Callable[[CardContainer, CardContainer], bool]],
+            card_containers: List[CardContainer],
+            page_index : int
+    ) -> None:
+        """
+        Updates the overall best card of every objective with the best card of a single results page.
+        :param best: A dictionary of [objective_name (str) : (best_card, best_page_index, best_card_index)], updated in place.
+        :param objectives: A dictionary of [objective_name (str) : comparator method].
+        :param card_containers: The cards of the results page.
+        :param page_index: The index of the results page.
+        :return: None
+        """
+        for name, is_better in objectives.items():
             # Get the best card in the current page's list.
             current_best_index = best_card_in_list(card_containers, is_better)
             current_best_card = card_containers[current_best_index]
 
             # If the current page's best card is better than the overall best card, we store its info as the new best card.
+            best_card = best[name][0]
             if best_card is None or is_better(current_best_card, best_card):
-                best_card = current_best_card
-                best_page_index = page_count
-                best_card_index = current_best_index
-                best_result_url = best_card.url
+                best[name] = (current_best_card, page_index, current_best_index)
 
-            # If we can move to the next page, we do so.
-            # Otherwise, we break the loop.
-            if not self.next_page_button.is_visible() or self.next_page_button.is_disabled():
-                break
-            self.next_page_button.click()
-            page_count += 1
+    @staticmethod
+    def collect_page_winners(
+            page_winners: Dict[str, List[Tuple[CardContainer, int, int]]],
+            objectives: Dict[str, Callable[[CardContainer, CardContainer], bool]],
+            card_containers: List[CardContainer],
+            page_index : int
+    ) -> None:
+        """
+        Appends the best card of a single results page to the winners list of every objective.
+        :param page_winners: A dictionary of [objective_name (str) : list of (card, page_index, card_index)], updated in place.
+        :param objectives: A dictionary of [objective_name (str) : comparator method].
+        :param card_containers: The cards of the results page.
+        :param page_index: The index of the results page.
+        :return: None
+        """
+        for name, is_better in objectives.items():
+            current_best_index = best_card_in_list(card_containers, is_better)
+            page_winners[name].append((card_containers[current_best_index], page_index, current_best_index))
 
-        # Print result if requested
+    @staticmethod
+    def merge_page_winners(
+            page_winners: Dict[str, List[Tuple[CardContainer, int, int]]],
+            objectives: Dict[str, Callable[[CardContainer, CardContainer], bool]]
+    ) -> Dict[str, Tuple[CardContainer, int, int]]:
+        """
+        Merges the per-page winners into the overall best card of every objective.
+        Pages may be read in any order, so the winners are merged in page order - resolving ties like a sequential traversal.
+        :param page_winners: A dictionary of [objective_name (str) : list of (card, page_index, card_index)].
+        :param objectives: A dictionary of [objective_name (str) : comparator method].
+        :return: A dictionary of [objective_name (str) : (best_card, best_page_index, best_card_index)].
+        """
+        best = {}
+        for name, is_better in objectives.items():
+            winners = sorted(page_winners[name], key=lambda winner: winner[1])
+            best[name] = winners[best_card_in_list([card for card, _, _ in winners], is_better)]
+        return best
+
+    @staticmethod
+    def report_best_cards(best: Dict[str, Tuple[CardContainer, int, int]], print_result : bool) -> Dict[str, str]:
+        """
+        Optionally prints the best card of every objective, and returns their URLs.
+        :param best: A dictionary of [objective_name (str) : (best_card, best_page_index, best_card_index)].
+        :param print_result: A parameter to toggle printing the results.
+        :return: A dictionary of [objective_name (str) : best card's url (str)].
+        """
         if print_result:
-            print("\nBest Choice Details:")
-            print("Found in page no. " + str(best_page_index + 1) + " at index: " + str(best_card_index + 1))
-            print(best_card.print_card_details())
-            print("Result URL: " + WEBSITE_PREFIX + best_result_url + "\n")
-
-        # Lastly, go back to the first page and return the result
-        self.goto_first_page()
-        return WEBSITE_PREFIX + best_result_url
\ No newline at end of file
+            for name, (best_card, best_page_index, best_card_index) in best.items():
+                print(f"\nBest Choice Details ({name}):")
+                print("Found in page no. " + str(best_page_index + 1) + " at index: " + str(best_card_index + 1))
+                best_card.print_card_details()
+                print("Result URL: " + WEBSITE_PREFIX + best_card.url + "\n")
+
+        return {name: WEBSITE_PREFIX + best_card.url for name, (best_card, _, _) in best.items()}
@@ -0,0 +1,117 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlsplit
+from playwright.sync_api import Browser, BrowserContext, Error, Page
+
+# _________________________ Context Pool Helper Methods _________________________ #
+
+# Restores a page's local storage to its warm items.
+RESET_LOCAL_STORAGE_SCRIPT = """
+(items) => {
+    localStorage.clear();
+    for (const {name, value} of items) localStorage.setItem(name, value);
+}
+"""
+
+
+class ContextPool:
+    """
+    Keeps warm browser contexts, created from a saved storage state (consent cookies, locale, etc.),
+    and hands them out one test at a time.
+    """
+
+    def __init__(
+            self,
+            browser: Browser,
+            context_args: dict,
+            storage_state_path: Path,
+            max_age: float,
+            warm_up: Callable[[Page], None]
+    ):
+        """
+        :param browser: The browser to create the contexts in.
+        :param context_args: The arguments every context is created with.
+        :param storage_state_path: The file of the saved storage state, shared between sessions and xdist workers.
+        :param max_age: The age (in seconds) after which the saved storage state is created again.
+        :param warm_up: A function bringing a fresh page to its warm state (e.g. accepting the cookie banner).
+        """
+        self.browser = browser
+        self.context_args = context_args
+        self.idle_contexts = []
+        self.warm_state = self.load_warm_state(storage_state_path, max_age, warm_up)
+
+    def load_warm_state(self, storage_state_path: Path, max_age: float, warm_up: Callable[[Page], None]) -> dict:
+        """
+        Loads the saved storage state, or creates it (again) if it's missing or too old.
+        :return: The storage state.
+        """
+        if storage_state_path.exists() and time.time() - storage_state_path.stat().st_mtime < max_age:
+            with open(storage_state_path, encoding="utf-8") as state_file:
+                return json.load(state_file)
+
+        context = self.browser.new_context(**self.context_args)
+        try:
+            warm_up(context.new_page())
+            warm_state = context.storage_state()
+        finally:
+            context.close()
+
+        # Written to a temporary file and moved into place, so concurrent xdist workers never read a partial file.
+        storage_state_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = storage_state_path.with_name(f"{storage_state_path.name}.{os.getpid()}.tmp")
+        with open(temporary_path, "w", encoding="utf-8") as state_file:
+            json.dump(warm_state, state_file)
+        os.replace(temporary_path, storage_state_path)
+        return warm_state
+
+    def acquire(self) -> BrowserContext:
+        """
+        :return: An idle warm context, or a new one if none is idle.
+        """
+        if self.idle_contexts:
+            return self.idle_contexts.pop()
+        return self.browser.new_context(**self.context_args, storage_state=self.warm_state)
+
+    def release(self, context: BrowserContext) -> None:
+        """
+        Resets a context to its warm state and returns it to the pool.
+        If the reset fails (e.g. the context was closed), the context is dropped instead.
+        :param context: The context to return.
+        :return: None
+        """
+        try:
+            self.reset(context)
+        except Error:
+            try:
+                context.close()
+            except Error:
+                pass
+            return
+        self.idle_contexts.append(context)
+
+    def reset(self, context: BrowserContext) -> None:
+        """
+        Closes the context's pages, and brings back its warm cookies, local storage, permissions and routes.
+        :param context: The context to reset.
+        :return: None
+        """
+        warm_local_storage = {origin["origin"]: origin["localStorage"] for origin in self.warm_state.get("origins", [])}
+        for page in context.pages:
+            url_parts = urlsplit(page.url)
+            if url_parts.scheme in ("http", "https"):
+                origin = f"{url_parts.scheme}://{url_parts.netloc}"
+                page.evaluate(RESET_LOCAL_STORAGE_SCRIPT, warm_local_storage.get(origin, []))
+            page.close()
+
+        context.unroute_all(behavior="ignoreErrors")
+        context.clear_cookies()
+        context.add_cookies(self.warm_state.get("cookies", []))
+        context.clear_permissions()
+
+    def close(self) -> None:
+        for context in self.idle_contexts:
+            context.close()
+        self.idle_contexts.clear()
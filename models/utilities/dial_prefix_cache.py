@@ -0,0 +1,76 @@
+import json
+import re
+from pathlib import Path
+from typing import Optional
+
+# _____________________ Dial Prefix Cache Helper Methods _____________________ #
+
+# Matches the dial prefix in an option's text, e.g. "Israel (+972)".
+DIAL_PREFIX_PATTERN = re.compile(r"\(\+(\d+)\)")
+
+# Reads the (text, value) pair of every option of a country-code selector in one evaluation.
+DIAL_OPTIONS_SCRIPT = "select => Array.from(select.options).map(option => [option.textContent, option.value])"
+
+# Returns the text of the option holding a given value, or null if there is none.
+DIAL_OPTION_TEXT_SCRIPT = """
+(select, value) => {
+    const option = Array.from(select.options).find(option => option.value === value);
+    return option ? option.textContent : null;
+}
+"""
+
+
+class DialPrefixCache:
+    """
+    A process-wide map of dial prefixes to the values of their country-code options,
+    optionally persisted to a JSON file between sessions.
+    """
+
+    def __init__(self):
+        self.prefix_values = {}   # [prefix (int) : option value (str)]
+        self.path = None
+
+    def persist_to(self, path: Path) -> None:
+        """
+        Loads the cache from a file (if it exists), and saves it there whenever it is rebuilt.
+        :param path: The cache file's path.
+        :return: None
+        """
+        self.path = path
+        if path.exists():
+            with open(path, encoding="utf-8") as cache_file:
+                self.prefix_values = {int(prefix): value for prefix, value in json.load(cache_file).items()}
+
+    def get(self, prefix: int) -> Optional[str]:
+        return self.prefix_values.get(prefix)
+
+    def rebuild(self, options: list[tuple[str, str]]) -> None:
+        """
+        Replaces the cache with the options of a country-code selector.
+        :param options: A list of (option_text, option_value) pairs, in the selector's order.
+        :return: None
+        """
+        self.prefix_values = {}
+        for text, value in options:
+            match = DIAL_PREFIX_PATTERN.search(text)
+            # Several countries may share a prefix (e.g. +1), the selector's first one is kept.
+            if match:
+                self.prefix_values.setdefault(int(match.group(1)), value)
+
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as cache_file:
+                json.dump(self.prefix_values, cache_file)
+
+    @staticmethod
+    def is_valid_option(option_text: Optional[str], prefix: int) -> bool:
+        """
+        Checks that a cached value still points to an option of the desired prefix.
+        :param option_text: The current text of the option holding the cached value (None if it's gone).
+        :param prefix: The desired prefix.
+        :return: True or False
+        """
+        return option_text is not None and f"(+{prefix})" in option_text
+
+# The process-wide cache used by all reservation pages.
+dial_prefix_cache = DialPrefixCache()
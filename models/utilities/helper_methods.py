@@ -1,6 +1,16 @@
 import re
 from playwright.sync_api import Locator, Page
-from datetime import date, datetime
+from datetime import date
+from urllib.parse import parse_qs, quote, urlencode, urlparse
+from models.utilities.text_parsing import (
+    DEFAULT_LOCALE,
+    get_locale_patterns,
+    parse_date_label,
+    parse_price,
+    parse_prices,
+    parse_rating,
+    parse_ratings,
+)
 
 # _________________ General Locator Helper Methods _________________ #
 
@@ -12,34 +22,152 @@ def get_locator_containing(page: Page, attribute : str, text : str) -> Locator:
 RATING_CONTAINED_TEXT = "out of 5 average rating"
 PRICE_CONTAINED_TEXT  = "per night"
 
-def extract_rating_info(locator : Locator) -> tuple[float, int]:
+def extract_rating_info(locator : Locator, locale : str = DEFAULT_LOCALE) -> tuple[float, int]:
     """
     A method to extract rating information from a locator pointing to a card container.
     :param locator: The locator to extract information from.
+    :param locale: The locale the site is shown in.
     :return: The rating and amount of reviewers.
     """
     try:
-        rating_locator = locator.get_by_text(RATING_CONTAINED_TEXT, exact=False)
-        rating_locator.wait_for(state="visible", timeout=2000)    # Small wait window for getting the element
-        text_content = rating_locator.text_content().split(" ")  # Parse the text in the element by " "
-        return float(text_content[0]), int(text_content[-2])     # Return the rating and amount of reviewers
+        # The card itself is already rendered, so a rating that isn't there now is missing - no need to wait for it.
+        rating_locator = locator.get_by_text(get_locale_patterns(locale).format.rating_marker, exact=False)
+        if rating_locator.count() == 0:
+            return 0.0, 0
+        return parse_rating_text(rating_locator.first.text_content(), locale)
     except Exception:
         return 0.0, 0
 
-def extract_price_info(locator : Locator) -> int:
+def extract_price_info(locator : Locator, locale : str = DEFAULT_LOCALE) -> int:
     """
     A method to extract price information from a locator pointing to a card container.
     :param locator: The locator to extract information from.
+    :param locale: The locale the site is shown in.
     :return: The price.
     """
     try:
-        price_locator = locator.get_by_test_id("price-availability-row").get_by_text(PRICE_CONTAINED_TEXT, exact=False)
-        price_locator.wait_for(state="visible", timeout=2000)
-        price_texts = price_locator.text_content().split(" ")  # Get matching text and parse by " "
-        return int(remove_non_alphanumeric_and_dot(price_texts[0]))
+        price_marker = get_locale_patterns(locale).format.price_marker
+        price_locator = locator.get_by_test_id("price-availability-row").get_by_text(price_marker, exact=False)
+        if price_locator.count() == 0:
+            return 10**18
+        return parse_price_text(price_locator.first.text_content(), locale)
     except Exception:
         return 10**18 # Returning big value in case of an exception being thrown.
 
+def parse_rating_text(text: str, locale: str = DEFAULT_LOCALE) -> tuple[float, int]:
+    """
+    Parses a card's rating text, e.g. "4.85 out of 5 average rating, 123 reviews" (see text_parsing.parse_rating).
+    :param text: The rating text.
+    :param locale: The locale the text is written in.
+    :return: The rating and amount of reviewers.
+    """
+    return parse_rating(text, locale)
+
+def parse_price_text(text: str, locale: str = DEFAULT_LOCALE) -> int:
+    """
+    Parses a card's price text, e.g. "$120 per night" (see text_parsing.parse_price).
+    :param text: The price text.
+    :param locale: The locale the text is written in.
+    :return: The price.
+    """
+    return parse_price(text, locale)
+
+# __________________ Bulk Card Extraction Helper Methods __________________ #
+
+# Reads the raw price text, rating text and href of every card matched by a locator in a single evaluation.
+# For each field we keep the deepest element containing the searched text, mirroring get_by_text's matching.
+# Fields that are absent from a card are returned as null right away instead of being waited for.
+CARDS_INFO_SCRIPT = """
+(cards, texts) => {
+    const deepestContaining = (root, text) => {
+        if (!root) return null;
+        const matches = Array.from(root.querySelectorAll('*')).filter(e => e.textContent.includes(text));
+        return matches.length ? matches[matches.length - 1].textContent : null;
+    };
+    return cards.map(card => {
+        const anchor = card.querySelector('a');
+        return {
+            price: deepestContaining(card.querySelector('[data-testid="price-availability-row"]'), texts.price),
+            rating: deepestContaining(card, texts.rating),
+            href: anchor ? anchor.getAttribute('href') : null,
+        };
+    });
+}
+"""
+
+def extract_cards_info(locator : Locator, locale : str = DEFAULT_LOCALE) -> list[dict]:
+    """
+    A method to extract price, rating and url information of all cards a locator points to, in one round trip.
+    :param locator: The locator matching all card containers.
+    :param locale: The locale the site is shown in.
+    :return: A list of records {"price", "rating", "review_amount", "url"}, one per card, in page order.
+             A field that is missing or unparsable in a card is set to None.
+    """
+    locale_format = get_locale_patterns(locale).format
+    raw_cards = locator.evaluate_all(CARDS_INFO_SCRIPT, {"price": locale_format.price_marker, "rating": locale_format.rating_marker})
+    return parse_cards_info(raw_cards, locale)
+
+def parse_cards_info(raw_cards: list[dict], locale : str = DEFAULT_LOCALE) -> list[dict]:
+    """
+    Parses the raw card texts returned by CARDS_INFO_SCRIPT into card records, all prices and ratings at once.
+    :param raw_cards: A list of {"price", "rating", "href"} raw texts, one per card.
+    :param locale: The locale the texts are written in.
+    :return: A list of records {"price", "rating", "review_amount", "url"}, with None for missing fields.
+    """
+    prices = parse_prices([raw_card["price"] for raw_card in raw_cards], locale).values
+    ratings = parse_ratings([raw_card["rating"] for raw_card in raw_cards], locale).values
+    return [
+        {"price": price, "rating": rating[0] if rating else None, "review_amount": rating[1] if rating else None, "url": raw_card["href"]}
+        for raw_card, price, rating in zip(raw_cards, prices, ratings)
+    ]
+
+# ___________________ Search URL Helper Methods ___________________ #
+
+def build_search_url(
+        base_url: str,
+        destination : str,
+        start_date : date,
+        end_date : date,
+        num_of_adults : int = 0,
+        num_of_children : int = 0,
+        num_of_infants : int = 0,
+        num_of_pets : int = 0
+) -> str:
+    """
+    Builds the url of the results page a search bar search would land on, e.g.
+    "https://www.airbnb.com/s/Tel-Aviv~Yafo/homes?query=Tel+Aviv-Yafo&checkin=2025-05-13&checkout=2025-05-14&adults=2...".
+    :param base_url: A url of the site, whose origin (and locale, if any) the search keeps.
+    :param destination: The destination.
+    :param start_date: The check-in date.
+    :param end_date: The check-out date.
+    :param num_of_adults: The number of adults.
+    :param num_of_children: The number of children.
+    :param num_of_infants: The number of infants.
+    :param num_of_pets: The number of pets.
+    :return: The results page's url.
+    """
+    # The same validation the search bar's calendar applies.
+    if not (date.today() <= start_date < end_date):
+        raise ValueError(f"Invalid dates: check-in={start_date}, check-out={end_date}")
+
+    parsed_url = urlparse(base_url)
+    # In the path, the site writes hyphens as "~" and spaces as "-".
+    path_destination = quote(destination.replace("-", "~").replace(" ", "-"), safe="~")
+    query = {
+        "refinement_paths[]": "/homes",
+        "query": destination,
+        "checkin": start_date.isoformat(),
+        "checkout": end_date.isoformat(),
+        "adults": num_of_adults,
+        "children": num_of_children,
+        "infants": num_of_infants,
+        "pets": num_of_pets,
+    }
+    locale = parse_qs(parsed_url.query).get("locale")
+    if locale:
+        query["locale"] = locale[0]
+    return f"{parsed_url.scheme}://{parsed_url.netloc}/s/{path_destination}/homes?{urlencode(query)}"
+
 # ___________________ Results Page Helper Methods ___________________ #
 
 def increment_n_times(button: Locator, n : int) -> None:
@@ -55,30 +183,26 @@ def format_date_range(start: date, end: date) -> str:
     else: # Specify both months
         return f"{start.strftime('%b %d')} - {end.strftime('%b %d')}"
 
-def convert_date_string_format(date_str: str) -> str:
+def format_iso_date(iso_date: str) -> str:
+    """
+    Converts a string from format: "2025-05-12"
+    to format: "5/12/2025"
+    :param iso_date: The date string to convert.
+    :return: Formatted %m/%d/%Y date string, without leading zeros.
+    """
+    date_obj = date.fromisoformat(iso_date)
+    return f"{date_obj.month}/{date_obj.day}/{date_obj.year}"
+
+def convert_date_string_format(date_str: str, locale: str = DEFAULT_LOCALE) -> str:
     """
     Converts a string from format: "12, Monday, May 2025[...]"
     to format: "5/12/2025"
     :param date_str: The date string to convert.
-    :return: Formatted %d/%m/%Y date string.
+    :param locale: The locale the string is written in.
+    :return: Formatted %m/%d/%Y date string, without leading zeros.
     """
-    # Split by commas and
-    parts = date_str.split(" ")
-    day   = remove_non_alphanumeric(parts[0])
-    month = remove_non_alphanumeric(parts[2])
-    year  = remove_non_alphanumeric(parts[3])
-
-    # Construct the full date string
-    cleaned_str = f"{day} {month} {year}"
-
-    # Parse and format
-    date_obj = datetime.strptime(cleaned_str, "%d %B %Y")
-    formatted_date_obj = date_obj.strftime("%m/%d/%Y").replace("/0", "/")
-
-    if formatted_date_obj.startswith('0'):
-        formatted_date_obj = formatted_date_obj[1:]
-
-    return formatted_date_obj
+    date_obj = parse_date_label(date_str, locale)
+    return f"{date_obj.month}/{date_obj.day}/{date_obj.year}"
 
 def remove_non_alphanumeric(text: str) -> str:
     return re.sub(r'[^a-zA-Z0-9]', '', text)
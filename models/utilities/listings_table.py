@@ -0,0 +1,179 @@
+import csv
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+# _______________________ Listings Table Helper Methods _______________________ #
+
+# The table's columns and their types. Missing prices and ratings are stored as NaN.
+COLUMN_TYPES = {
+    "price": np.float64,
+    "rating": np.float64,
+    "review_amount": np.int64,
+    "page": np.int32,
+    "index": np.int32,
+    "url": object,
+}
+
+# The fallback values cards get for a missing price or rating (see CardRecord.from_info).
+MISSING_PRICE = 10**18
+MISSING_RATING = 0.0
+
+
+class ListingsTable:
+    """
+    A columnar table of every card seen while traversing results, one NumPy array per column,
+    so filters, rankings and derived scores run as vectorized queries instead of card after card.
+    """
+
+    def __init__(self, capacity: int = 256):
+        self.size = 0
+        self.columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in COLUMN_TYPES.items()}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """
+        :param name: The column's name.
+        :return: A view of the column's values.
+        """
+        return self.columns[name][:self.size]
+
+    def append_page(self, cards: Sequence, page_index: int) -> None:
+        """
+        Appends every card of a results page, growing the columns by doubling when needed.
+        :param cards: The page's cards (CardRecord or CardContainer), in page order.
+        :param page_index: The index of the results page.
+        :return: None
+        """
+        start, end = self.size, self.size + len(cards)
+        capacity = len(self.columns["url"])
+        if end > capacity:
+            capacity = max(end, capacity * 2)
+            for name, column in self.columns.items():
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:start] = column[:start]
+                self.columns[name] = grown
+
+        prices = np.array([card.price for card in cards], dtype=np.float64)
+        ratings = np.array([card.rating for card in cards], dtype=np.float64)
+        prices[prices >= MISSING_PRICE] = np.nan
+        ratings[ratings == MISSING_RATING] = np.nan
+        self.columns["price"][start:end] = prices
+        self.columns["rating"][start:end] = ratings
+        self.columns["review_amount"][start:end] = [card.review_amount for card in cards]
+        self.columns["page"][start:end] = page_index
+        self.columns["index"][start:end] = np.arange(len(cards))
+        self.columns["url"][start:end] = [card.url for card in cards]
+        self.size = end
+
+    # ____ Query Helper Methods ____ #
+
+    def select(self, rows: np.ndarray) -> "ListingsTable":
+        """
+        :param rows: A boolean mask, or an array of row indices (kept in the given order).
+        :return: A new table of the selected rows.
+        """
+        selected = ListingsTable(capacity=0)
+        selected.columns = {name: self[name][rows] for name in self.columns}
+        selected.size = len(selected.columns["url"])
+        return selected
+
+    def where(
+            self,
+            max_price: Optional[float] = None,
+            min_rating: Optional[float] = None,
+            min_reviews: Optional[int] = None
+    ) -> "ListingsTable":
+        """
+        Filters the table. Rows missing a filtered value never pass its filter.
+        :param max_price: The maximal price.
+        :param min_rating: The minimal rating.
+        :param min_reviews: The minimal amount of reviews.
+        :return: A new table of the matching rows.
+        """
+        mask = np.ones(self.size, dtype=bool)
+        if max_price is not None:
+            mask &= self["price"] <= max_price
+        if min_rating is not None:
+            mask &= self["rating"] >= min_rating
+        if min_reviews is not None:
+            mask &= self["review_amount"] >= min_reviews
+        return self.select(mask)
+
+    def price_per_rating_point(self) -> np.ndarray:
+        """
+        :return: Every row's price divided by its rating (NaN where either is missing).
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self["price"] / self["rating"]
+
+    def rank(self, *keys: Tuple[str, bool]) -> "ListingsTable":
+        """
+        Sorts the table by several columns, rows missing a value coming last. Ties keep the traversal order.
+        :param keys: (column_name, descending) pairs, the first being the primary key,
+                     e.g. rank(("rating", True), ("review_amount", True), ("price", False)).
+        :return: A new, sorted table.
+        """
+        order = np.arange(self.size)
+        # A stable sort by each key, from the last to the primary one, sorts by all of them.
+        for name, descending in reversed(keys):
+            values = self[name][order].astype(np.float64)
+            values = np.where(np.isnan(values), np.inf, -values if descending else values)
+            order = order[np.argsort(values, kind="stable")]
+        return self.select(order)
+
+    def top(self, scores: np.ndarray, k: int, descending: bool = True) -> "ListingsTable":
+        """
+        :param scores: A score for every row (e.g. price_per_rating_point()). Rows scored NaN are never picked.
+        :param k: The amount of rows to pick.
+        :param descending: If True, the highest scores are picked. Otherwise, the lowest.
+        :return: A new table of the K best-scored rows, best first.
+        """
+        keys = np.where(np.isnan(scores), np.inf, -scores if descending else scores)
+        candidates = np.flatnonzero(~np.isnan(scores))
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(keys[candidates], k - 1)[:k]]
+        order = candidates[np.lexsort((candidates, keys[candidates]))]
+        return self.select(order)
+
+    # ____ Export Helper Methods ____ #
+
+    def to_csv(self, path: Path) -> None:
+        """
+        Writes the table to a CSV file, with missing values left empty.
+        :param path: The file's path.
+        :return: None
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="") as table_file:
+            writer = csv.writer(table_file)
+            writer.writerow(self.columns)
+            for row in zip(*(self[name].tolist() for name in self.columns)):
+                writer.writerow(["" if value != value else value for value in row])
+
+    def to_parquet(self, path: Path) -> None:
+        """
+        Writes the table to a Parquet file. Requires pyarrow.
+        :param path: The file's path.
+        :return: None
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ImportError("Exporting to Parquet requires pyarrow (pip install pyarrow)") from error
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays = {name: pa.array(self[name].tolist() if name == "url" else self[name], from_pandas=True)
+                  for name in self.columns}
+        pq.write_table(pa.table(arrays), path)
+
+    def rows(self) -> Iterator[dict]:
+        """
+        :return: An iterator of the table's rows, as dictionaries of [column_name : value].
+        """
+        for row in zip(*(self[name].tolist() for name in self.columns)):
+            yield dict(zip(self.columns, row))
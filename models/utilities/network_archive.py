@@ -0,0 +1,51 @@
+import re
+from pathlib import Path
+from playwright.sync_api import BrowserContext, Route
+
+# ______________________ Network Archive Helper Methods ______________________ #
+
+NETWORK_MODES = ("live", "record", "replay")
+
+def archive_path_for(archive_dir: str, test_id: str) -> Path:
+    """
+    Builds the path of the HAR archive belonging to a test.
+    :param archive_dir: The directory holding all archives.
+    :param test_id: The test's pytest node id.
+    :return: The archive's path.
+    """
+    return Path(archive_dir) / (re.sub(r"[^A-Za-z0-9_.-]+", "_", test_id).strip("_") + ".har")
+
+def record_network(context: BrowserContext, archive_path: Path) -> None:
+    """
+    Records every request of the context (and its response) into a HAR archive.
+    The archive is written once the context is closed.
+    :param context: The browser context to record.
+    :param archive_path: The archive to write.
+    :return: None
+    """
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    context.route_from_har(archive_path, update=True, update_content="embed")
+
+def replay_network(context: BrowserContext, archive_path: Path, strict: bool) -> list[str]:
+    """
+    Serves the context's requests from a HAR archive instead of the network.
+    :param context: The browser context to serve.
+    :param archive_path: The archive recorded by record_network.
+    :param strict: If True, requests missing from the archive are aborted and reported.
+                   Otherwise, they are sent to the network.
+    :return: A list that collects the urls of aborted (unrecorded) requests while the context is used.
+    """
+    if not archive_path.exists():
+        raise FileNotFoundError(f"No network archive at '{archive_path}', record one with --network=record first")
+
+    unrecorded_urls = []
+    if strict:
+        def abort_unrecorded(route: Route) -> None:
+            unrecorded_urls.append(route.request.url)
+            route.abort()
+
+        # Routes are matched from the last registered one, so this handler only gets what the archive falls back on.
+        context.route("**/*", abort_unrecorded)
+
+    context.route_from_har(archive_path, not_found="fallback")
+    return unrecorded_urls
@@ -0,0 +1,140 @@
+import json
+import re
+from typing import Any, Callable, Iterable, Optional
+from urllib.parse import parse_qsl, urlsplit
+from playwright.sync_api import Page
+
+# _________________________ Page State Helper Methods _________________________ #
+
+# The sources page objects can read a booking's details from.
+DETAILS_FROM_UI = "ui"                # Through the page's panels and steppers, as a user sees them.
+DETAILS_FROM_STATE = "state"          # From the page's url and embedded hydration/bootstrap JSON, in a single read.
+DETAILS_CROSS_CHECK = "cross-check"   # From both, asserting they match.
+DETAILS_SOURCES = (DETAILS_FROM_UI, DETAILS_FROM_STATE, DETAILS_CROSS_CHECK)
+
+# Reads the page's url and the text of every embedded JSON script in one evaluation.
+EMBEDDED_STATE_SCRIPT = """
+() => ({
+    url: window.location.href,
+    scripts: Array.from(document.querySelectorAll('script[type="application/json"]')).map(script => script.textContent),
+})
+"""
+
+# The keys each detail may appear under, in the url's query or the embedded JSON, by preference.
+STATE_KEYS = {
+    "check_in": ("check_in", "checkin", "checkIn", "checkInDate"),
+    "check_out": ("check_out", "checkout", "checkOut", "checkOutDate"),
+    "adults": ("adults", "numberOfAdults"),
+    "children": ("children", "numberOfChildren"),
+    "infants": ("infants", "numberOfInfants"),
+    "pets": ("pets", "numberOfPets"),
+}
+
+GUEST_TYPES = ("adults", "children", "infants", "pets")
+
+ISO_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def read_embedded_state(page: Page) -> list[Any]:
+    """
+    Reads the page's url query and embedded JSON documents.
+    :param page: The page.
+    :return: A list of documents: the url's query parameters first, then every parsable embedded JSON document.
+    """
+    raw_state = page.evaluate(EMBEDDED_STATE_SCRIPT)
+    documents = [dict(parse_qsl(urlsplit(raw_state["url"]).query))]
+    for script in raw_state["scripts"]:
+        try:
+            documents.append(json.loads(script))
+        except ValueError:
+            continue
+    return documents
+
+def find_first_values(documents: Iterable[Any], keys: Iterable[str]) -> dict[str, Any]:
+    """
+    Walks the documents (depth-first, in order) once, and collects the first value found under each key.
+    :param documents: The documents to search.
+    :param keys: The keys to look for.
+    :return: A dictionary of [key (str) : first value], holding only the keys that were found.
+    """
+    keys = set(keys)
+    found = {}
+    stack = list(reversed(list(documents)))
+    while stack and len(found) < len(keys):
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in keys and key not in found and not isinstance(value, (dict, list)):
+                    found[key] = value
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return found
+
+def extract_booking_state(documents: list[Any]) -> dict[str, Any]:
+    """
+    Extracts a booking's dates and guests from a page's state documents.
+    Each detail is taken from the first document holding a valid value for it,
+    and all guest amounts are taken from the same document.
+    :param documents: The documents returned by read_embedded_state.
+    :return: A dictionary with "check_in" / "check_out" (ISO date strings) and "guests" ([guest_type : amount]),
+             each set to None if it couldn't be found.
+    """
+    aliases = [alias for detail_keys in STATE_KEYS.values() for alias in detail_keys]
+    is_date = lambda value: isinstance(value, str) and bool(ISO_DATE_PATTERN.match(value))
+    is_amount = lambda value: isinstance(value, int) or (isinstance(value, str) and value.isdigit())
+    state = {"check_in": None, "check_out": None, "guests": None}
+
+    for document in documents:
+        found = find_first_values([document], aliases)
+
+        def first_valid(detail: str, is_valid) -> Optional[Any]:
+            return next((found[alias] for alias in STATE_KEYS[detail] if alias in found and is_valid(found[alias])), None)
+
+        for detail in ("check_in", "check_out"):
+            if state[detail] is None:
+                state[detail] = first_valid(detail, is_date)
+
+        # Only the guest types hosting someone are always written, so the others default to 0 - as long as there are adults.
+        if state["guests"] is None and first_valid("adults", is_amount) is not None:
+            state["guests"] = {guest_type: int(first_valid(guest_type, is_amount) or 0) for guest_type in GUEST_TYPES}
+
+        if all(value is not None for value in state.values()):
+            break
+    return state
+
+def read_booking_state(page: Page) -> dict[str, Any]:
+    """
+    Reads a booking's dates and guests from the page's url and embedded state, in a single round trip.
+    :param page: The page.
+    :return: See extract_booking_state.
+    """
+    return extract_booking_state(read_embedded_state(page))
+
+def assert_details_match(ui_details: tuple, state_details: tuple) -> None:
+    """
+    Asserts that the details read through the UI match the ones read from the page's state.
+    :param ui_details: The (check_in_date, check_out_date, guests, price) read through the UI.
+    :param state_details: The (check_in_date, check_out_date, guests, price) read from the page's state.
+    :return: None
+    """
+    for name, ui_value, state_value in zip(("check-in", "check-out", "guests", "price"), ui_details, state_details):
+        assert ui_value == state_value, f"The {name} read through the UI ({ui_value}) doesn't match the page's state ({state_value})"
+
+def read_details(source: str, read_from_ui: Callable[[], tuple], read_from_state: Callable[[], tuple]) -> tuple:
+    """
+    Reads a page's details from the requested source.
+    :param source: One of DETAILS_SOURCES.
+    :param read_from_ui: A function reading the details through the UI.
+    :param read_from_state: A function reading the details from the page's state.
+    :return: The details.
+    """
+    if source not in DETAILS_SOURCES:
+        raise ValueError(f"Invalid details source: {source}")
+    if source == DETAILS_FROM_UI:
+        return read_from_ui()
+
+    state_details = read_from_state()
+    if source == DETAILS_CROSS_CHECK:
+        assert_details_match(read_from_ui(), state_details)
+    return state_details
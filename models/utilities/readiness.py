@@ -0,0 +1,141 @@
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Union
+from playwright.sync_api import Locator, Page, Response
+
+# ________________________ Readiness Helper Methods ________________________ #
+
+class WaitRecorder:
+    """
+    Accumulates the time spent waiting for readiness signals, per label.
+    """
+
+    def __init__(self):
+        self.totals = {}   # [label (str) : seconds (float)]
+        self.counts = {}   # [label (str) : amount of waits (int)]
+
+    @contextmanager
+    def measure(self, label: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.totals[label] = self.totals.get(label, 0.0) + time.perf_counter() - start
+            self.counts[label] = self.counts.get(label, 0) + 1
+
+    @property
+    def total(self) -> float:
+        return sum(self.totals.values())
+
+    def summary(self) -> list[str]:
+        """
+        :return: One line per label, the longest total wait first.
+        """
+        return [f"{label}: {seconds:.2f}s over {self.counts[label]} waits"
+                for label, seconds in sorted(self.totals.items(), key=lambda item: item[1], reverse=True)]
+
+# The process-wide recorder all readiness helpers report to.
+wait_recorder = WaitRecorder()
+
+# Resolves once no DOM mutation happened for 'quietMs' milliseconds, or rejects after 'timeoutMs' milliseconds.
+DOM_SETTLED_SCRIPT = """
+([quietMs, timeoutMs]) => new Promise((resolve, reject) => {
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(done, quietMs);
+    });
+    const done = () => {
+        observer.disconnect();
+        clearTimeout(timeoutTimer);
+        resolve();
+    };
+    let quietTimer = setTimeout(done, quietMs);
+    const timeoutTimer = setTimeout(() => {
+        observer.disconnect();
+        reject(new Error(`DOM did not settle within ${timeoutMs}ms`));
+    }, timeoutMs);
+    observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true, characterData: true});
+})
+"""
+
+def wait_for_dom_settled(page: Page, quiet_ms: int = 200, timeout: int = 10000) -> None:
+    """
+    Waits until the page's DOM stops changing.
+    :param page: The page.
+    :param quiet_ms: How long the DOM must go without mutations to be considered settled.
+    :param timeout: The maximal time to wait, in milliseconds.
+    :return: None
+    """
+    with wait_recorder.measure("dom settled"):
+        page.evaluate(DOM_SETTLED_SCRIPT, [quiet_ms, timeout])
+
+def wait_for_hidden(locator: Locator, label: str, timeout: int = 10000) -> None:
+    """
+    Waits for an element (e.g. a closing popup or panel) to be hidden or removed.
+    :param locator: The element's locator.
+    :param label: The label the wait is recorded under.
+    :param timeout: The maximal time to wait, in milliseconds.
+    :return: None
+    """
+    with wait_recorder.measure(label):
+        locator.wait_for(state="hidden", timeout=timeout)
+
+def wait_for_visible(locator: Locator, label: str, timeout: int = 10000) -> None:
+    """
+    Waits for an element to be visible.
+    :param locator: The element's locator.
+    :param label: The label the wait is recorded under.
+    :param timeout: The maximal time to wait, in milliseconds.
+    :return: None
+    """
+    with wait_recorder.measure(label):
+        locator.wait_for(state="visible", timeout=timeout)
+
+def run_and_wait_for_url_change(page: Page, action: Callable[[], None], timeout: int = 30000) -> None:
+    """
+    Runs an action and waits until the page's url changes, including client-side (history API) navigations.
+    :param page: The page.
+    :param action: The action causing the navigation.
+    :param timeout: The maximal time to wait, in milliseconds.
+    :return: None
+    """
+    previous_url = page.url
+    action()
+    with wait_recorder.measure("url change"):
+        page.wait_for_url(lambda url: url != previous_url, wait_until="commit", timeout=timeout)
+
+def run_and_wait_for_response(
+        page: Page,
+        action: Callable[[], None],
+        url_or_predicate: Union[str, Callable[[Response], bool]],
+        timeout: int = 30000
+) -> Response:
+    """
+    Runs an action and waits for a specific network response to finish.
+    :param page: The page.
+    :param action: The action triggering the request.
+    :param url_or_predicate: A url glob pattern, or a predicate on the response.
+    :param timeout: The maximal time to wait, in milliseconds.
+    :return: The response.
+    """
+    with wait_recorder.measure("network response"):
+        with page.expect_response(url_or_predicate, timeout=timeout) as response_info:
+            action()
+        response = response_info.value
+        response.finished()
+    return response
+
+def run_and_wait_for_replacement(locator: Locator, action: Callable[[], None], timeout: int = 30000) -> None:
+    """
+    Runs an action and waits until the first element matched by a locator is detached from the DOM,
+    e.g. until a results grid is replaced after moving to another page.
+    :param locator: The locator of the elements to be replaced.
+    :param action: The action replacing them.
+    :param timeout: The maximal time to wait, in milliseconds.
+    :return: None
+    """
+    handle = locator.first.element_handle(timeout=timeout)
+    action()
+    with wait_recorder.measure("content replaced"):
+        locator.page.wait_for_function("element => !element.isConnected", arg=handle, timeout=timeout)
+    handle.dispose()
@@ -0,0 +1,113 @@
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+from playwright.sync_api import BrowserContext, Route
+
+# ______________________ Request Blocking Helper Methods ______________________ #
+
+# Resource types none of the page objects reads from (listing photos, web fonts, map tiles, videos).
+BLOCKED_RESOURCE_TYPES = ("image", "font", "media")
+
+# Hosts (or host suffixes) serving analytics and telemetry beacons.
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "facebook.com",
+    "bat.bing.com",
+    "sentry.io",
+    "datadoghq.com",
+    "browser-intake-datadoghq.com",
+    "hotjar.com",
+    "branch.io",
+)
+
+# Paths of Airbnb's own logging endpoints.
+BLOCKED_PATH_PREFIXES = (
+    "/tracking/",
+    "/api/v2/logging",
+    "/api/v3/logging",
+)
+
+
+class BlockingStats:
+    """
+    Counts the requests a blocking profile dropped, per category.
+    Their sizes aren't reported: blocked requests never reach the network, nor the recorded archives.
+    """
+
+    def __init__(self):
+        self.blocked_requests = {}   # [category (str) : amount (int)]
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.blocked_requests.values())
+
+    def add(self, category: str) -> None:
+        self.blocked_requests[category] = self.blocked_requests.get(category, 0) + 1
+
+    def merge(self, other: "BlockingStats") -> None:
+        for category, amount in other.blocked_requests.items():
+            self.blocked_requests[category] = self.blocked_requests.get(category, 0) + amount
+
+    def summary(self) -> str:
+        per_category = ", ".join(f"{category}: {amount}" for category, amount in sorted(self.blocked_requests.items()))
+        return f"Blocked {self.total_requests} requests ({per_category or 'none'})"
+
+
+class BlockingProfile:
+    """
+    A set of request-dropping rules, applied to a browser context through request routing.
+    Requests that aren't blocked are passed on to any other route of the context (e.g. a replayed archive).
+    """
+
+    def __init__(
+            self,
+            resource_types: Iterable[str] = BLOCKED_RESOURCE_TYPES,
+            hosts: Iterable[str] = BLOCKED_HOSTS,
+            path_prefixes: Iterable[str] = BLOCKED_PATH_PREFIXES
+    ):
+        """
+        :param resource_types: The Playwright resource types to drop.
+        :param hosts: The hosts to drop, matching their sub-domains as well.
+        :param path_prefixes: The url path prefixes to drop, on any host.
+        """
+        self.resource_types = frozenset(resource_types)
+        self.hosts = tuple(hosts)
+        self.path_prefixes = tuple(path_prefixes)
+        self.stats = BlockingStats()
+
+    def apply(self, context: BrowserContext) -> None:
+        """
+        Applies the profile to every page of a browser context.
+        :param context: The browser context.
+        :return: None
+        """
+        context.route("**/*", self.handle_route)
+
+    def get_block_category(self, url: str, resource_type: str) -> Optional[str]:
+        """
+        Checks whether a request should be dropped.
+        :param url: The request's url.
+        :param resource_type: The request's Playwright resource type.
+        :return: The category it is dropped under ("telemetry" or its resource type), or None to let it through.
+        """
+        parts = urlsplit(url)
+        host = parts.hostname or ""
+        if any(host == blocked or host.endswith("." + blocked) for blocked in self.hosts) \
+                or parts.path.startswith(self.path_prefixes):
+            return "telemetry"
+        if resource_type in self.resource_types:
+            return resource_type
+        return None
+
+    def handle_route(self, route: Route) -> None:
+        request = route.request
+        category = self.get_block_category(request.url, request.resource_type)
+        if category is None:
+            route.fallback()
+            return
+
+        self.stats.add(category)
+        route.abort("blockedbyclient")
+
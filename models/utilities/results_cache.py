@@ -0,0 +1,211 @@
+import json
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from models.page_components.card_container import CardRecord
+
+# _______________________ Results Cache Helper Methods _______________________ #
+
+# The query parameters determining a search's results, with their defaults when missing from the url.
+SEARCH_KEY_PARAMS = {
+    "query": "",
+    "checkin": "",
+    "checkout": "",
+    "adults": "0",
+    "children": "0",
+    "infants": "0",
+    "pets": "0",
+    "currency": "",
+    "locale": "",
+}
+
+DEFAULT_TTL = 60 * 60          # seconds
+DEFAULT_MAX_ENTRIES = 2000
+
+# The entry marking a search's pages as fully traversed, holding their amount.
+PAGE_COUNT_ENTRY = "page_count"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    search_key  TEXT NOT NULL,
+    entry       TEXT NOT NULL,
+    value       TEXT NOT NULL,
+    created_at  REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (search_key, entry)
+)
+"""
+
+
+def search_key_from_url(url: str) -> str:
+    """
+    Normalizes a results page's url into the parameters that determine its search,
+    ignoring session, tracking and pagination parameters.
+    :param url: The results page's url.
+    :return: The search key, e.g. "query=tel aviv-yafo&checkin=2025-05-13&...".
+    """
+    params = parse_qs(urlparse(url).query)
+    values = {}
+    for name, default in SEARCH_KEY_PARAMS.items():
+        value = params.get(name, [default])[0]
+        values[name] = re.sub(r"\s+", " ", value).strip().casefold()
+    return "&".join(f"{name}={value}" for name, value in values.items())
+
+def dump_card(card: CardRecord) -> list:
+    return [card.price, card.rating, card.review_amount, card.url]
+
+def load_card(values: list) -> CardRecord:
+    return CardRecord(*values)
+
+
+class ResultsCache:
+    """
+    A process-wide, on-disk cache of the cards and rankings extracted from search results,
+    keyed by the normalized search and the page index. Entries expire after a TTL, and the least
+    recently used ones are evicted beyond a maximal amount. The cache is disabled until persist_to is called.
+    """
+
+    def __init__(self):
+        self.connection = None
+        self.ttl = DEFAULT_TTL
+        self.max_entries = DEFAULT_MAX_ENTRIES
+        self.bypassed = False
+        self.hits = 0
+        self.misses = 0
+
+    def persist_to(self, path: Path, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Opens (or creates) the cache's database. It may be shared by several processes, e.g. pytest-xdist workers.
+        :param path: The database file's path.
+        :param ttl: The amount of seconds an entry stays valid.
+        :param max_entries: The maximal amount of entries kept.
+        :return: None
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(SCHEMA)
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    @property
+    def enabled(self) -> bool:
+        return self.connection is not None and not self.bypassed
+
+    @contextmanager
+    def bypass(self):
+        """
+        Disables the cache within the block, for code that must read the live UI.
+        """
+        bypassed, self.bypassed = self.bypassed, True
+        try:
+            yield
+        finally:
+            self.bypassed = bypassed
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    # ____ Cards Helper Methods ____ #
+
+    def get_pages(self, search_key: str) -> Optional[List[List[CardRecord]]]:
+        """
+        :param search_key: The search's key (see search_key_from_url).
+        :return: The cards of every page of the search, or None unless all of them are cached.
+        """
+        page_count = self.get(search_key, PAGE_COUNT_ENTRY)
+        if page_count is None:
+            return None
+        pages = []
+        for page_index in range(page_count):
+            cards = self.get(search_key, f"page:{page_index}")
+            if cards is None:
+                return None
+            pages.append([load_card(values) for values in cards])
+        return pages
+
+    def record_pages(self, search_key: str, pages: Iterable[List[CardRecord]]) -> Iterator[List[CardRecord]]:
+        """
+        Passes a search's pages through, caching each page's cards as it goes,
+        and marks the search as complete once the last page was read.
+        :param search_key: The search's key (see search_key_from_url).
+        :param pages: An iterable of every page's cards.
+        :return: An iterator of the same pages.
+        """
+        page_count = 0
+        for page_index, cards in enumerate(pages):
+            self.put(search_key, f"page:{page_index}", [dump_card(card) for card in cards])
+            page_count = page_index + 1
+            yield cards
+        self.put(search_key, PAGE_COUNT_ENTRY, page_count)
+
+    # ____ Rankings Helper Methods ____ #
+
+    def get_ranking(self, search_key: str, objective_names: Iterable[str]) -> Optional[Dict[str, Tuple[CardRecord, int, int]]]:
+        """
+        :param search_key: The search's key (see search_key_from_url).
+        :param objective_names: The names of the ranking objectives.
+        :return: A dictionary of [objective_name (str) : (best_card, best_page_index, best_card_index)], or None.
+        """
+        ranking = self.get(search_key, "ranking:" + ",".join(sorted(objective_names)))
+        if ranking is None:
+            return None
+        return {name: (load_card(card), page_index, card_index) for name, (card, page_index, card_index) in ranking.items()}
+
+    def put_ranking(self, search_key: str, best: Dict[str, Tuple[CardRecord, int, int]]) -> None:
+        """
+        :param search_key: The search's key (see search_key_from_url).
+        :param best: A dictionary of [objective_name (str) : (best_card, best_page_index, best_card_index)].
+        :return: None
+        """
+        ranking = {name: (dump_card(card), page_index, card_index) for name, (card, page_index, card_index) in best.items()}
+        self.put(search_key, "ranking:" + ",".join(sorted(best)), ranking)
+
+    # ____ Storage Helper Methods ____ #
+
+    def get(self, search_key: str, entry: str):
+        """
+        :return: The entry's value, or None if it's missing, expired, or the cache is disabled.
+        """
+        if not self.enabled:
+            return None
+        now = time.time()
+        row = self.connection.execute(
+            "SELECT value, created_at FROM results WHERE search_key = ? AND entry = ?", (search_key, entry)
+        ).fetchone()
+        if row is None or now - row[1] > self.ttl:
+            self.misses += 1
+            return None
+        self.connection.execute(
+            "UPDATE results SET accessed_at = ? WHERE search_key = ? AND entry = ?", (now, search_key, entry)
+        )
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, search_key: str, entry: str, value) -> None:
+        """
+        Stores an entry, then drops the expired entries and the least recently used ones beyond max_entries.
+        :return: None
+        """
+        if not self.enabled:
+            return
+        now = time.time()
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)", (search_key, entry, json.dumps(value), now, now)
+            )
+            self.connection.execute("DELETE FROM results WHERE created_at < ?", (now - self.ttl,))
+            self.connection.execute(
+                "DELETE FROM results WHERE rowid IN "
+                "(SELECT rowid FROM results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)", (self.max_entries,)
+            )
+
+# The process-wide cache used by all results pages.
+results_cache = ResultsCache()
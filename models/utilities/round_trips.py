@@ -0,0 +1,121 @@
+import functools
+import inspect
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+from playwright._impl._connection import Connection
+from models.utilities.step_tracing import iterate_in_scope
+
+# _________________________ Round Trip Helper Methods _________________________ #
+
+# Protocol objects whose messages are sent by request-routing handlers (blocking, replay), not by the code under test.
+# Their amount depends on the page's network activity, so they are left out to keep the counts deterministic.
+UNCOUNTED_OBJECT_TYPES = frozenset({"Route", "WebSocketRoute"})
+
+
+class RoundTripBudgetExceeded(AssertionError):
+    pass
+
+
+class RoundTripCounter:
+    """
+    Counts the Playwright protocol calls sent to the browser driver, in total and per page-object method.
+    A method's count includes the calls of the methods it calls.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.per_method = {}        # [method_name (str) : protocol calls (int)]
+        self.method_calls = {}      # [method_name (str) : invocations (int)]
+        self.per_test = {}          # [test_id (str) : protocol calls (int)]
+        self._scopes = []
+
+    def record(self, object_type: str) -> None:
+        if object_type in UNCOUNTED_OBJECT_TYPES:
+            return
+        self.total += 1
+        # A recursive method is counted once per call.
+        for name in set(self._scopes):
+            self.per_method[name] += 1
+
+    @contextmanager
+    def scope(self, name: str, resumed: bool = False) -> Iterator[None]:
+        """
+        Attributes the protocol calls made inside the block to a method.
+        :param name: The method's name.
+        :param resumed: Whether the block continues an earlier invocation (a generator resumed for its next item).
+        """
+        self.per_method.setdefault(name, 0)
+        if not resumed:
+            self.method_calls[name] = self.method_calls.get(name, 0) + 1
+        self._scopes.append(name)
+        try:
+            yield
+        finally:
+            self._scopes.pop()
+
+    def busiest_methods(self, top: int = 15) -> list[tuple[str, int, int]]:
+        """
+        :param top: The amount of methods to return.
+        :return: A list of (method_name, protocol_calls, invocations), the most protocol calls first.
+        """
+        methods = [(name, calls, self.method_calls[name]) for name, calls in self.per_method.items()]
+        return sorted(methods, key=lambda method: method[1], reverse=True)[:top]
+
+# The process-wide counter all protocol calls are reported to.
+round_trip_counter = RoundTripCounter()
+
+_original_send_message_to_server: Optional[Callable] = None
+
+def enable_round_trip_counting() -> None:
+    """
+    Starts counting every message sent to the Playwright driver. Calling it again has no effect.
+    :return: None
+    """
+    global _original_send_message_to_server
+    if _original_send_message_to_server is not None:
+        return
+    _original_send_message_to_server = Connection._send_message_to_server
+
+    @functools.wraps(_original_send_message_to_server)
+    def counted_send_message_to_server(self, object, *args, **kwargs):
+        round_trip_counter.record(object._type)
+        return _original_send_message_to_server(self, object, *args, **kwargs)
+
+    Connection._send_message_to_server = counted_send_message_to_server
+
+def count_method(function: Callable, name: str) -> Callable:
+    """
+    Wraps a function so the protocol calls made during each call are attributed to it.
+    A generator function is attributed the calls made while it is iterated (see iterate_in_scope).
+    :param function: The function to wrap.
+    :param name: The name calls are attributed to.
+    :return: The wrapped function.
+    """
+    if inspect.isgeneratorfunction(inspect.unwrap(function)):
+        @functools.wraps(function)
+        def counted_generator(*args, **kwargs):
+            return iterate_in_scope(function(*args, **kwargs), lambda resumed: round_trip_counter.scope(name, resumed))
+
+        return counted_generator
+
+    @functools.wraps(function)
+    def counted(*args, **kwargs):
+        with round_trip_counter.scope(name):
+            return function(*args, **kwargs)
+
+    return counted
+
+@contextmanager
+def round_trip_budget(max_calls: int, label: str = "block") -> Iterator[None]:
+    """
+    Fails if the code inside the block makes more than max_calls Playwright protocol calls.
+    :param max_calls: The budget.
+    :param label: A description of the block, used in the failure message.
+    :return: None
+    """
+    enable_round_trip_counting()
+    start = round_trip_counter.total
+    yield
+    used = round_trip_counter.total - start
+    if used > max_calls:
+        raise RoundTripBudgetExceeded(f"{label} made {used} Playwright calls, over its budget of {max_calls}")
@@ -0,0 +1,124 @@
+import csv
+import json
+import re
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+
+# ___________________________ Scenario Helper Methods ___________________________ #
+
+# A date relative to the day the tests run, e.g. "today" or "today+3".
+RELATIVE_DATE_PATTERN = re.compile(r"^today\s*(?:([+-])\s*(\d+))?$")
+
+
+class Scenario(NamedTuple):
+    destination: str
+    start_date: date
+    end_date: date
+    adults: int
+    children: int
+    infants: int
+    pets: int
+    prefix: int
+    phone: int
+
+    @property
+    def search_key(self) -> tuple:
+        """
+        :return: The part of the scenario that determines the search and its results.
+        """
+        return self[:7]
+
+    @property
+    def search_id(self) -> str:
+        return f"{self.destination}-{self.start_date}-{self.end_date}-{self.adults}-{self.children}-{self.infants}-{self.pets}"
+
+
+def parse_scenario_date(text: str) -> date:
+    """
+    Parses a scenario's date, given as an ISO date ("2025-05-13") or relative to today ("today", "today+1").
+    :param text: The date's text.
+    :return: The date.
+    """
+    match = RELATIVE_DATE_PATTERN.match(text.strip())
+    if not match:
+        return date.fromisoformat(text.strip())
+    sign, days = match.groups()
+    offset = int(days or 0)
+    return date.today() + timedelta(days=-offset if sign == "-" else offset)
+
+def parse_scenario(row: dict[str, Any]) -> Scenario:
+    """
+    Builds a scenario from a row of a scenarios file.
+    :param row: A dictionary holding every Scenario field by name.
+    :return: The scenario.
+    """
+    return Scenario(
+        destination=row["destination"],
+        start_date=parse_scenario_date(str(row["start_date"])),
+        end_date=parse_scenario_date(str(row["end_date"])),
+        adults=int(row.get("adults") or 0),
+        children=int(row.get("children") or 0),
+        infants=int(row.get("infants") or 0),
+        pets=int(row.get("pets") or 0),
+        prefix=int(row["prefix"]),
+        phone=int(row["phone"]),
+    )
+
+def iter_scenarios(path: Path) -> Iterator[Scenario]:
+    """
+    Streams the scenarios of a CSV (with a header row) or JSONL file, one row at a time.
+    :param path: The file's path.
+    :return: An iterator of scenarios.
+    """
+    with open(path, encoding="utf-8", newline="") as scenarios_file:
+        if path.suffix == ".jsonl":
+            rows = (json.loads(line) for line in scenarios_file if line.strip())
+        elif path.suffix == ".csv":
+            rows = csv.DictReader(line for line in scenarios_file if not line.lstrip().startswith("#"))
+        else:
+            raise ValueError(f"Unsupported scenarios file: {path}")
+        for row in rows:
+            yield parse_scenario(row)
+
+def group_by_search(scenarios: Iterable[Scenario]) -> dict[tuple, list[Scenario]]:
+    """
+    Groups scenarios sharing the same search, keeping the order in which each search first appears.
+    :param scenarios: The scenarios.
+    :return: A dictionary of [search_key (tuple) : scenarios (list)].
+    """
+    groups = {}
+    for scenario in scenarios:
+        groups.setdefault(scenario.search_key, []).append(scenario)
+    return groups
+
+def load_scenarios(paths: Iterable[Path]) -> list[Scenario]:
+    """
+    Loads the scenarios of several files, ordered so that scenarios sharing a search are adjacent.
+    :param paths: The files' paths.
+    :return: The scenarios.
+    """
+    scenarios = (scenario for path in paths for scenario in iter_scenarios(path))
+    return [scenario for group in group_by_search(scenarios).values() for scenario in group]
+
+
+class SharedSearchResults:
+    """
+    Computes the results of each distinct search once, and shares them with every test of the session depending on it.
+    """
+
+    def __init__(self):
+        self.results = {}   # [search_key (tuple) : results]
+        self.hits = 0
+
+    def get(self, search_key: tuple, compute: Callable[[], Any]) -> Any:
+        """
+        :param search_key: The search's key (see Scenario.search_key).
+        :param compute: A function running the search, called only if it wasn't run yet.
+        :return: The search's results.
+        """
+        if search_key in self.results:
+            self.hits += 1
+        else:
+            self.results[search_key] = compute()
+        return self.results[search_key]
@@ -0,0 +1,128 @@
+import base64
+import json
+import re
+from typing import Any, Iterator, Optional
+from models.page_components.card_container import CardRecord
+from models.utilities.text_parsing import DEFAULT_LOCALE, PriceParseError, parse_price
+
+# _______________________ Search Payload Helper Methods _______________________ #
+
+# The search API answering every results page after the first one (which is embedded in the page itself).
+SEARCH_API_PATH = "/api/v3/StaysSearch"
+
+# The start of a search results array, in the API response as well as in the embedded page state.
+SEARCH_RESULTS_PATTERN = re.compile(r'"searchResults"\s*:\s*\[')
+
+# A rating label holds the rating first and the amount of reviews in parentheses, e.g. "4.85 (123)" or "4,85 (123)".
+RATING_LABEL_PATTERN = re.compile(r"(\d+(?:[.,]\d+)?)\s*\((\d[\d.,\s]*)\)")
+
+_decoder = json.JSONDecoder()
+
+
+def iter_search_results(payload: str) -> Iterator[dict]:
+    """
+    Lazily decodes the items of every search results array in a JSON payload, one item at a time,
+    without decoding the rest of the payload.
+    :param payload: The raw JSON text.
+    :return: An iterator of the decoded result items, in payload order.
+    """
+    for match in SEARCH_RESULTS_PATTERN.finditer(payload):
+        index = match.end()
+        while True:
+            # Skip the whitespace and commas between items, until the array ends.
+            while index < len(payload) and payload[index] in " \t\r\n,":
+                index += 1
+            if index >= len(payload) or payload[index] == "]":
+                break
+            item, index = _decoder.raw_decode(payload, index)
+            if isinstance(item, dict):
+                yield item
+
+def get_listing_id(item: dict) -> Optional[str]:
+    """
+    Extracts a search result's listing id. Ids may be plain numbers, or base64 of "<Type>:<number>".
+    :param item: The decoded search result item.
+    :return: The listing id, or None if the item isn't a listing.
+    """
+    listing = item.get("listing") or item.get("demandStayListing") or {}
+    listing_id = str(listing.get("id") or "")
+    if listing_id.isdigit():
+        return listing_id
+    try:
+        decoded_id = base64.b64decode(listing_id, validate=True).decode().rsplit(":", 1)[-1]
+    except ValueError:
+        return None
+    return decoded_id if decoded_id.isdigit() else None
+
+def parse_rating_label(label: Optional[str]) -> tuple[Optional[float], Optional[int]]:
+    """
+    Parses a rating label such as "4.85 (123)". Labels of unrated listings (e.g. "New") have no rating.
+    :param label: The label.
+    :return: The rating and amount of reviewers, or (None, None) if there is no rating.
+    """
+    match = RATING_LABEL_PATTERN.search(label or "")
+    if not match:
+        return None, None
+    return float(match.group(1).replace(",", ".")), int(re.sub(r"\D", "", match.group(2)))
+
+def parse_display_price(price: Optional[str], locale: str = DEFAULT_LOCALE) -> Optional[int]:
+    """
+    Parses a displayed price such as "$1,234.56" or "1.234,50 €", in whole currency units (see text_parsing.parse_price).
+    :param price: The displayed price.
+    :param locale: The locale the price is written in.
+    :return: The price, or None if there is none.
+    """
+    try:
+        return parse_price(price, locale) if price else None
+    except PriceParseError:
+        return None
+
+def find_value(node: Any, key: str) -> Optional[Any]:
+    """
+    Finds the first value under a key in a decoded JSON item (depth-first).
+    :param node: The decoded JSON item.
+    :param key: The key.
+    :return: The value, or None if the key is absent.
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if key in node and node[key] is not None:
+                return node[key]
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return None
+
+def parse_search_result(item: dict, locale: str = DEFAULT_LOCALE) -> Optional[CardRecord]:
+    """
+    Builds a card from a single search result item.
+    :param item: The decoded search result item.
+    :param locale: The locale the item's texts are written in.
+    :return: The card, or None if the item isn't a listing.
+    """
+    listing_id = get_listing_id(item)
+    if listing_id is None:
+        return None
+
+    rating, review_amount = parse_rating_label(find_value(item, "avgRatingLocalized"))
+    primary_line = find_value(item, "primaryLine") or {}
+    price = parse_display_price(primary_line.get("discountedPrice") or primary_line.get("price"), locale)
+    return CardRecord.from_info({"price": price, "rating": rating, "review_amount": review_amount, "url": f"/rooms/{listing_id}"})
+
+def iter_payload_cards(payloads: Iterator[str], locale: str = DEFAULT_LOCALE) -> Iterator[CardRecord]:
+    """
+    Yields the listing cards of a stream of payloads as soon as each of them is decoded.
+    Listings appearing more than once (e.g. also in a map section) are yielded once.
+    :param payloads: The raw JSON payloads, e.g. the scripts embedded in a page or the API's responses.
+    :param locale: The locale the payloads' texts are written in.
+    :return: An iterator of cards.
+    """
+    seen_urls = set()
+    for payload in payloads:
+        for item in iter_search_results(payload):
+            card = parse_search_result(item, locale)
+            if card is not None and card.url not in seen_urls:
+                seen_urls.add(card.url)
+                yield card
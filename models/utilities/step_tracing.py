@@ -0,0 +1,159 @@
+import functools
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, ContextManager, Generator, Iterable, Iterator
+
+# _________________________ Step Tracing Helper Methods _________________________ #
+
+# The packages whose classes' public methods are traced.
+TRACED_PACKAGES = ("models.page_objects", "models.page_components")
+
+
+class StepTracer:
+    """
+    Collects nested timing spans, and exports them as Chrome trace events (chrome://tracing, Perfetto).
+    """
+
+    def __init__(self):
+        self.events = []
+        self.start = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, category: str = "step", resumed: bool = False) -> Iterator[None]:
+        """
+        Records the time spent inside the block as a span.
+        :param name: The span's name.
+        :param category: The span's category.
+        :param resumed: Whether the span continues an earlier call (a generator resumed for its next item),
+                        in which case it adds to the call's time but isn't counted as another call.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self.start) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": {"resumed": resumed},
+            })
+
+    def export_chrome_trace(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, trace_file)
+
+    def slowest_steps(self, top: int = 15, category: str = "step") -> list[tuple[str, float, int, float]]:
+        """
+        Aggregates the spans of a category by name.
+        :param top: The amount of steps to return.
+        :param category: The spans' category.
+        :return: A list of (name, total_seconds, calls, max_seconds), the largest total first.
+                 A generator's time is the sum of its resumptions, and its max is its longest resumption.
+        """
+        totals = {}
+        for event in self.events:
+            if event["cat"] != category:
+                continue
+            total, calls, longest = totals.get(event["name"], (0.0, 0, 0.0))
+            duration = event["dur"] / 1e6
+            is_new_call = not event.get("args", {}).get("resumed")
+            totals[event["name"]] = (total + duration, calls + is_new_call, max(longest, duration))
+        steps = [(name, total, calls, longest) for name, (total, calls, longest) in totals.items()]
+        return sorted(steps, key=lambda step: step[1], reverse=True)[:top]
+
+# The process-wide tracer all traced methods report to.
+step_tracer = StepTracer()
+
+
+def iterate_in_scope(generator: Generator, enter: Callable[[bool], ContextManager]) -> Generator:
+    """
+    Runs every resumption of a generator inside its own scope, so only the generator's own work is inside it -
+    not the consumer's work between items, which keeps the scopes of generators and other methods properly nested.
+    :param generator: The generator.
+    :param enter: A function taking whether this is a resumption (False for the first one) and returning the scope.
+    :return: A generator yielding the same items.
+    """
+    resumed = False
+    try:
+        while True:
+            with enter(resumed):
+                try:
+                    item = next(generator)
+                except StopIteration as stop:
+                    return stop.value
+            resumed = True
+            yield item
+    finally:
+        generator.close()
+
+def trace_method(function: Callable, name: str) -> Callable:
+    """
+    Wraps a function so each call is recorded as a span.
+    A generator function's span covers its iteration, one span per resumption (see iterate_in_scope).
+    :param function: The function to wrap.
+    :param name: The span's name.
+    :return: The wrapped function.
+    """
+    if inspect.isgeneratorfunction(inspect.unwrap(function)):
+        @functools.wraps(function)
+        def traced_generator(*args, **kwargs):
+            return iterate_in_scope(function(*args, **kwargs), lambda resumed: step_tracer.span(name, resumed=resumed))
+
+        return traced_generator
+
+    @functools.wraps(function)
+    def traced(*args, **kwargs):
+        with step_tracer.span(name):
+            return function(*args, **kwargs)
+
+    return traced
+
+def iter_traced_classes(packages: Iterable[str] = TRACED_PACKAGES) -> Iterator[type]:
+    """
+    Imports every module of the given packages, and yields the classes defined in them.
+    :param packages: The packages' dotted names.
+    :return: An iterator of classes.
+    """
+    for package_name in packages:
+        package = importlib.import_module(package_name)
+        for module_info in pkgutil.walk_packages(package.__path__, package_name + "."):
+            module = importlib.import_module(module_info.name)
+            for _, cls in inspect.getmembers(module, inspect.isclass):
+                if cls.__module__ == module.__name__:
+                    yield cls
+
+def instrument_classes(classes: Iterable[type], wrapper: Callable[[Callable, str], Callable] = trace_method) -> None:
+    """
+    Replaces the public methods defined in each class with wrapped versions. Classes are only changed here,
+    so nothing is wrapped - and nothing costs anything - unless instrumentation is enabled.
+    :param classes: The classes to instrument.
+    :param wrapper: A function taking (method, "Class.method") and returning the wrapped method.
+                    Methods already wrapped by the same wrapper are left as they are.
+    :return: None
+    """
+    for cls in classes:
+        for name, attribute in list(vars(cls).items()):
+            if name.startswith("_"):
+                continue
+            is_static = isinstance(attribute, staticmethod)
+            function = attribute.__func__ if is_static else attribute
+            applied = getattr(function, "__instrumented_by__", frozenset())
+            if not inspect.isfunction(function) or wrapper.__name__ in applied:
+                continue
+
+            wrapped = wrapper(function, f"{cls.__name__}.{name}")
+            wrapped.__instrumented_by__ = applied | {wrapper.__name__}
+            setattr(cls, name, staticmethod(wrapped) if is_static else wrapped)
@@ -0,0 +1,83 @@
+import heapq
+import json
+import os
+import re
+from pathlib import Path
+from typing import Callable, Hashable, Iterable, List, Sequence, TypeVar
+
+# ______________________ Test Duration Helper Methods ______________________ #
+
+T = TypeVar("T")
+
+# The predicted duration (in seconds) of a test no run has timed yet, nor any other parametrization of it.
+DEFAULT_DURATION = 30.0
+
+# How much a new run's duration weighs against the recorded history (an exponential moving average).
+NEW_RUN_WEIGHT = 0.5
+
+# The parametrization of a test id, e.g. "[Tel Aviv-Yafo-...-chromium]".
+PARAMETERS_PATTERN = re.compile(r"\[.*\]$")
+
+
+class DurationStore:
+    """
+    The recorded duration of every test (setup, call and teardown), persisted to a JSON file between runs.
+    Tests that were never timed are predicted from the other parametrizations of the same test function.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.durations = {}   # [test id (str) : seconds (float)]
+        if path.exists():
+            with open(path, encoding="utf-8") as store_file:
+                self.durations = json.load(store_file)
+
+    def predict(self, test_id: str) -> float:
+        """
+        :param test_id: The test's id, e.g. "tests/tests.py::test_case_1[...]".
+        :return: The test's predicted duration, in seconds.
+        """
+        if test_id in self.durations:
+            return self.durations[test_id]
+        function_id = PARAMETERS_PATTERN.sub("", test_id)
+        siblings = [duration for other_id, duration in self.durations.items() if PARAMETERS_PATTERN.sub("", other_id) == function_id]
+        return sum(siblings) / len(siblings) if siblings else DEFAULT_DURATION
+
+    def record(self, test_id: str, duration: float) -> None:
+        previous = self.durations.get(test_id)
+        self.durations[test_id] = duration if previous is None else NEW_RUN_WEIGHT * duration + (1 - NEW_RUN_WEIGHT) * previous
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as store_file:
+            json.dump(self.durations, store_file, indent=1, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+def order_longest_first(items: Sequence[T], predict: Callable[[T], float], group_of: Callable[[T], Hashable]) -> List[T]:
+    """
+    Orders items longest-first, so the last items a worker picks up are the shortest ones.
+    Items of the same group (e.g. an xdist_group) are kept together and in their original order,
+    and groups are ordered by their total predicted duration.
+    :param items: The items, in their original order.
+    :param predict: A method predicting an item's duration.
+    :param group_of: A method returning an item's group.
+    :return: The ordered items.
+    """
+    groups = {}
+    for item in items:
+        groups.setdefault(group_of(item), []).append(item)
+    ordered_groups = sorted(groups.values(), key=lambda group: sum(predict(item) for item in group), reverse=True)
+    return [item for group in ordered_groups for item in group]
+
+def predict_makespan(durations: Iterable[float], workers: int) -> float:
+    """
+    Predicts how long running tests in the given order takes, with every test going to the first idle worker.
+    :param durations: The tests' durations, in the order they are handed out.
+    :param workers: The amount of workers.
+    :return: The predicted makespan, in seconds.
+    """
+    loads = [0.0] * max(workers, 1)
+    for duration in durations:
+        heapq.heapreplace(loads, loads[0] + duration)
+    return max(loads)
@@ -0,0 +1,209 @@
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Callable, Iterable, NamedTuple, Optional, TypeVar
+
+# ____________________________ Parse Errors ____________________________ #
+
+
+class ParseError(ValueError):
+    """
+    Raised when a text scraped from the site doesn't match the format expected for the locale.
+    """
+
+    def __init__(self, kind: str, text: str, locale: str):
+        super().__init__(f"Unparsable {kind} text for locale '{locale}': {text!r}")
+        self.text = text
+        self.locale = locale
+
+class PriceParseError(ParseError):
+    def __init__(self, text: str, locale: str):
+        super().__init__("price", text, locale)
+
+class RatingParseError(ParseError):
+    def __init__(self, text: str, locale: str):
+        super().__init__("rating", text, locale)
+
+class DateParseError(ParseError):
+    def __init__(self, text: str, locale: str):
+        super().__init__("date", text, locale)
+
+# _________________________ Locale Format Helper Methods _________________________ #
+
+
+class LocaleFormat(NamedTuple):
+    decimal_separator: str
+    group_separators: str
+    price_marker: str           # The text every card's price contains, e.g. "per night".
+    rating_marker: str          # The text every card's rating contains, e.g. "out of 5 average rating".
+    month_names: tuple          # The 12 month names, in calendar order.
+
+    @property
+    def amount_pattern(self) -> str:
+        return rf"\d[\d{re.escape(self.group_separators)}]*(?:{re.escape(self.decimal_separator)}\d+)?"
+
+
+LOCALE_FORMATS = {
+    "en": LocaleFormat(".", ",", "per night", "out of 5 average rating", (
+        "January", "February", "March", "April", "May", "June",
+        "July", "August", "September", "October", "November", "December")),
+    "de": LocaleFormat(",", ".", "pro Nacht", "von 5", (
+        "Januar", "Februar", "März", "April", "Mai", "Juni",
+        "Juli", "August", "September", "Oktober", "November", "Dezember")),
+    "fr": LocaleFormat(",", "   ", "par nuit", "sur 5", (
+        "janvier", "février", "mars", "avril", "mai", "juin",
+        "juillet", "août", "septembre", "octobre", "novembre", "décembre")),
+}
+
+DEFAULT_LOCALE = "en"
+
+
+class LocalePatterns(NamedTuple):
+    format: LocaleFormat
+    price: re.Pattern
+    rating: re.Pattern
+    date: re.Pattern
+    months: dict       # [lower-cased month name : month number]
+
+
+def register_locale_format(locale: str, locale_format: LocaleFormat) -> None:
+    """
+    Adds (or replaces) the format of a locale, so its texts can be parsed without changing the helpers.
+    :param locale: The locale's name, e.g. "it".
+    :param locale_format: The locale's format.
+    :return: None
+    """
+    LOCALE_FORMATS[locale] = locale_format
+    get_locale_patterns.cache_clear()
+    _parse_price.cache_clear()
+    _parse_rating.cache_clear()
+    _parse_date_label.cache_clear()
+
+@lru_cache(maxsize=None)
+def get_locale_patterns(locale: str) -> LocalePatterns:
+    """
+    Compiles the patterns of a locale once.
+    :param locale: The locale's name.
+    :return: The locale's compiled patterns.
+    """
+    if locale not in LOCALE_FORMATS:
+        raise KeyError(f"Unknown locale: {locale} (see register_locale_format)")
+    locale_format = LOCALE_FORMATS[locale]
+    amount = locale_format.amount_pattern
+    months = "|".join(re.escape(name) for name in locale_format.month_names)
+    return LocalePatterns(
+        format=locale_format,
+        # The currency may come before or after the amount, e.g. "$1,234" or "1.234 €".
+        price=re.compile(rf"(?P<before>[^\w\s.,]+)?\s*(?P<amount>{amount})\s*(?P<after>[^\w\s.,]+)?"),
+        # e.g. "4.85 out of 5 average rating, 123 reviews" or "Note moyenne de 4,85 sur 5, 123 commentaires".
+        rating=re.compile(rf"(?P<rating>\d+(?:{re.escape(locale_format.decimal_separator)}\d+)?)\s*"
+                          rf"{re.escape(locale_format.rating_marker)}\D*?(?P<reviews>{amount})"),
+        # e.g. "12, Monday, May 2025. Selected as check-in date".
+        date=re.compile(rf"(?P<day>\d{{1,2}})\b.*?\b(?P<month>{months})\b\s*(?P<year>\d{{4}})", re.IGNORECASE),
+        months={name.casefold(): number for number, name in enumerate(locale_format.month_names, start=1)},
+    )
+
+def parse_amount(text: str, locale_format: LocaleFormat) -> float:
+    for separator in locale_format.group_separators:
+        text = text.replace(separator, "")
+    return float(text.replace(locale_format.decimal_separator, "."))
+
+# ___________________________ Parsing Helper Methods ___________________________ #
+
+@lru_cache(maxsize=4096)
+def _parse_price(text: str, locale: str, currency: Optional[str]) -> int:
+    patterns = get_locale_patterns(locale)
+    match = patterns.price.search(text)
+    if match is None:
+        raise PriceParseError(text, locale)
+    if currency is not None and currency not in (match.group("before"), match.group("after")):
+        raise PriceParseError(text, locale)
+    return int(parse_amount(match.group("amount").strip(), patterns.format))
+
+@lru_cache(maxsize=4096)
+def _parse_rating(text: str, locale: str) -> tuple[float, int]:
+    patterns = get_locale_patterns(locale)
+    match = patterns.rating.search(text)
+    if match is None:
+        raise RatingParseError(text, locale)
+    return (parse_amount(match.group("rating"), patterns.format),
+            int(parse_amount(match.group("reviews").strip(), patterns.format)))
+
+@lru_cache(maxsize=1024)
+def _parse_date_label(text: str, locale: str) -> date:
+    patterns = get_locale_patterns(locale)
+    match = patterns.date.search(text)
+    try:
+        return date(int(match.group("year")), patterns.months[match.group("month").casefold()], int(match.group("day")))
+    except (AttributeError, ValueError):
+        raise DateParseError(text, locale) from None
+
+def parse_price(text: str, locale: str = DEFAULT_LOCALE, currency: Optional[str] = None) -> int:
+    """
+    Parses a card's price text, e.g. "$1,234 per night" or "1.234 € pro Nacht". The first amount is the price.
+    :param text: The price text.
+    :param locale: The locale the text is written in.
+    :param currency: If given, the currency symbol the price must be in, e.g. "$".
+    :return: The price, in whole currency units.
+    :raises PriceParseError: If the text holds no price (in the given currency).
+    """
+    return _parse_price(text, locale, currency)
+
+def parse_rating(text: str, locale: str = DEFAULT_LOCALE) -> tuple[float, int]:
+    """
+    Parses a card's rating text, e.g. "4.85 out of 5 average rating, 123 reviews".
+    :param text: The rating text.
+    :param locale: The locale the text is written in.
+    :return: The rating and amount of reviewers.
+    :raises RatingParseError: If the text holds no rating.
+    """
+    return _parse_rating(text, locale)
+
+def parse_date_label(text: str, locale: str = DEFAULT_LOCALE) -> date:
+    """
+    Parses a calendar day's label, e.g. "12, Monday, May 2025. Selected as check-in date".
+    Labels repeat a lot between pages, so parsed labels are memoized.
+    :param text: The label.
+    :param locale: The locale the label is written in.
+    :return: The date.
+    :raises DateParseError: If the label holds no valid date.
+    """
+    return _parse_date_label(text, locale)
+
+# ________________________ Bulk Parsing Helper Methods ________________________ #
+
+T = TypeVar("T")
+
+
+class BulkParseResult(NamedTuple):
+    values: list            # The parsed values, None where a text is missing or unparsable.
+    errors: list            # The (index, ParseError) pairs of the unparsable texts.
+
+
+def parse_all(texts: Iterable[Optional[str]], parse: Callable[[str], T]) -> BulkParseResult:
+    """
+    Parses a list of texts with a single-text parser, collecting the errors instead of stopping at the first one.
+    Missing (None or empty) texts are neither parsed nor counted as errors.
+    :param texts: The texts.
+    :param parse: The parser.
+    :return: The values and errors, see BulkParseResult.
+    """
+    values, errors = [], []
+    for index, text in enumerate(texts):
+        value = None
+        if text:
+            try:
+                value = parse(text)
+            except ParseError as error:
+                errors.append((index, error))
+        values.append(value)
+    return BulkParseResult(values, errors)
+
+def parse_prices(texts: Iterable[Optional[str]], locale: str = DEFAULT_LOCALE, currency: Optional[str] = None) -> BulkParseResult:
+    return parse_all(texts, lambda text: _parse_price(text, locale, currency))
+
+def parse_ratings(texts: Iterable[Optional[str]], locale: str = DEFAULT_LOCALE) -> BulkParseResult:
+    return parse_all(texts, lambda text: _parse_rating(text, locale))
+
+def parse_date_labels(texts: Iterable[Optional[str]], locale: str = DEFAULT_LOCALE) -> BulkParseResult:
+    return parse_all(texts, lambda text: _parse_date_label(text, locale))
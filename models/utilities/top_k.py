@@ -0,0 +1,58 @@
+import heapq
+from typing import Any, Callable, Iterable, List, NamedTuple
+
+# ___________________________ Top-K Helper Methods ___________________________ #
+
+
+class RankedCard(NamedTuple):
+    card: Any
+    page_index: int
+    card_index: int
+
+
+class TopKSelector:
+    """
+    Keeps the K best cards seen so far under a sort key, as cards stream in page after page.
+    Every card costs O(log k) and only K cards are held at any time.
+    The key may be composite, e.g. lambda card: (card.rating, card.review_amount, -card.price),
+    and larger keys are better. Among cards with equal keys, the earlier one is better.
+    """
+
+    def __init__(self, k: int, key: Callable[[Any], Any]):
+        if k < 1:
+            raise ValueError(f"Invalid amount of cards to keep: {k}")
+        self.k = k
+        self.key = key
+        self.heap = []   # A min-heap of (key, -arrival, RankedCard), its root being the worst card kept.
+        self.arrivals = 0
+
+    def push(self, card: Any, page_index: int, card_index: int) -> None:
+        """
+        Offers a single card to the selection.
+        :param card: The card.
+        :param page_index: The index of the card's results page.
+        :param card_index: The card's index within its page.
+        :return: None
+        """
+        entry = (self.key(card), -self.arrivals, RankedCard(card, page_index, card_index))
+        self.arrivals += 1
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, entry)
+        elif entry[:2] > self.heap[0][:2]:
+            heapq.heapreplace(self.heap, entry)
+
+    def push_page(self, cards: Iterable[Any], page_index: int) -> None:
+        """
+        Offers every card of a results page to the selection.
+        :param cards: The page's cards, in page order.
+        :param page_index: The index of the results page.
+        :return: None
+        """
+        for card_index, card in enumerate(cards):
+            self.push(card, page_index, card_index)
+
+    def results(self) -> List[RankedCard]:
+        """
+        :return: The cards kept, best first.
+        """
+        return [ranked for _, _, ranked in sorted(self.heap, key=lambda entry: entry[:2], reverse=True)]
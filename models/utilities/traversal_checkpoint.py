@@ -0,0 +1,98 @@
+import time
+from typing import Callable, List, Optional, Tuple, Type, TypeVar
+from playwright.sync_api import Error as PlaywrightError
+from models.page_components.card_container import ListingCard
+
+# _____________________ Traversal Checkpoint Helper Methods _____________________ #
+
+T = TypeVar("T")
+
+
+class RetryPolicy:
+    """
+    How many times a single results page is attempted before the traversal gives up, and how long to wait in between.
+    """
+
+    def __init__(
+            self,
+            attempts: int = 3,
+            delay: float = 1.0,
+            backoff: float = 2.0,
+            retry_on: Tuple[Type[BaseException], ...] = (PlaywrightError,)
+    ):
+        """
+        :param attempts: The maximal amount of attempts per page (1 disables retrying).
+        :param delay: The amount of seconds to wait before the first retry.
+        :param backoff: The factor the delay grows by after every retry.
+        :param retry_on: The errors considered transient. Any other error fails the traversal right away.
+        """
+        if attempts < 1:
+            raise ValueError(f"Invalid attempts amount: {attempts}")
+        self.attempts = attempts
+        self.delay = delay
+        self.backoff = backoff
+        self.retry_on = retry_on
+
+    def run(self, action: Callable[[int], T], on_retry: Optional[Callable[[int, BaseException], None]] = None) -> T:
+        """
+        Runs an action until it succeeds or runs out of attempts.
+        :param action: The action, called with the attempt's index (0 for the first attempt).
+        :param on_retry: An optional callback, called with the failed attempt's index and error before every retry.
+        :return: The action's result.
+        """
+        delay = self.delay
+        for attempt in range(self.attempts):
+            try:
+                return action(attempt)
+            except self.retry_on as error:
+                if attempt + 1 == self.attempts:
+                    raise
+                if on_retry is not None:
+                    on_retry(attempt, error)
+                time.sleep(delay)
+                delay *= self.backoff
+
+
+class TraversalCheckpoint:
+    """
+    The progress of a paginated traversal, updated after every completed page:
+    the url of the last completed page (the cursor to resume from), the amount of completed pages, and unless told
+    otherwise, the cards of every completed page, kept as compact ListingCard records rather than locator-holding containers.
+    """
+
+    def __init__(self, first_url: str, retain_cards: bool = True):
+        """
+        :param first_url: The url of the traversal's first page.
+        :param retain_cards: A parameter to toggle keeping the cards of every completed page.
+                             Without them, a traversal's memory stays flat, but it can't be resumed with its completed pages.
+        """
+        self.cursor_url = first_url
+        self.retain_cards = retain_cards
+        self.pages = []       # The ListingCards of every completed page, in page order (if retain_cards).
+        self.page_count = 0
+        self.finished = False
+        self.retries = 0
+
+    @property
+    def next_page_index(self) -> int:
+        return self.page_count
+
+    def complete_page(self, url: str, cards: List) -> None:
+        """
+        Records a page whose cards were all read.
+        :param url: The page's url.
+        :param cards: The page's cards.
+        :return: None
+        """
+        self.cursor_url = url
+        if self.retain_cards:
+            self.pages.append([ListingCard.from_card(card, self.page_count, index) for index, card in enumerate(cards)])
+        self.page_count += 1
+
+    def record_retry(self, attempt: int, error: BaseException) -> None:
+        self.retries += 1
+        print(f"Results page no. {self.next_page_index + 1} failed (attempt {attempt + 1}), "
+              f"resuming from {self.cursor_url}: {error}")
+
+# The retry policy of every results page traversal, unless a page object is given another one.
+DEFAULT_PAGE_RETRY_POLICY = RetryPolicy()
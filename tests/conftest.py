@@ -0,0 +1,366 @@
+import os
+import re
+import pytest
+from contextlib import ExitStack
+from pathlib import Path
+from playwright.sync_api import Page
+from models.utilities.context_pool import ContextPool
+from models.utilities.dial_prefix_cache import dial_prefix_cache
+from models.utilities.network_archive import NETWORK_MODES, archive_path_for, record_network, replay_network
+from models.utilities.readiness import wait_for_dom_settled, wait_recorder
+from models.utilities.results_cache import results_cache
+from models.utilities.scenarios import SharedSearchResults, load_scenarios
+from models.utilities.round_trips import (
+    RoundTripBudgetExceeded,
+    count_method,
+    enable_round_trip_counting,
+    round_trip_counter,
+)
+from models.utilities.request_blocking import BlockingProfile, BlockingStats
+from models.utilities.step_tracing import instrument_classes, iter_traced_classes, step_tracer
+from models.utilities.test_durations import DurationStore, order_longest_first, predict_makespan
+from tests.standin_site import DEFAULT_CONFIG, StandinConfig, StandinSite
+
+# The requests dropped by the blocking profiles of all tests in the session.
+session_blocking_stats = BlockingStats()
+
+# The searches run during the session, shared by every test depending on them.
+shared_search_results = SharedSearchResults()
+
+# The recorded durations of previous runs (see pytest_configure), and the timings of this run's tests.
+duration_store = None
+predicted_durations = None
+test_timings = {}   # [test id (str) : [duration (float), start (float), stop (float), schedule group (str)]]
+passed_tests = set()   # The ids of the tests whose setup and call passed - the only ones recorded to the store.
+
+# The page pooled contexts are warmed up on.
+WARM_UP_URL = "https://www.airbnb.com/homes?locale=en"
+
+# The directory of the default scenario files.
+SCENARIOS_DIR = Path(__file__).parent / "scenarios"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("scenarios", "test scenarios")
+    group.addoption("--scenarios", metavar="PATH", action="append", default=[],
+                    help="A CSV/JSONL scenarios file to run (may be repeated). Defaults to every file in tests/scenarios.")
+
+    group = parser.getgroup("scheduling", "duration-aware scheduling")
+    group.addoption("--durations-store", metavar="PATH", default="tests/.test_durations.json",
+                    help="Where every test's duration is recorded, and read from to order the tests of the next runs.")
+    group.addoption("--no-duration-scheduling", action="store_true",
+                    help="Keep the collection order, instead of running the tests predicted to take longest first.")
+
+    group = parser.getgroup("network", "network record/replay")
+    group.addoption("--network", choices=NETWORK_MODES, default="live",
+                    help="live: use the network, record: save each test's traffic, replay: serve it from the saved traffic.")
+    group.addoption("--network-archive-dir", default="tests/network_archives",
+                    help="Directory of the per-test HAR archives.")
+    group.addoption("--network-strict", action="store_true",
+                    help="In replay mode, abort requests missing from the archive and fail the test.")
+
+    group = parser.getgroup("blocking", "request blocking")
+    group.addoption("--no-request-blocking", action="store_true",
+                    help="Load images, fonts, media and telemetry requests, which are dropped by default.")
+
+    group = parser.getgroup("tracing", "page-object step tracing")
+    group.addoption("--trace-steps", metavar="PATH", default=None,
+                    help="Time every page-object and component method, and write a Chrome trace to PATH.")
+
+    group = parser.getgroup("round trips", "Playwright round trip counting")
+    group.addoption("--count-round-trips", action="store_true",
+                    help="Count the Playwright calls of every test and page-object method.")
+
+    group = parser.getgroup("context pool", "warm browser context pool")
+    group.addoption("--context-pool", action="store_true",
+                    help="Reuse warm browser contexts between tests, instead of a fresh context per test "
+                         "(pytest-playwright's video/tracing artifacts are not recorded for pooled contexts).")
+    group.addoption("--storage-state", metavar="PATH", default="tests/.storage_state.json",
+                    help="The saved storage state (consent cookies, locale) pooled contexts start from.")
+    group.addoption("--storage-state-max-age", metavar="HOURS", type=float, default=12,
+                    help="Create the saved storage state again once it is older than HOURS.")
+
+    group = parser.getgroup("caches", "page-object caches")
+    group.addoption("--dial-prefix-cache", metavar="PATH", default=None,
+                    help="Keep the country-dial prefix index in PATH between sessions.")
+    group.addoption("--results-cache", metavar="PATH", default=None,
+                    help="Keep the cards and rankings extracted from search results in a SQLite database at PATH, "
+                         "so repeated searches skip paginating (tests marked live_results always read the live UI).")
+    group.addoption("--results-cache-ttl", metavar="MINUTES", type=float, default=60,
+                    help="The amount of minutes cached search results stay valid.")
+    group.addoption("--results-cache-size", metavar="ENTRIES", type=int, default=2000,
+                    help="The maximal amount of cached pages and rankings, beyond which the least recently used are dropped.")
+
+    group = parser.getgroup("stand-in site", "local stand-in site (tests/standin_site.py)")
+    group.addoption("--standin-pages", type=int, default=DEFAULT_CONFIG.pages,
+                    help="The amount of results pages the stand-in site serves, e.g. 556 for 10,000 listings.")
+    group.addoption("--standin-cards-per-page", type=int, default=DEFAULT_CONFIG.cards_per_page,
+                    help="The amount of cards on every stand-in results page.")
+    group.addoption("--standin-latency", metavar="MS", type=int, default=DEFAULT_CONFIG.latency_ms,
+                    help="The delay of every stand-in response, in milliseconds.")
+    group.addoption("--standin-seed", type=int, default=DEFAULT_CONFIG.seed,
+                    help="The seed the stand-in listings are generated from.")
+
+
+def pytest_configure(config):
+    global duration_store
+    duration_store = DurationStore(Path(config.getoption("--durations-store")))
+    config.addinivalue_line("markers", "allow_resources: load images, fonts, media and telemetry (e.g. for visual checks).")
+    config.addinivalue_line("markers", "round_trip_budget(max_calls): fail the test if it makes more than max_calls Playwright calls.")
+    config.addinivalue_line("markers", "live_results: always read search results from the live UI, bypassing --results-cache.")
+    config.addinivalue_line("markers", "xdist_group(name): run tests of the same group on the same pytest-xdist worker (--dist loadgroup).")
+    if config.getoption("--dial-prefix-cache"):
+        dial_prefix_cache.persist_to(Path(config.getoption("--dial-prefix-cache")))
+    if config.getoption("--results-cache"):
+        results_cache.persist_to(
+            Path(config.getoption("--results-cache")),
+            config.getoption("--results-cache-ttl") * 60,
+            config.getoption("--results-cache-size")
+        )
+    if config.getoption("--trace-steps"):
+        instrument_classes(iter_traced_classes())
+    if config.getoption("--count-round-trips"):
+        enable_round_trip_counting()
+        instrument_classes(iter_traced_classes(), wrapper=count_method)
+
+
+def get_schedule_group(item) -> str:
+    # Tests of the same xdist_group run on the same worker, so they are scheduled as a single unit.
+    marker = item.get_closest_marker("xdist_group")
+    if marker is None:
+        return item.nodeid
+    return marker.args[0] if marker.args else marker.kwargs.get("name", item.nodeid)
+
+
+def get_worker_count(config) -> int:
+    workers = config.getoption("numprocesses", default=None)
+    if isinstance(workers, int):
+        return max(workers, 1)
+    return (os.cpu_count() or 1) if workers else 1
+
+
+def pytest_collection_modifyitems(config, items):
+    # The group travels with the test's reports, which are all the pytest-xdist controller sees.
+    for item in items:
+        item.user_properties.append(("schedule_group", get_schedule_group(item)))
+
+    # Under pytest-xdist, every worker collects and orders the tests the same way, from the same store.
+    if config.getoption("--no-duration-scheduling") or not duration_store.durations:
+        return
+    items[:] = order_longest_first(items, lambda item: duration_store.predict(item.nodeid), get_schedule_group)
+
+
+def pytest_runtest_logreport(report):
+    if report.outcome == "skipped" and report.when == "setup":
+        return
+    group = dict(report.user_properties).get("schedule_group", report.nodeid)
+    timing = test_timings.setdefault(report.nodeid, [0.0, report.start, report.stop, group])
+    timing[0] += report.duration
+    timing[1], timing[2] = min(timing[1], report.start), max(timing[2], report.stop)
+    # A call report only exists once the setup passed, so a passed call means the whole test ran.
+    if report.when == "call" and report.passed:
+        passed_tests.add(report.nodeid)
+
+
+def pytest_generate_tests(metafunc):
+    # Tests taking a 'scenario' run once per scenario, with scenarios sharing a search next to each other
+    # (and, under --dist loadgroup, on the same worker), so each search runs once and is shared.
+    if "scenario" not in metafunc.fixturenames:
+        return
+    paths = [Path(path) for path in metafunc.config.getoption("--scenarios")] \
+        or sorted(SCENARIOS_DIR.glob("*.csv")) + sorted(SCENARIOS_DIR.glob("*.jsonl"))
+    metafunc.parametrize("scenario", [
+        pytest.param(scenario, id=f"{scenario.search_id}-{scenario.prefix}-{scenario.phone}",
+                     marks=pytest.mark.xdist_group(scenario.search_id))
+        for scenario in load_scenarios(paths)
+    ])
+
+
+@pytest.fixture(scope="session")
+def shared_searches() -> SharedSearchResults:
+    return shared_search_results
+
+
+@pytest.fixture(scope="session")
+def standin_server(pytestconfig):
+    site = StandinSite(StandinConfig(
+        pages=pytestconfig.getoption("--standin-pages"),
+        cards_per_page=pytestconfig.getoption("--standin-cards-per-page"),
+        latency_ms=pytestconfig.getoption("--standin-latency"),
+        seed=pytestconfig.getoption("--standin-seed")
+    )).start()
+    yield site
+    site.stop()
+
+
+@pytest.fixture
+def standin_site(standin_server) -> StandinSite:
+    # Tests may reconfigure the site (see StandinSite.configure), so every test starts from the session's configuration.
+    yield standin_server
+    standin_server.reset()
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    budget_marker = item.get_closest_marker("round_trip_budget")
+    counting = item.config.getoption("--count-round-trips") or budget_marker is not None
+    if counting:
+        enable_round_trip_counting()
+    start = round_trip_counter.total
+
+    with ExitStack() as stack:
+        if item.get_closest_marker("live_results") is not None:
+            stack.enter_context(results_cache.bypass())
+        if item.config.getoption("--trace-steps"):
+            stack.enter_context(step_tracer.span(item.nodeid, category="test"))
+        result = yield
+
+    if counting:
+        used = round_trip_counter.total - start
+        round_trip_counter.per_test[item.nodeid] = used
+        if budget_marker is not None and used > budget_marker.args[0]:
+            raise RoundTripBudgetExceeded(f"The test made {used} Playwright calls, over its budget of {budget_marker.args[0]}")
+    return result
+
+
+def pytest_sessionfinish(session):
+    global predicted_durations
+    results_cache.close()
+    # Under pytest-xdist, the reports of all workers reach the controller, which alone updates the store.
+    if test_timings and not hasattr(session.config, "workerinput"):
+        if duration_store.durations:
+            predicted_durations = {test_id: duration_store.predict(test_id) for test_id in test_timings}
+        # Failed and errored tests are timed for the summary only, since e.g. a setup error ends a test in a few
+        # milliseconds, and recording it would have the next runs schedule the test last.
+        for test_id, (duration, _, _, _) in test_timings.items():
+            if test_id in passed_tests:
+                duration_store.record(test_id, duration)
+        duration_store.save()
+    trace_path = session.config.getoption("--trace-steps")
+    if trace_path:
+        trace_path = Path(trace_path)
+        # Under pytest-xdist, every worker writes its own trace.
+        worker_id = getattr(session.config, "workerinput", {}).get("workerid")
+        if worker_id:
+            trace_path = trace_path.with_name(f"{trace_path.stem}-{worker_id}{trace_path.suffix}")
+        step_tracer.export_chrome_trace(trace_path)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if predicted_durations:
+        # The tests' groups in the order they started, each handed to the first idle worker as a single unit.
+        group_durations = {}
+        for test_id in sorted(test_timings, key=lambda test_id: test_timings[test_id][1]):
+            group = test_timings[test_id][3]
+            group_durations[group] = group_durations.get(group, 0.0) + predicted_durations[test_id]
+        workers = get_worker_count(config)
+        predicted = predict_makespan(group_durations.values(), workers)
+        actual = max(timing[2] for timing in test_timings.values()) - min(timing[1] for timing in test_timings.values())
+        longest = max(timing[0] for timing in test_timings.values())
+        terminalreporter.write_sep("-", "duration-aware scheduling")
+        terminalreporter.write_line(f"predicted makespan: {predicted:.1f}s on {workers} workers, actual: {actual:.1f}s, "
+                                    f"longest test: {longest:.1f}s")
+
+    if shared_search_results.hits:
+        terminalreporter.write_sep("-", "shared searches")
+        terminalreporter.write_line(f"{len(shared_search_results.results)} searches run, reused {shared_search_results.hits} times")
+
+    if results_cache.hits or results_cache.misses:
+        terminalreporter.write_sep("-", "results cache")
+        terminalreporter.write_line(f"{results_cache.hits} hits, {results_cache.misses} misses")
+
+    if wait_recorder.totals:
+        terminalreporter.write_sep("-", f"readiness waits: {wait_recorder.total:.2f}s in total")
+        for line in wait_recorder.summary():
+            terminalreporter.write_line(line)
+
+    if session_blocking_stats.total_requests:
+        terminalreporter.write_sep("-", "request blocking")
+        terminalreporter.write_line(session_blocking_stats.summary())
+
+    if config.getoption("--trace-steps"):
+        terminalreporter.write_sep("-", "slowest page-object steps")
+        for name, total, calls, longest in step_tracer.slowest_steps():
+            terminalreporter.write_line(f"{total:8.2f}s total  {calls:4} calls  {longest:7.2f}s max  {name}")
+
+    if config.getoption("--count-round-trips"):
+        terminalreporter.write_sep("-", f"Playwright round trips: {round_trip_counter.total} in total")
+        for test_id, calls in round_trip_counter.per_test.items():
+            terminalreporter.write_line(f"{calls:6} calls  {test_id}")
+        terminalreporter.write_line("")
+        for name, calls, invocations in round_trip_counter.busiest_methods():
+            terminalreporter.write_line(f"{calls:6} calls  {invocations:4} invocations  {name}")
+
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args, pytestconfig):
+    # Service worker requests bypass request routing, so they are blocked whenever traffic is recorded or replayed.
+    if pytestconfig.getoption("--network") == "live":
+        return browser_context_args
+    return {**browser_context_args, "service_workers": "block"}
+
+
+def warm_up(page: Page) -> None:
+    """
+    Brings a fresh page to the state every test expects: the english site, with the cookie banner accepted.
+    :param page: The page.
+    :return: None
+    """
+    page.goto(WARM_UP_URL)
+    wait_for_dom_settled(page)
+    consent_button = page.get_by_role("button", name=re.compile(r"^(Accept all|OK)$")).first
+    if consent_button.is_visible():
+        consent_button.click()
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser, browser_context_args, pytestconfig):
+    # Under pytest-xdist, every worker has its own browser and pool, and they all share the saved storage state.
+    pool = ContextPool(
+        browser,
+        browser_context_args,
+        Path(pytestconfig.getoption("--storage-state")),
+        pytestconfig.getoption("--storage-state-max-age") * 3600,
+        warm_up
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def context(new_context, request, pytestconfig):
+    mode = pytestconfig.getoption("--network")
+    archive_path = archive_path_for(pytestconfig.getoption("--network-archive-dir"), request.node.nodeid)
+    unrecorded_urls = []
+
+    # A recorded archive is only written when its context closes, so recording always uses a fresh context.
+    pool = request.getfixturevalue("context_pool") if pytestconfig.getoption("--context-pool") and mode != "record" else None
+    context = pool.acquire() if pool is not None else new_context()
+
+    if mode == "record":
+        record_network(context, archive_path)
+    elif mode == "replay":
+        try:
+            unrecorded_urls = replay_network(context, archive_path, pytestconfig.getoption("--network-strict"))
+        except FileNotFoundError as error:
+            if pool is not None:
+                pool.release(context)
+            pytest.fail(str(error))
+
+    blocking_profile = None
+    if not pytestconfig.getoption("--no-request-blocking") and request.node.get_closest_marker("allow_resources") is None:
+        # Registered after the replay routes, so blocked requests never reach the archive.
+        blocking_profile = BlockingProfile()
+        blocking_profile.apply(context)
+
+    yield context
+
+    # Pooled contexts drop this test's routes, pages, cookies and storage when they are released.
+    if pool is not None:
+        pool.release(context)
+
+    if blocking_profile is not None:
+        session_blocking_stats.merge(blocking_profile.stats)
+
+    if unrecorded_urls:
+        pytest.fail(f"{len(unrecorded_urls)} requests were not found in '{archive_path}', e.g.: {unrecorded_urls[:5]}")
@@ -0,0 +1,493 @@
+"""
+A local stand-in for the parts of airbnb.com the page objects drive: the search bar, paginated results
+(with their search payloads), room overviews and both checkout variants, rendered with the same selectors.
+Listings are generated from a seed, so every run (and every scale, up to tens of thousands of listings)
+is reproducible and runs without network.
+
+Run it on its own with: python -m tests.standin_site --port 8000 --pages 556
+"""
+import argparse
+import html
+import json
+import random
+import re
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, NamedTuple, Optional
+from urllib.parse import parse_qs, quote, unquote, urlencode, urlparse
+
+from models.page_components.card_container import CardRecord, best_card_in_list
+from models.utilities.helper_methods import build_search_url
+from models.utilities.search_payload import SEARCH_API_PATH
+
+# The checkout variants a listing's reservation page may show (see reservation_page_factory.py).
+CHECKOUT_VARIANTS = ("A", "B", "mixed")
+
+GUEST_TYPES = ("adults", "children", "infants", "pets")
+
+# The country-code options of the checkout's phone form, as (text, value) pairs.
+DIAL_OPTIONS = (
+    ("Afghanistan (+93)", "AF"), ("France (+33)", "FR"), ("Germany (+49)", "DE"),
+    ("Israel (+972)", "IL"), ("United Kingdom (+44)", "GB"), ("United States (+1)", "US"),
+)
+
+
+class StandinConfig(NamedTuple):
+    pages: int = 20
+    cards_per_page: int = 18
+    missing_rating_ratio: float = 0.1     # The share of listings without a rating ("New").
+    missing_price_ratio: float = 0.05     # The share of listings whose card shows no price.
+    latency_ms: int = 0                   # The delay of every response.
+    checkout_variant: str = "mixed"       # "A", "B", or "mixed" (A for even listing ids, B for odd ones).
+    seed: int = 0
+
+
+DEFAULT_CONFIG = StandinConfig()
+
+
+class Listing(NamedTuple):
+    listing_id: str
+    price: Optional[int]
+    rating: Optional[float]
+    review_amount: int
+
+    @property
+    def nightly_price(self) -> int:
+        # Rooms always have a price, even when their card doesn't show it.
+        return self.price if self.price is not None else 100
+
+
+def generate_listings(config: StandinConfig) -> list[Listing]:
+    """
+    :param config: The site's configuration.
+    :return: The listings of every results page, in traversal order.
+    """
+    rng = random.Random(config.seed)
+    listings = []
+    for index in range(config.pages * config.cards_per_page):
+        price = None if rng.random() < config.missing_price_ratio else rng.randint(40, 2500)
+        rating = None if rng.random() < config.missing_rating_ratio else round(rng.uniform(3.5, 5.0), 2)
+        review_amount = rng.randint(1, 900) if rating is not None else 0
+        listings.append(Listing(str(10_000_000 + index), price, rating, review_amount))
+    return listings
+
+# ___________________________ Rendering Helper Methods ___________________________ #
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{title}</title>
+<style>[hidden] {{ display: none !important; }} body {{ font-family: sans-serif; }}
+[data-testid="card-container"] {{ display: inline-block; width: 220px; margin: 4px; border: 1px solid #ddd; }}</style>
+</head><body>{body}<script>{script}</script></body></html>"""
+
+def render_page(title: str, body: str, script: str = "") -> bytes:
+    return PAGE_TEMPLATE.format(title=html.escape(title), body=body, script=script).encode()
+
+def embed_json(data) -> str:
+    # Escaped so no value can close the script element.
+    content = json.dumps(data).replace("</", "<\\/")
+    return f'<script type="application/json">{content}</script>'
+
+def format_money(amount: float, cents: bool = False) -> str:
+    return f"${amount:,.2f}" if cents else f"${amount:,}"
+
+def format_day(day: date) -> str:
+    # e.g. "May 13", as the search bar writes a chosen date.
+    return f"{day:%B} {day.day}"
+
+def format_day_label(day: date, selection: str) -> str:
+    # e.g. "13, Tuesday, May 2025. Selected as check-in date", as the checkout calendar labels a chosen date.
+    return f"{day.day}, {day:%A}, {day:%B} {day.year}. Selected as {selection} date"
+
+def read_search(query: Dict[str, list]) -> dict:
+    """
+    Reads a search's parameters from a url query, defaulting to tomorrow for a night and a single adult.
+    :param query: The parsed query.
+    :return: A dictionary of the destination, dates and guests.
+    """
+    value = lambda *names, default=None: next((query[name][0] for name in names if name in query), default)
+    check_in = date.fromisoformat(value("checkin", "check_in", default=(date.today() + timedelta(days=1)).isoformat()))
+    check_out = date.fromisoformat(value("checkout", "check_out", default=(check_in + timedelta(days=1)).isoformat()))
+    search = {"query": value("query", default="Stand-in City"), "check_in": check_in, "check_out": check_out}
+    for guest_type in GUEST_TYPES:
+        default = "1" if guest_type == "adults" else "0"
+        search[guest_type] = int(value(guest_type, "numberOf" + guest_type.capitalize(), default=default))
+    return search
+
+def render_steppers(prefix: str, guests: dict, value_suffix: str = "-value") -> str:
+    return "".join(
+        f'<div>{guest_type} '
+        f'<button type="button" data-testid="{prefix}{guest_type}-decrease-button" data-stepper="{guest_type}" data-step="-1">-</button>'
+        f'<span data-testid="{prefix}{guest_type}{value_suffix}">{guests[guest_type]}</span>'
+        f'<button type="button" data-testid="{prefix}{guest_type}-increase-button" data-stepper="{guest_type}" data-step="1">+</button>'
+        f'</div>'
+        for guest_type in GUEST_TYPES
+    )
+
+# Steps every stepper value on a click of its buttons.
+STEPPERS_SCRIPT = """
+document.addEventListener('click', event => {
+    const button = event.target.closest('[data-stepper]');
+    if (!button) return;
+    const value = button.parentElement.querySelector('[data-testid$="-value"]');
+    value.textContent = Math.max(0, Number(value.textContent) + Number(button.dataset.step));
+});
+"""
+
+MAIN_PAGE_SCRIPT = STEPPERS_SCRIPT + """
+const input = document.querySelector('[data-testid="structured-search-input-field-query"]');
+const options = document.getElementById('options');
+const chosen = {};
+input.addEventListener('input', () => {
+    options.replaceChildren();
+    if (!input.value) return;
+    const option = document.createElement('div');
+    option.setAttribute('role', 'option');
+    option.textContent = input.value + ', Stand-in';
+    option.dataset.value = input.value;
+    options.append(option);
+});
+options.addEventListener('click', event => {
+    const option = event.target.closest('[role="option"]');
+    if (!option) return;
+    input.value = option.dataset.value;
+    options.replaceChildren();
+    document.getElementById('calendar').hidden = false;
+});
+document.getElementById('calendar').addEventListener('click', event => {
+    const cell = event.target.closest('[data-state--date-string]');
+    if (!cell) return;
+    if (!chosen.checkin || chosen.checkout) { chosen.checkin = cell.getAttribute('data-state--date-string'); delete chosen.checkout; }
+    else { chosen.checkout = cell.getAttribute('data-state--date-string'); }
+});
+document.getElementById('add-guests').addEventListener('click', () => { document.getElementById('guests').hidden = false; });
+document.querySelector('[data-testid="structured-search-input-search-button"]').addEventListener('click', () => {
+    const query = new URLSearchParams({'refinement_paths[]': '/homes', query: input.value, ...chosen});
+    for (const value of document.querySelectorAll('#guests [data-testid$="-value"]')) {
+        query.set(value.dataset.testid.split('-')[1], value.textContent);
+    }
+    const path = encodeURIComponent(input.value.replaceAll('-', '~').replaceAll(' ', '-'));
+    window.location.assign(`/s/${path}/homes?${query}`);
+});
+"""
+
+def render_main_page() -> bytes:
+    today = date.today()
+    cells = "".join(
+        f'<button type="button" data-state--date-string="{day.isoformat()}">{day.day}</button>'
+        for day in (today + timedelta(days=offset) for offset in range(120))
+    )
+    body = (
+        '<header><input data-testid="structured-search-input-field-query" placeholder="Search destinations">'
+        '<div id="options" role="listbox"></div>'
+        f'<div id="calendar" hidden>{cells}</div>'
+        '<button type="button" id="add-guests">Add guests</button>'
+        f'<div id="guests" hidden>{render_steppers("stepper-", dict.fromkeys(GUEST_TYPES, 0))}</div>'
+        '<button type="button" data-testid="structured-search-input-search-button">Search</button></header>'
+    )
+    return render_page("Stand-in", body, MAIN_PAGE_SCRIPT)
+
+def render_card(listing: Listing, room_query: str) -> str:
+    rating = (f"<span>{listing.rating} out of 5 average rating, {listing.review_amount} reviews</span>"
+              if listing.rating is not None else "<span>New</span>")
+    price = (f"<span>{format_money(listing.price)} per night</span>"
+             if listing.price is not None else "<span>Price unavailable</span>")
+    return (f'<div data-testid="card-container"><a href="/rooms/{listing.listing_id}?{room_query}">Stand-in home {listing.listing_id}</a>'
+            f'<div>{rating}</div><div data-testid="price-availability-row">{price}</div></div>')
+
+def render_pagination(path: str, query: Dict[str, list], page_number: int, pages: int) -> str:
+    def page_url(number: int) -> str:
+        return html.escape(f"{path}?{urlencode({**{key: values[0] for key, values in query.items()}, 'page': number})}")
+
+    shown = sorted({1, pages, *range(max(1, page_number - 2), min(pages, page_number + 2) + 1)})
+    links = "".join(f'<a href="{page_url(number)}">{number}</a>' for number in shown if number != page_number)
+    if page_number < pages:
+        links += f'<a aria-label="Next" href="{page_url(page_number + 1)}">Next</a>'
+    return links
+
+def search_result_item(listing: Listing) -> dict:
+    primary_line = {"price": format_money(listing.price)} if listing.price is not None else {}
+    rating = f"{listing.rating} ({listing.review_amount})" if listing.rating is not None else "New"
+    return {
+        "__typename": "StaySearchResult",
+        "listing": {"id": listing.listing_id},
+        "avgRatingLocalized": rating,
+        "structuredDisplayPrice": {"primaryLine": primary_line},
+    }
+
+# Moves to the next page like the live site does: fetching the page's search payload and swapping the results in place.
+RESULTS_PAGE_SCRIPT = STEPPERS_SCRIPT + """
+document.addEventListener('click', async event => {
+    const next = event.target.closest('#pagination a[aria-label="Next"]');
+    if (!next) return;
+    event.preventDefault();
+    const target = new URL(next.href);
+    const response = await fetch('""" + SEARCH_API_PATH + """' + target.search);
+    const payload = await response.json();
+    document.getElementById('grid').innerHTML = payload.standin.grid;
+    document.getElementById('pagination').innerHTML = payload.standin.pagination;
+    history.pushState(null, '', target);
+});
+document.querySelector('[data-testid="little-search-location"]').addEventListener('click', () => {
+    document.getElementById('search-bar').hidden = false;
+});
+document.getElementById('who').addEventListener('click', () => { document.getElementById('guests').hidden = false; });
+document.addEventListener('keydown', event => {
+    if (event.key === 'Escape') {
+        document.getElementById('guests').hidden = true;
+        document.getElementById('search-bar').hidden = true;
+    }
+});
+"""
+
+
+class StandinSite:
+    """
+    The stand-in site, served from a background thread. Its configuration may be changed between tests.
+    """
+
+    def __init__(self, config: StandinConfig = DEFAULT_CONFIG, host: str = "127.0.0.1", port: int = 0):
+        self.default_config = config
+        self.config = config
+        self.configure()
+        site = self
+
+        class Handler(StandinRequestHandler):
+            standin_site = site
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def configure(self, **changes) -> None:
+        """
+        Changes the site's configuration (see StandinConfig), generating its listings again.
+        :return: None
+        """
+        config = self.config._replace(**changes)
+        if config.checkout_variant not in CHECKOUT_VARIANTS:
+            raise ValueError(f"Invalid checkout variant: {config.checkout_variant}")
+        if config.pages < 1 or config.cards_per_page < 1:
+            raise ValueError(f"Invalid results size: {config.pages} pages of {config.cards_per_page} cards")
+        self.config = config
+        self.listings = generate_listings(config)
+        self.listings_by_id = {listing.listing_id: listing for listing in self.listings}
+
+    def reset(self) -> None:
+        """
+        Goes back to the configuration the site was started with.
+        :return: None
+        """
+        self.config = self.default_config
+        self.configure()
+
+    def start(self) -> "StandinSite":
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def main_url(self) -> str:
+        return self.base_url + "/homes?locale=en"
+
+    def results_url(self, destination: str, start_date: date, end_date: date, *guests: int) -> str:
+        return build_search_url(self.main_url(), destination, start_date, end_date, *guests)
+
+    def room_url(self, listing: Listing, start_date: date, end_date: date, adults: int = 1, children: int = 0,
+                 infants: int = 0, pets: int = 0) -> str:
+        query = {"check_in": start_date.isoformat(), "check_out": end_date.isoformat(),
+                 "adults": adults, "children": children, "infants": infants, "pets": pets}
+        return f"{self.base_url}/rooms/{listing.listing_id}?{urlencode(query)}"
+
+    def checkout_variant_of(self, listing_id: str) -> str:
+        if self.config.checkout_variant != "mixed":
+            return self.config.checkout_variant
+        return "A" if int(listing_id) % 2 == 0 else "B"
+
+    def expected_best_listings(self, objectives: Dict[str, Callable[[CardRecord, CardRecord], bool]]) -> Dict[str, str]:
+        """
+        Ranks all listings directly, the way a full traversal of the results should.
+        :param objectives: A dictionary of [objective_name (str) : comparator method].
+        :return: A dictionary of [objective_name (str) : best listing's id (str)].
+        """
+        cards = [CardRecord.from_info({"price": listing.price, "rating": listing.rating,
+                                       "review_amount": listing.review_amount, "url": f"/rooms/{listing.listing_id}"})
+                 for listing in self.listings]
+        return {name: self.listings[best_card_in_list(cards, is_better)].listing_id for name, is_better in objectives.items()}
+
+    # ____ Pages ____ #
+
+    def render_results_page(self, path: str, query: Dict[str, list]) -> bytes:
+        search = read_search(query)
+        page_number = min(max(int(query.get("page", ["1"])[0]), 1), self.config.pages)
+        grid, pagination, items = self.render_results(path, query, page_number)
+        guests = sum(search[guest_type] for guest_type in ("adults", "children"))
+        body = (
+            '<header><button type="button" data-testid="little-search-location">Anywhere</button>'
+            '<div id="search-bar" hidden>'
+            f'<input data-testid="structured-search-input-field-query" value="{html.escape(search["query"])}">'
+            f'<button type="button"><div>Check in</div><div>{format_day(search["check_in"])}</div></button>'
+            f'<button type="button"><div>Check out</div><div>{format_day(search["check_out"])}</div></button>'
+            f'<button type="button" id="who"><div>Who</div><div>{guests} guests</div></button>'
+            f'<div id="guests" hidden>{render_steppers("stepper-", search)}</div>'
+            '<button type="button" data-testid="structured-search-input-search-button">Search</button>'
+            '</div></header>'
+            f'<main><div id="grid">{grid}</div>'
+            f'<nav aria-label="Search results pagination" id="pagination">{pagination}</nav></main>'
+            + embed_json({"niobeClientData": {"staysSearch": {"searchResults": items}}})
+        )
+        return render_page(f"{search['query']} - Stand-in", body, RESULTS_PAGE_SCRIPT)
+
+    def render_results(self, path: str, query: Dict[str, list], page_number: int) -> tuple[str, str, list]:
+        search = read_search(query)
+        room_query = urlencode({"check_in": search["check_in"].isoformat(), "check_out": search["check_out"].isoformat(),
+                                **{guest_type: search[guest_type] for guest_type in GUEST_TYPES}})
+        start = (page_number - 1) * self.config.cards_per_page
+        listings = self.listings[start:start + self.config.cards_per_page]
+        grid = "".join(render_card(listing, room_query) for listing in listings)
+        return grid, render_pagination(path, query, page_number, self.config.pages), [search_result_item(listing) for listing in listings]
+
+    def render_search_api(self, query: Dict[str, list]) -> bytes:
+        page_number = min(max(int(query.get("page", ["1"])[0]), 1), self.config.pages)
+        path = "/s/" + quote(query.get("query", ["Stand-in City"])[0].replace("-", "~").replace(" ", "-"), safe="~") + "/homes"
+        grid, pagination, items = self.render_results(path, query, page_number)
+        payload = {"data": {"presentation": {"staysSearch": {"results": {"searchResults": items}}}},
+                   "standin": {"grid": grid, "pagination": pagination}}
+        return json.dumps(payload).encode()
+
+    def render_room_page(self, listing: Listing, query: Dict[str, list]) -> bytes:
+        search = read_search(query)
+        nights = max((search["check_out"] - search["check_in"]).days, 1)
+        checkout_query = urlencode({"checkin": search["check_in"].isoformat(), "checkout": search["check_out"].isoformat(),
+                                    **{"numberOf" + guest_type.capitalize(): search[guest_type] for guest_type in GUEST_TYPES}})
+        format_date = lambda day: f"{day.month}/{day.day}/{day.year}"
+        body = (
+            f'<h1>Stand-in home {listing.listing_id}</h1>'
+            f'<div data-testid="change-dates-checkIn">{format_date(search["check_in"])}</div>'
+            f'<div data-testid="change-dates-checkOut">{format_date(search["check_out"])}</div>'
+            '<span id="guests-label">Guests</span>'
+            '<button type="button" id="GuestPicker-book_it-trigger" aria-labelledby="guests-label GuestPicker-book_it-trigger">Guests</button>'
+            '<div id="GuestPicker-book_it-form" aria-labelledby="GuestPicker-book_it-form" hidden>'
+            f'{render_steppers("GuestPicker-book_it-form-", search, "-stepper-value")}'
+            '<button type="button">Close</button></div>'
+            f'<div>Total <span class="_j1kt73">{format_money(listing.nightly_price * nights)}</span></div>'
+            f'<a data-testid="homes-pdp-cta-btn" href="/book/stays/{listing.listing_id}?{checkout_query}">Reserve</a>'
+            + embed_json({"bootstrapData": {"listingId": listing.listing_id}})
+        )
+        script = STEPPERS_SCRIPT + """
+const form = document.getElementById('GuestPicker-book_it-form');
+document.getElementById('GuestPicker-book_it-trigger').addEventListener('click', () => { form.hidden = false; });
+form.querySelector('button:last-of-type').addEventListener('click', () => { form.hidden = true; });
+"""
+        return render_page(f"Stand-in home {listing.listing_id}", body, script)
+
+    def render_checkout_page(self, listing: Listing, query: Dict[str, list]) -> bytes:
+        search = read_search(query)
+        nights = max((search["check_out"] - search["check_in"]).days, 1)
+        total = format_money(listing.nightly_price * nights, cents=True)
+        dates = (f'<div id="dates-panel" hidden><button type="button" aria-label="{format_day_label(search["check_in"], "check-in")}">{search["check_in"].day}</button>'
+                 f'<button type="button" aria-label="{format_day_label(search["check_out"], "check-out")}">{search["check_out"].day}</button></div>')
+        options = "".join(f'<option value="{value}">{html.escape(text)}</option>' for text, value in DIAL_OPTIONS)
+        phone_form = (f'<select data-testid="login-signup-countrycode">{options}</select>'
+                      '<input data-testid="login-signup-phonenumber" type="tel">')
+
+        if self.checkout_variant_of(listing.listing_id) == "A":
+            guest_steppers = render_steppers("GUEST_PICKER-", search, "-stepper-value")
+            body = (
+                '<h1>Request to book</h1>'
+                '<button type="button" data-testid="checkout_platform.DATE_PICKER.edit" data-panel="dates-panel">Edit</button>'
+                '<button type="button" data-testid="checkout_platform.GUEST_PICKER.edit" data-panel="guests-panel">Edit</button>'
+                f'<div>Total <span data-testid="price-item-total">{total}</span></div>{phone_form}'
+                f'<div id="modal" role="dialog" hidden><button type="button" aria-label="Close">x</button>'
+                f'{dates}<div id="guests-panel" hidden>{guest_steppers}</div></div>'
+            )
+        else:
+            guest_steppers = render_steppers("checkout-update-details-modal-guest_picker-", search, "-stepper-value")
+            body = (
+                '<h1>Confirm and pay</h1>'
+                '<button type="button" data-panel="dates-panel"><span data-button-content="true">Change</span></button>'
+                f'<div>Total <span data-testid="pd-value-TOTAL">{total}</span></div>'
+                '<button type="button" id="continue"><span data-button-content="true">Continue</span></button>'
+                f'<div id="login" hidden>{phone_form}</div>'
+                '<div id="modal" role="dialog" hidden><button type="button" aria-label="Close">x</button>'
+                '<button type="button" id="tab--checkout-update-details-modal-tabs--0" data-panel="dates-panel">Dates</button>'
+                '<button type="button" id="tab--checkout-update-details-modal-tabs--1" data-panel="guests-panel">Guests</button>'
+                f'{dates}<div id="guests-panel" hidden>{guest_steppers}</div></div>'
+            )
+        script = STEPPERS_SCRIPT + """
+const modal = document.getElementById('modal');
+document.addEventListener('click', event => {
+    const opener = event.target.closest('[data-panel]');
+    if (opener) {
+        modal.hidden = false;
+        for (const panel of modal.querySelectorAll('[id$="-panel"]')) panel.hidden = panel.id !== opener.dataset.panel;
+    }
+    if (event.target.closest('[aria-label="Close"]')) modal.hidden = true;
+    if (event.target.closest('#continue')) document.getElementById('login').hidden = false;
+});
+"""
+        return render_page("Checkout", body, script)
+
+
+class StandinRequestHandler(BaseHTTPRequestHandler):
+    standin_site: StandinSite = None
+
+    ROOM_PATTERN = re.compile(r"^/rooms/(\d+)$")
+    CHECKOUT_PATTERN = re.compile(r"^/book/stays/(\d+)$")
+    RESULTS_PATTERN = re.compile(r"^/s/[^/]+/homes$")
+
+    def do_GET(self):
+        site = self.standin_site
+        time.sleep(site.config.latency_ms / 1000)
+
+        url = urlparse(self.path)
+        path, query = unquote(url.path), parse_qs(url.query)
+        room_match, checkout_match = self.ROOM_PATTERN.match(path), self.CHECKOUT_PATTERN.match(path)
+        try:
+            if path in ("/", "/homes"):
+                self.respond(render_main_page())
+            elif self.RESULTS_PATTERN.match(path):
+                self.respond(site.render_results_page(url.path, query))
+            elif path == SEARCH_API_PATH:
+                self.respond(site.render_search_api(query), "application/json")
+            elif room_match and room_match.group(1) in site.listings_by_id:
+                self.respond(site.render_room_page(site.listings_by_id[room_match.group(1)], query))
+            elif checkout_match and checkout_match.group(1) in site.listings_by_id:
+                self.respond(site.render_checkout_page(site.listings_by_id[checkout_match.group(1)], query))
+            else:
+                self.respond(b"Not found", "text/plain", status=404)
+        except ValueError as error:
+            self.respond(str(error).encode(), "text/plain", status=400)
+
+    def respond(self, content: bytes, content_type: str = "text/html; charset=utf-8", status: int = 200) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the stand-in site.")
+    parser.add_argument("--port", type=int, default=8000)
+    for name, default in DEFAULT_CONFIG._asdict().items():
+        parser.add_argument("--" + name.replace("_", "-"), type=type(default), default=default)
+    arguments = vars(parser.parse_args())
+    site = StandinSite(StandinConfig(**{name: arguments[name] for name in StandinConfig._fields}), port=arguments["port"])
+    print(f"Serving {len(site.listings)} listings on {site.main_url()}")
+    site.start().thread.join()
+
+if __name__ == "__main__":
+    main()
@@ -1,69 +1,74 @@
 import pytest
+from datetime import date, timedelta
 from playwright.sync_api import Page
-from models.page_objects.main_page import MainPage
-from models.page_objects.results_page import ResultsPage
+from models.page_objects.main_page import MainPage, SEARCH_THROUGH_UI
+from models.page_objects.results_page import ResultsPage, RANKING_OBJECTIVES, HIGHEST_RATED, LOWEST_PRICED
 from models.page_objects.overview_page import OverviewPage
-from models.page_objects.reservation_page.reservation_page import ReservationPage
-from models.page_objects.reservation_page.reservation_page_factory import create_reservation_page
-from datetime import timedelta, date
-
-test_data = [
-    # Format:
-    # (<destination> , <start-date> , <end-date> , <adults-num> , <children-num> , <infants-num> , <pets-num> , <prefix w/o '+'> , <9-digit-phone-number>),
-    ("Tel Aviv-Yafo", date.today(), date.today() + timedelta(days=1), 2, 0, 0, 0, 93, 123456789),
-]
-
-@pytest.mark.parametrize("destination, start_date, end_date, adults, children, infants, pets, prefix, phone", test_data)
-def test_case_1(page: Page, destination : str, start_date : date, end_date : date, adults : int, children : int, infants : int, pets : int, prefix : int, phone : int):
+from models.page_objects.reservation_page.reservation_page_factory import (
+    RESERVATION_PAGE_VARIANTS,
+    create_reservation_page,
+    get_listing_id,
+)
+from models.utilities.page_state import DETAILS_CROSS_CHECK, DETAILS_FROM_STATE
+from models.utilities.round_trips import round_trip_budget
+from models.utilities.scenarios import Scenario, SharedSearchResults
+from tests.standin_site import StandinSite
+
+# The scenarios are loaded from the files in tests/scenarios (see conftest.py).
+
+def search_and_rank(page: Page, scenario: Scenario) -> dict[str, str]:
+    """
+    Runs a scenario's search through the search bar, validates it, and finds its highest-rated and lowest-priced results.
+    Since every test sharing the search relies on it, the search bar is covered whichever test runs it.
+    :return: A dictionary of [objective_name (str) : best result's url (str)].
+    """
+    destination, start_date, end_date, adults, children, infants, pets = scenario.search_key
+
     # Step 1: Open airbnb.com
     page.goto("https://www.airbnb.com/homes?locale=en")
     main_page = MainPage(page, page.url)
 
     # Step 2: Search the desired vacation details.
-    main_page.search_preferences(destination, start_date, end_date, adults, children, infants, pets)
-    page.wait_for_timeout(2000)
+    main_page.search_preferences(destination, start_date, end_date, adults, children, infants, pets, SEARCH_THROUGH_UI)
 
     # Step 3: Validate Search According To Preferences.
     results_page = ResultsPage(page, page.url)
     results_page.assert_preferences(destination, start_date, end_date, adults, children, infants, pets)
 
-    # Step 3: Find and print the highest-rated result.
-    results_page.extract_highest_rated_card(print_result=True)
-
-    # Step 4: Find and print the lowest-rated result.
-    results_page.extract_lowest_priced_card(print_result=True)
-
-@pytest.mark.parametrize("destination, start_date, end_date, adults, children, infants, pets, prefix, phone", test_data)
-def test_case_2(page: Page, destination : str, start_date : date, end_date : date, adults : int, children : int, infants : int, pets : int, prefix : int, phone : int):
-    # Step 1: Open airbnb.com
-    page.goto("https://www.airbnb.com/homes?locale=en")
-    main_page = MainPage(page, page.url)
+    # Reading a whole results page must stay a single Playwright call (one evaluation of all cards).
+    results_page.wait_for_cards()
+    with round_trip_budget(1, "Extracting one results page"):
+        results_page.get_card_containers()
 
-    # Step 2: Search the desired vacation details.
-    main_page.search_preferences(destination, start_date, end_date, adults, children, infants, pets)
-    # page.wait_for_timeout(2000)
+    # Step 4: Find and print the highest-rated and lowest-priced results in a single traversal.
+    return results_page.extract_best_cards(
+        {name: RANKING_OBJECTIVES[name] for name in (HIGHEST_RATED, LOWEST_PRICED)},
+        print_result=True
+    )
 
-    # Step 3: Validate Search According To Preferences.
-    results_page = ResultsPage(page, page.url)
-    results_page.assert_preferences(destination, start_date, end_date, adults, children, infants, pets)
+def test_case_1(page: Page, scenario: Scenario, shared_searches: SharedSearchResults):
+    # Steps 1-4: Search, validate the search and find the best results - once per distinct search.
+    best_result_urls = shared_searches.get(scenario.search_key, lambda: search_and_rank(page, scenario))
+    for name, url in best_result_urls.items():
+        print(f"{name}: {url}")
 
-    # Step 3: Find and print the highest-rated result.
-    best_result_url = results_page.extract_highest_rated_card(print_result=True)
+def test_case_2(page: Page, scenario: Scenario, shared_searches: SharedSearchResults):
+    # Steps 1-3: Search, validate the search and find the highest-rated result - once per distinct search,
+    # shared with test_case_1.
+    best_result_url = shared_searches.get(scenario.search_key, lambda: search_and_rank(page, scenario))[HIGHEST_RATED]
 
     # Step 4: Go to the best result's overview page:
     page.goto(best_result_url)
-    # page.wait_for_timeout(3000)
 
     # Step 5: Go over the reservation's overview page, save and print its details.
     overview_page = OverviewPage(page, page.url)
-    o_check_in_date, o_check_out_date, o_guests, o_price = overview_page.get_all_details()
-    overview_page.print_details()
+    o_check_in_date, o_check_out_date, o_guests, o_price = overview_page.get_all_details(DETAILS_FROM_STATE)
+    overview_page.print_details(DETAILS_FROM_STATE)
 
     # Step 6: Click the reserve button, validate reservation details, and enter a phone number.
     overview_page.click_reserve()
-    # page.wait_for_timeout(3000)
-    reservation_page = ReservationPage(page, page.url)
-    r_check_in_date, r_check_out_date, r_guests, r_price = reservation_page.get_all_details()
+    reservation_page = create_reservation_page(page, page.url)
+    r_check_in_date, r_check_out_date, r_guests, r_price = reservation_page.get_all_details(DETAILS_FROM_STATE)
 
     assert o_check_in_date   == r_check_in_date
     assert o_check_out_date  == r_check_out_date
@@ -71,20 +76,20 @@ def test_case_2(page: Page, destination : str, start_date : date, end_date : dat
     for key in o_guests:
         assert o_guests[key] == r_guests[key]
 
-    reservation_page.input_phone_number(prefix, phone)
+    reservation_page.input_phone_number(scenario.prefix, scenario.phone)
 
 def test_case_3(page: Page):
     page.goto("https://www.airbnb.com/rooms/699210620444564680?adults=2&check_in=2025-05-21&check_out=2025-05-23&guests=2&search_mode=regular_search&source_impression_id=p3_1747174043_P3ETn4ssilkqp1NU&previous_page_section_name=1000&federated_search_id=d1feb4dd-a84e-408e-a73d-b4e55cdce338&locale=en")
 
     # Step 5: Go over the reservation's overview page, save and print its details.
     overview_page = OverviewPage(page, page.url)
-    o_check_in_date, o_check_out_date, o_guests, o_price = overview_page.get_all_details()
-    overview_page.print_details()
+    o_check_in_date, o_check_out_date, o_guests, o_price = overview_page.get_all_details(DETAILS_FROM_STATE)
+    overview_page.print_details(DETAILS_FROM_STATE)
 
     # Step 6: Click the reserve button, validate reservation details, and enter a phone number.
     overview_page.click_reserve()
     reservation_page = create_reservation_page(page, page.url)
-    r_check_in_date, r_check_out_date, r_guests, r_price = reservation_page.get_all_details()
+    r_check_in_date, r_check_out_date, r_guests, r_price = reservation_page.get_all_details(DETAILS_FROM_STATE)
 
     assert o_check_in_date   == r_check_in_date
     assert o_check_out_date  == r_check_out_date
@@ -93,3 +98,49 @@ def test_case_3(page: Page):
         assert o_guests[key] == r_guests[key]
 
     reservation_page.input_phone_number(93, 123456789)
+
+# The stand-in tests run against the local stand-in site (see tests/standin_site.py), sized by the --standin-* options.
+
+@pytest.mark.live_results
+@pytest.mark.parametrize("from_payload", [False, True], ids=["cards", "payload"])
+def test_standin_results(page: Page, standin_site: StandinSite, from_payload: bool):
+    check_in_date, check_out_date = date.today() + timedelta(days=1), date.today() + timedelta(days=3)
+    objectives = {name: RANKING_OBJECTIVES[name] for name in (HIGHEST_RATED, LOWEST_PRICED)}
+
+    # Step 1: Search through the search bar, and validate the search.
+    page.goto(standin_site.main_url())
+    MainPage(page, page.url).search_preferences("Stand-in City", check_in_date, check_out_date, 2, 1)
+    results_page = ResultsPage(page, page.url)
+    results_page.assert_preferences("Stand-in City", check_in_date, check_out_date, 2, 1)
+
+    # Step 2: Traverse every results page, and compare the best results with the generated listings' best.
+    best_result_urls = results_page.extract_best_cards(objectives, print_result=False, from_payload=from_payload)
+    expected_listing_ids = standin_site.expected_best_listings(objectives)
+    for name, url in best_result_urls.items():
+        assert get_listing_id(url) == expected_listing_ids[name]
+    if not from_payload:
+        assert len(results_page.listings) == len(standin_site.listings)
+
+@pytest.mark.parametrize("variant", ["A", "B"])
+def test_standin_checkout(page: Page, standin_site: StandinSite, variant: str):
+    # Every test gets its own listing, since a listing's checkout variant is remembered for the whole session.
+    standin_site.configure(checkout_variant=variant)
+    listing = standin_site.listings["AB".index(variant)]
+    page.goto(standin_site.room_url(listing, date.today() + timedelta(days=1), date.today() + timedelta(days=4), 2, 1, 1))
+
+    # Step 1: Go over the overview page, checking its panels against its state.
+    overview_page = OverviewPage(page, page.url)
+    o_check_in_date, o_check_out_date, o_guests, o_price = overview_page.get_all_details(DETAILS_CROSS_CHECK)
+    assert o_price == listing.nightly_price * 3
+
+    # Step 2: Reserve, and validate the reservation page's variant and details.
+    overview_page.click_reserve()
+    reservation_page = create_reservation_page(page, page.url)
+    assert type(reservation_page) is RESERVATION_PAGE_VARIANTS[variant][0]
+    r_check_in_date, r_check_out_date, r_guests, r_price = reservation_page.get_all_details(DETAILS_CROSS_CHECK)
+
+    assert (o_check_in_date, o_check_out_date, o_price) == (r_check_in_date, r_check_out_date, r_price)
+    for key in o_guests:
+        assert o_guests[key] == r_guests[key]
+
+    reservation_page.input_phone_number(972, 123456789)